@@ -5,8 +5,9 @@ from os.path import abspath, dirname
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
-from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.model import BlockchainCursorModel, BlockchainTransactionModel
 from src.apps.disputes.model import DisputeModel
+from src.apps.ledger.model import LedgerEntryModel
 from src.apps.notifications.model import NotificationModel
 from src.apps.permissions.model import PermissionModel
 from src.apps.regex.model import RegexModel
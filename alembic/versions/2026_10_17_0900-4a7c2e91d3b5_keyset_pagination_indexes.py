@@ -0,0 +1,37 @@
+"""keyset pagination indexes
+
+Revision ID: 4a7c2e91d3b5
+Revises: f29082a0677f
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a7c2e91d3b5"
+down_revision: Union[str, None] = "f29082a0677f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "transactions_created_at_id_idx",
+        "transactions",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "notifications_created_at_id_idx",
+        "notifications",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("notifications_created_at_id_idx", table_name="notifications")
+    op.drop_index("transactions_created_at_id_idx", table_name="transactions")
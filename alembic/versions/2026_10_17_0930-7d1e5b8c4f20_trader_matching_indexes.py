@@ -0,0 +1,60 @@
+"""trader matching indexes
+
+Revision ID: 7d1e5b8c4f20
+Revises: 4a7c2e91d3b5
+Create Date: 2026-10-17 09:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d1e5b8c4f20"
+down_revision: Union[str, None] = "4a7c2e91d3b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "users_active_priority_idx",
+        "users",
+        [sa.text("priority DESC"), "id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "requisites_card_user_id_priority_idx",
+        "requisites",
+        ["user_id", sa.text("priority DESC")],
+        unique=False,
+        postgresql_where=sa.text("card_number IS NOT NULL"),
+    )
+    op.create_index(
+        "requisites_sbp_user_id_bank_name_priority_idx",
+        "requisites",
+        ["user_id", "bank_name", sa.text("priority DESC")],
+        unique=False,
+        postgresql_where=sa.text("phone_number IS NOT NULL AND bank_name IS NOT NULL"),
+    )
+    op.create_index(
+        "transactions_requisite_id_pending_idx",
+        "transactions",
+        ["requisite_id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("transactions_requisite_id_pending_idx", table_name="transactions")
+    op.drop_index(
+        "requisites_sbp_user_id_bank_name_priority_idx",
+        table_name="requisites",
+    )
+    op.drop_index("requisites_card_user_id_priority_idx", table_name="requisites")
+    op.drop_index("users_active_priority_idx", table_name="users")
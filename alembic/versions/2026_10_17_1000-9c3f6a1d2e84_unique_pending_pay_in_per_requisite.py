@@ -0,0 +1,36 @@
+"""unique pending pay in per requisite
+
+Revision ID: 9c3f6a1d2e84
+Revises: 7d1e5b8c4f20
+Create Date: 2026-10-17 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3f6a1d2e84"
+down_revision: Union[str, None] = "7d1e5b8c4f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "transactions_requisite_id_pending_pay_in_key",
+        "transactions",
+        ["requisite_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'PENDING' AND type = 'PAY_IN'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "transactions_requisite_id_pending_pay_in_key",
+        table_name="transactions",
+    )
@@ -0,0 +1,93 @@
+"""ledger entries
+
+Revision ID: b5e2d7a9c613
+Revises: 9c3f6a1d2e84
+Create Date: 2026-10-17 10:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e2d7a9c613"
+down_revision: Union[str, None] = "9c3f6a1d2e84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ledger_entries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("balance_delta", sa.Integer(), nullable=False),
+        sa.Column("amount_frozen_delta", sa.Integer(), nullable=False),
+        sa.Column(
+            "reason",
+            sa.Enum(
+                "OPENING",
+                "RESERVE",
+                "SETTLEMENT",
+                "EXPIRATION",
+                "DISPUTE",
+                "DEPOSIT",
+                "WITHDRAWAL",
+                name="ledgerentryreasonenum",
+            ),
+            nullable=False,
+        ),
+        sa.Column("transaction_id", sa.Integer(), nullable=True),
+        sa.Column("blockchain_transaction_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP AT TIME ZONE 'UTC')"),
+            nullable=False,
+        ),
+        sa.Column("folded_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("ledger_entries_user_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(
+            ["transaction_id"],
+            ["transactions.id"],
+            name=op.f("ledger_entries_transaction_id_fkey"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["blockchain_transaction_id"],
+            ["blockchain_transactions.id"],
+            name=op.f("ledger_entries_blockchain_transaction_id_fkey"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("ledger_entries_pkey")),
+    )
+    op.create_index(
+        "ledger_entries_user_id_unfolded_idx",
+        "ledger_entries",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("folded_at IS NULL"),
+    )
+
+    # Начальные записи, чтобы сумма журнала совпадала с текущими балансами
+    op.execute(
+        """
+        INSERT INTO ledger_entries
+            (user_id, balance_delta, amount_frozen_delta, reason, folded_at)
+        SELECT id, balance, amount_frozen, 'OPENING', now()
+        FROM users
+        WHERE balance <> 0 OR amount_frozen <> 0
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ledger_entries_user_id_unfolded_idx",
+        table_name="ledger_entries",
+    )
+    op.drop_table("ledger_entries")
+    sa.Enum(name="ledgerentryreasonenum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,54 @@
+"""blockchain cursors
+
+Revision ID: e3a8c5f1b702
+Revises: b5e2d7a9c613
+Create Date: 2026-10-17 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a8c5f1b702"
+down_revision: Union[str, None] = "b5e2d7a9c613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "blockchain_cursors",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("block_number", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_index(
+        "blockchain_transactions_pending_pay_in_idx",
+        "blockchain_transactions",
+        ["to_address", "amount"],
+        postgresql_where=sa.text("status = 'PENDING' AND type = 'PAY_IN'"),
+    )
+    op.create_index(
+        "blockchain_transactions_hash_key",
+        "blockchain_transactions",
+        ["hash"],
+        unique=True,
+        postgresql_where=sa.text("hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "blockchain_transactions_hash_key",
+        table_name="blockchain_transactions",
+    )
+    op.drop_index(
+        "blockchain_transactions_pending_pay_in_idx",
+        table_name="blockchain_transactions",
+    )
+    op.drop_table("blockchain_cursors")
@@ -0,0 +1,62 @@
+"""pay out broadcast queue
+
+Revision ID: a4d2f8b6c913
+Revises: e3a8c5f1b702
+Create Date: 2026-10-17 11:30:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d2f8b6c913"
+down_revision: Union[str, None] = "e3a8c5f1b702"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "blockchain_transactions",
+        sa.Column("approved_at", sa.TIMESTAMP(), nullable=True),
+    )
+    op.add_column(
+        "blockchain_transactions",
+        sa.Column(
+            "signed_transaction",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "blockchain_transactions",
+        sa.Column(
+            "broadcast_attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "blockchain_transactions_approved_pay_out_idx",
+        "blockchain_transactions",
+        ["id"],
+        postgresql_where=sa.text(
+            "status = 'PENDING' AND type = 'PAY_OUT' AND approved_at IS NOT NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "blockchain_transactions_approved_pay_out_idx",
+        table_name="blockchain_transactions",
+    )
+    op.drop_column("blockchain_transactions", "broadcast_attempts")
+    op.drop_column("blockchain_transactions", "signed_transaction")
+    op.drop_column("blockchain_transactions", "approved_at")
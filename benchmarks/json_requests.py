@@ -0,0 +1,134 @@
+"""
+Бенчмарк разбора JSON тела запроса на маршруте пополнения мерчантом.
+
+Сравнивает пропускную способность (запросов в секунду) маршрута
+`POST /merchant-clients/request-pay-in` с прежним `BaseHTTPMiddleware`,
+который отправлял разбор тела в пул потоков, и с `ORJSONRoute`.
+Обработчик сразу возвращает реквизиты без обращения к БД,
+поэтому замеряется только слой обработки запроса.
+`--paddings` увеличивает тело запроса, чтобы проверить разбор больших тел.
+
+Запуск:
+    python -m benchmarks.json_requests --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+import orjson
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.apps.merchants import schemas
+from src.apps.transactions.model import TransactionPaymentMethodEnum
+from src.core.routing import ORJSONRoute
+
+
+class ThreadpoolJSONMiddleware(BaseHTTPMiddleware):
+    """Прежний `ORJSONRequestMiddleware`."""
+
+    async def dispatch(self, request: Request, call_next):
+        async def custom_json():
+            body = await request.body()
+            return await run_in_threadpool(orjson.loads, body)
+
+        request.json = custom_json
+        return await call_next(request)
+
+
+def get_app(route_class: type[APIRoute], with_middleware: bool) -> FastAPI:
+    router = APIRouter(prefix="/merchant-clients", route_class=route_class)
+
+    @router.post("/request-pay-in")
+    async def request_pay_in_route(
+        body: schemas.MerchantPayInRequestSchema,
+    ) -> schemas.MerchantPayInResponseCardSchema:
+        return schemas.MerchantPayInResponseCardSchema(
+            recipent_full_name="bench",
+            card_number="0000000000000000",
+            bank_name=body.bank_name or "sber",
+        )
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+    if with_middleware:
+        app.add_middleware(ThreadpoolJSONMiddleware)
+    app.include_router(router)
+
+    return app
+
+
+async def measure(app: FastAPI, body: bytes, requests: int, concurrency: int) -> float:
+    """Отправить `requests` запросов по `concurrency` одновременно, в req/s."""
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send() -> None:
+            async with semaphore:
+                response = await client.post(
+                    "/merchant-clients/request-pay-in",
+                    content=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                assert response.status_code == 200, response.text
+
+        # Прогрев
+        await asyncio.gather(*(send() for _ in range(concurrency)))
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(send() for _ in range(requests)))
+
+        return requests / (time.perf_counter() - started_at)
+
+
+async def main(requests: int, concurrency: int, paddings: list[int]) -> None:
+    variants = {
+        "before": get_app(APIRoute, with_middleware=True),
+        "after": get_app(ORJSONRoute, with_middleware=False),
+    }
+
+    header = ["body, bytes", *(f"{name}, req/s" for name in variants), "speedup"]
+    print(" ".join(f"{column:>14}" for column in header))
+
+    for padding in paddings:
+        body = orjson.dumps(
+            {
+                "amount": 1000,
+                "payment_method": TransactionPaymentMethodEnum.CARD,
+                "bank_name": "sber",
+                "padding": "x" * padding,
+            }
+        )
+        results = [
+            await measure(app, body, requests, concurrency) for app in variants.values()
+        ]
+
+        print(
+            f"{len(body):>14} "
+            + " ".join(f"{result:>14.0f}" for result in results)
+            + f" {results[-1] / results[0]:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--paddings", default="0,100000")
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            paddings=[int(padding) for padding in args.paddings.split(",")],
+        )
+    )
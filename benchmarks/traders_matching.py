@@ -0,0 +1,175 @@
+"""
+Бенчмарк подбора трейдера и реквизитов (`TraderRepository.get_by_filters`).
+
+Наполняет БД трейдерами, реквизитами и транзакциями в процессе обработки
+и замеряет задержку подбора (p50/p95/p99) при росте количества трейдеров.
+Все данные создаются в одной транзакции, которая откатывается в конце,
+поэтому БД остается в исходном состоянии.
+
+Запуск:
+    python -m benchmarks.traders_matching --sizes 100,1000,10000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.requisites.model import RequisiteModel
+from src.apps.traders.repository import TraderRepository
+from src.apps.transactions.model import (
+    TransactionModel,
+    TransactionPaymentMethodEnum,
+    TransactionStatusEnum,
+    TransactionTypeEnum,
+)
+from src.apps.users.model import UserModel
+from src.apps.users_permissions.model import UsersPermissionsModel  # noqa: F401
+from src.core.database import SessionLocal, engine
+
+BANK_NAMES = ["sber", "tinkoff", "alfa", "vtb", "raif"]
+PENDING_SHARE = 0.3
+
+
+async def seed(
+    session: AsyncSession,
+    merchant_id: int,
+    start: int,
+    stop: int,
+    requisites_per_trader: int,
+) -> None:
+    """
+    Добавить трейдеров с номерами [start, stop) и их реквизиты.
+    Часть реквизитов занимается транзакциями в процессе обработки.
+    """
+
+    result = await session.execute(
+        insert(UserModel).returning(UserModel.id),
+        [
+            {
+                "email": f"bench-trader-{i}@example.com",
+                "hashed_password": "",
+                "balance": random.randint(0, 1_000_000),
+                "priority": random.randint(0, 10),
+                "is_active": random.random() < 0.8,
+            }
+            for i in range(start, stop)
+        ],
+    )
+    trader_ids = result.scalars().all()
+
+    requisites = []
+    for trader_id in trader_ids:
+        for _ in range(requisites_per_trader):
+            is_card = random.random() < 0.5
+            requisites.append(
+                {
+                    "user_id": trader_id,
+                    "priority": random.randint(0, 10),
+                    "full_name": "bench",
+                    "card_number": "0000000000000000" if is_card else None,
+                    "phone_number": None if is_card else "+70000000000",
+                    "bank_name": random.choice(BANK_NAMES),
+                    "min_amount": random.choice([None, 100]),
+                    "max_amount": random.choice([None, 100_000]),
+                }
+            )
+    result = await session.execute(
+        insert(RequisiteModel).returning(
+            RequisiteModel.id,
+            RequisiteModel.user_id,
+        ),
+        requisites,
+    )
+    requisite_rows = result.all()
+
+    await session.execute(
+        insert(TransactionModel),
+        [
+            {
+                "merchant_id": merchant_id,
+                "trader_id": trader_id,
+                "requisite_id": requisite_id,
+                "amount": 1000,
+                "payment_method": TransactionPaymentMethodEnum.CARD,
+                "type": TransactionTypeEnum.PAY_IN,
+                "status": TransactionStatusEnum.PENDING,
+            }
+            for requisite_id, trader_id in requisite_rows
+            if random.random() < PENDING_SHARE
+        ],
+    )
+
+    await session.execute(text("ANALYZE users, requisites, transactions"))
+
+
+async def measure(session: AsyncSession, iterations: int) -> list[float]:
+    """Выполнить подбор `iterations` раз со случайными параметрами, в мс."""
+
+    latencies = []
+    for _ in range(iterations):
+        payment_method = random.choice(list(TransactionPaymentMethodEnum))
+        started_at = time.perf_counter()
+        await TraderRepository.get_by_filters(
+            session=session,
+            payment_method=payment_method,
+            amount=random.randint(100, 50_000),
+            bank_name=random.choice([None, *BANK_NAMES]),
+        )
+        latencies.append((time.perf_counter() - started_at) * 1000)
+
+    return latencies
+
+
+async def main(sizes: list[int], requisites_per_trader: int, iterations: int) -> None:
+    async with SessionLocal() as session:
+        try:
+            merchant_id = (
+                await session.execute(
+                    insert(UserModel).returning(UserModel.id),
+                    {"email": "bench-merchant@example.com", "hashed_password": ""},
+                )
+            ).scalar_one()
+
+            header = ["traders", "requisites", "p50, ms", "p95, ms", "p99, ms"]
+            print(" ".join(f"{column:>12}" for column in header))
+
+            seeded = 0
+            for size in sorted(sizes):
+                await seed(session, merchant_id, seeded, size, requisites_per_trader)
+                seeded = size
+
+                # Прогрев кэша планов и соединения
+                await measure(session, 10)
+                latencies = await measure(session, iterations)
+                quantiles = statistics.quantiles(latencies, n=100)
+
+                print(
+                    f"{size:>12} {size * requisites_per_trader:>12} "
+                    f"{quantiles[49]:>12.2f} {quantiles[94]:>12.2f} "
+                    f"{quantiles[98]:>12.2f}"
+                )
+        finally:
+            await session.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--requisites-per-trader", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            sizes=[int(size) for size in args.sizes.split(",")],
+            requisites_per_trader=args.requisites_per_trader,
+            iterations=args.iterations,
+        )
+    )
@@ -0,0 +1,61 @@
+"""
+Бенчмарк получения балансов кошельков (`TronService.get_wallets_balances`).
+
+Поднимает локальный JSON-RPC сервер с задержкой ответа, имитирующей сеть,
+и сравнивает количество HTTP запросов и время получения балансов
+при разных размерах пакета (`TRON_JRPC_BATCH_SIZE`).
+Размер пакета 1 соответствует одному запросу на кошелек.
+
+Запуск:
+    python -m benchmarks.tron_balances --wallets 500 --batch-sizes 1,50,100,500
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.apps.blockchain.services.tron_service import TronService
+from src.core import constants
+from src.core.settings import settings
+from src.libs.services.http_client_service import HTTPClientService
+from tests.fake_tron_rpc import FakeTronRPCServer
+
+
+async def main(wallets: int, batch_sizes: list[int], latency: float) -> None:
+    addresses = [f"T{i:041d}" for i in range(wallets)]
+    balances = {address: i for i, address in enumerate(addresses)}
+
+    async with FakeTronRPCServer(balances=balances, latency=latency) as server:
+        constants.TRON_JRPC_API_URL = server.url
+
+        header = ["batch size", "requests", "total, ms"]
+        print(" ".join(f"{column:>12}" for column in header))
+
+        for batch_size in batch_sizes:
+            settings.TRON_JRPC_BATCH_SIZE = batch_size
+            server.requests_count = 0
+
+            started_at = time.perf_counter()
+            result = await TronService.get_wallets_balances(addresses)
+            elapsed = (time.perf_counter() - started_at) * 1000
+            assert result == balances
+
+            print(f"{batch_size:>12} {server.requests_count:>12} {elapsed:>12.1f}")
+
+        await HTTPClientService.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--wallets", type=int, default=500)
+    parser.add_argument("--batch-sizes", default="1,50,100,500")
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            wallets=args.wallets,
+            batch_sizes=[int(size) for size in args.batch_sizes.split(",")],
+            latency=args.latency,
+        )
+    )
@@ -0,0 +1,93 @@
+"""
+Бенчмарк подписи транзакций (`TronService.sign_transactions`).
+
+Подписывает пачку транзакций тремя способами и измеряет общее время
+и максимальную задержку event loop, которую видит параллельная корутина:
+- в event loop без кэша ключей (как до выноса подписи в пул);
+- в event loop с кэшем ключей;
+- пачкой в пуле потоков с кэшем ключей.
+
+Запуск:
+    python -m benchmarks.tron_signing --transactions 2000 --wallets 10
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import time
+
+from tronpy.keys import PrivateKey
+
+from src.apps.blockchain.services.tron_service import TronService
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.001) -> float:
+    max_lag = 0.0
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - started_at - interval)
+
+    return max_lag
+
+
+def sign_without_cache(transaction: dict, private_key: str) -> dict:
+    msg_hash = hashlib.sha256(bytes.fromhex(transaction["raw_data_hex"])).digest()
+    signature = PrivateKey(bytes.fromhex(private_key)).sign_msg_hash(msg_hash)
+    transaction["signature"] = [signature.hex()]
+
+    return transaction
+
+
+async def run(name: str, sign) -> None:
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(0.01)
+
+    started_at = time.perf_counter()
+    await sign()
+    elapsed = (time.perf_counter() - started_at) * 1000
+
+    stop.set()
+    max_lag = await lag_task * 1000
+
+    print(f"{name:>24} {elapsed:>12.1f} {max_lag:>16.1f}")
+
+
+async def main(transactions_count: int, wallets_count: int) -> None:
+    private_keys = [os.urandom(32).hex() for _ in range(wallets_count)]
+
+    def make_transactions() -> list[tuple[dict, str]]:
+        return [
+            ({"raw_data_hex": os.urandom(200).hex()}, private_keys[i % wallets_count])
+            for i in range(transactions_count)
+        ]
+
+    print(f"{'mode':>24} {'total, ms':>12} {'max loop lag, ms':>16}")
+
+    async def inline_without_cache() -> None:
+        for transaction, private_key in make_transactions():
+            sign_without_cache(transaction, private_key)
+
+    async def inline_with_cache() -> None:
+        for transaction, private_key in make_transactions():
+            TronService.sign_transaction(transaction, private_key)
+
+    async def pool_with_cache() -> None:
+        await TronService.sign_transactions(make_transactions())
+
+    await run("event loop, no cache", inline_without_cache)
+    await run("event loop, cache", inline_with_cache)
+    await run("thread pool, cache", pool_with_cache)
+
+    TronService.shutdown_sign_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--wallets", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(transactions_count=args.transactions, wallets_count=args.wallets))
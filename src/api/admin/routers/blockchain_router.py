@@ -6,10 +6,12 @@ from src.apps.blockchain.services.transaction_service import (
     BlockchainTransactionService,
 )
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/blockchain-transactions",
     tags=["Транзакции блокчейна"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -4,8 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.disputes import schemas
 from src.apps.disputes.service import DisputeService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/disputes", tags=["Диспуты"])
+router = APIRouter(prefix="/disputes", tags=["Диспуты"], route_class=ORJSONRoute)
 
 
 # MARK: Get
@@ -6,8 +6,13 @@ from src.apps.notifications.service import NotificationService
 from src.core import dependencies
 from src.core.constants import PermissionEnum
 from src.core.dependencies import get_session
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/notifications", tags=["Уведомления"])
+router = APIRouter(
+    prefix="/notifications",
+    tags=["Уведомления"],
+    route_class=ORJSONRoute,
+)
 
 
 # MARK: Post
@@ -4,8 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.permissions import schemas
 from src.apps.permissions.service import PermissionService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/permissions", tags=["Разрешения"])
+router = APIRouter(prefix="/permissions", tags=["Разрешения"], route_class=ORJSONRoute)
 
 
 # MARK: Post
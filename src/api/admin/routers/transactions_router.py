@@ -4,10 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.transactions import schemas
 from src.apps.transactions.service import TransactionService
 from src.core import dependencies
-from src.core.constants import PermissionEnum
+from src.core.constants import CountStrategyEnum, PermissionEnum
 from src.core.dependencies import get_session
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/transactions", tags=["Транзакции"])
+router = APIRouter(prefix="/transactions", tags=["Транзакции"], route_class=ORJSONRoute)
 
 
 # MARK: Post
@@ -75,11 +76,14 @@ async def get_transactions_route(
     """
     Получить все реквизиты.
 
+    Общее количество оценивается планировщиком БД и может быть приблизительным.
+
     Требуется разрешение: `получить транзакции`.
     """
     return await TransactionService.get_all(
         session=session,
         query_params=query_params,
+        count_strategy=CountStrategyEnum.ESTIMATED,
     )
 
 
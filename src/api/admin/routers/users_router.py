@@ -4,10 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.users.schemas import user_schemas
 from src.apps.users.service import UserService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/users",
     tags=["Пользователи"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -4,8 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.wallets import schemas
 from src.apps.wallets.service import WalletService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/wallets", tags=["Кошельки"])
+router = APIRouter(prefix="/wallets", tags=["Кошельки"], route_class=ORJSONRoute)
 
 
 # MARK: Post
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
@@ -6,9 +9,42 @@ from src.api.common.routers.auth_router import router as auth_router
 from src.api.common.routers.health_check_router import router as health_check_router
 from src.api.common.routers.s3_router import router as s3_router
 from src.api.common.routers.users_router import router as users_router
-from src.core import constants, handlers, middlewares
+from src.apps.traders.requisite_index import RequisiteIndexService
+from src.core import constants, handlers
+from src.core.database import engine
 from src.core.logger import setup_logging
 from src.core.settings import settings
+from src.libs.services.http_client_service import HTTPClientService
+from src.libs.services.redis_service import RedisService
+from src.libs.services.s3_service import S3Service
+
+
+@asynccontextmanager
+async def lifespan(api: FastAPI):
+    """
+    Жизненный цикл приложения: общий HTTP клиент, проверка бакета S3,
+    подписка на события индекса реквизитов
+    и освобождение ресурсов при остановке.
+    """
+
+    await HTTPClientService.start()
+    await S3Service.start()
+
+    index_listener = None
+    if settings.REQUISITE_INDEX_ENABLED:
+        index_listener = asyncio.create_task(RequisiteIndexService.listen())
+
+    yield
+
+    if index_listener:
+        index_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await index_listener
+
+    await HTTPClientService.close()
+    await S3Service.close()
+    await RedisService.close()
+    await engine.dispose()
 
 
 def setup_middlewares(api: FastAPI):
@@ -19,7 +55,6 @@ def setup_middlewares(api: FastAPI):
         allow_methods=constants.CORS_METHODS,
         allow_headers=constants.CORS_HEADERS,
     )
-    api.add_middleware(middlewares.ORJSONRequestMiddleware)
 
 
 def setup_exception_handlers(api: FastAPI):
@@ -43,6 +78,7 @@ def get_api(title: str) -> FastAPI:
         version=settings.APP_VERSION,
         default_response_class=ORJSONResponse,
         redoc_url=None,
+        lifespan=lifespan,
     )
 
     setup_logging()
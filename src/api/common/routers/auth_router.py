@@ -6,8 +6,9 @@ from src.apps.auth.services.auth_service import AuthService
 from src.apps.auth.services.jwt_service import JWTService
 from src.apps.users.schemas import user_schemas
 from src.core import dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/auth", tags=["Авторизация"])
+router = APIRouter(prefix="/auth", tags=["Авторизация"], route_class=ORJSONRoute)
 
 
 # MARK: Patch
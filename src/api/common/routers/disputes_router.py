@@ -5,8 +5,9 @@ from src.apps.disputes import schemas
 from src.apps.disputes.service import DisputeService
 from src.apps.users.model import UserModel
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/disputes", tags=["Диспуты"])
+router = APIRouter(prefix="/disputes", tags=["Диспуты"], route_class=ORJSONRoute)
 
 
 # MARK: Post
@@ -1,8 +1,19 @@
 from fastapi import APIRouter, status
 
-from src.apps.healthcheck.schemas import HealthCheckSchema
+from src.apps.healthcheck.schemas import (
+    DatabasePoolStatsSchema,
+    HealthCheckSchema,
+    RedisStatsSchema,
+)
+from src.core.database import DatabasePoolMetrics, engine
+from src.core.routing import ORJSONRoute
+from src.libs.services.redis_service import RedisService
 
-router = APIRouter(prefix="/health_check", tags=["Проверка состояния работы API"])
+router = APIRouter(
+    prefix="/health_check",
+    tags=["Проверка состояния работы API"],
+    route_class=ORJSONRoute,
+)
 
 
 @router.get(
@@ -14,3 +25,31 @@ async def health_check_route() -> HealthCheckSchema:
     """Проверить состояние работы API."""
 
     return HealthCheckSchema()
+
+
+@router.get(
+    path="/db-pool",
+    summary="Получить состояние пула соединений с БД",
+    status_code=status.HTTP_200_OK,
+)
+async def db_pool_stats_route() -> DatabasePoolStatsSchema:
+    """Получить состояние пула соединений с БД текущего процесса."""
+
+    return DatabasePoolStatsSchema(**DatabasePoolMetrics.get_stats(engine))
+
+
+@router.get(
+    path="/redis",
+    summary="Получить состояние Redis",
+    status_code=status.HTTP_200_OK,
+)
+async def redis_stats_route() -> RedisStatsSchema:
+    """Получить время ответа Redis и состояние пула соединений текущего процесса."""
+
+    ping_seconds = await RedisService.ping()
+
+    return RedisStatsSchema(
+        is_available=ping_seconds is not None,
+        ping_seconds=ping_seconds,
+        **RedisService.get_stats(),
+    )
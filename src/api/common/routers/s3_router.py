@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
 
+from src.apps.files import schemas
+from src.apps.users.model import UserModel
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 from src.libs.services.s3_service import S3Service
 
-router = APIRouter(prefix="/s3", tags=["S3"])
+router = APIRouter(prefix="/s3", tags=["S3"], route_class=ORJSONRoute)
 
 
 @router.post(
@@ -18,18 +21,23 @@ router = APIRouter(prefix="/s3", tags=["S3"])
 )
 async def upload_files_route(
     files: list[UploadFile] = File(...),
+    prefix: str | None = Form(default=None, pattern=constants.S3_PREFIX_PATTERN),
+    user: UserModel = Depends(dependencies.get_current_user),
 ) -> dict[str, list[str]]:
     """
-    Загрузка файлов в S3.
+    Загрузка файлов в S3 в каталог текущего пользователя.
+    Необязательный `prefix` добавляется к ключам файлов, например `disputes/1`.
 
     Требуется разрешение: `создать файл`.
     """
-    return {"file_urls": await S3Service.upload_bulk(files)}
+    return {
+        "file_urls": await S3Service.upload_bulk(files, user_id=user.id, prefix=prefix)
+    }
 
 
 @router.get(
     "",
-    summary="Получить список всех файлов в S3.",
+    summary="Получить страницу файлов в S3.",
     status_code=status.HTTP_200_OK,
     dependencies=[
         Depends(
@@ -37,10 +45,21 @@ async def upload_files_route(
         ),
     ],
 )
-async def get_all_files_route() -> dict[str, list[str]]:
+async def get_files_route(
+    query_params: schemas.FileListQuerySchema = Query(),
+) -> schemas.FileListSchema:
     """
-    Получение списка всех файлов в S3.
+    Получение страницы файлов в S3 с фильтрацией по префиксу.
+    Для следующей страницы передайте `continuation_token` из ответа.
 
     Требуется разрешение: `получить файл`.
     """
-    return {"file_urls": await S3Service.get_all()}
+    file_urls, next_continuation_token = await S3Service.get_page(
+        prefix=query_params.prefix,
+        limit=query_params.limit,
+        continuation_token=query_params.continuation_token,
+    )
+    return schemas.FileListSchema(
+        file_urls=file_urls,
+        next_continuation_token=next_continuation_token,
+    )
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.users.model import UserModel
-from src.apps.users.schemas import user_schemas
+from src.apps.users.service import UserService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/users",
     tags=["Пользователи"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -22,6 +25,7 @@ router = APIRouter(
     ],
 )
 async def get_current_user_route(
+    session: AsyncSession = Depends(dependencies.get_session),
     user: UserModel = Depends(dependencies.get_current_user),
 ):
     """
@@ -29,4 +33,4 @@ async def get_current_user_route(
 
     Требуется разрешение: `получить своего пользователя`.
     """
-    return user_schemas.UserGetSchema.model_validate(user)
+    return await UserService.get_by_id(session, user.id)
@@ -5,10 +5,12 @@ from src.apps.merchants import schemas
 from src.apps.merchants.service import MerchantService
 from src.apps.users.model import UserModel
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/merchant-clients",
     tags=["Клиенты мерчантов"],
+    route_class=ORJSONRoute,
 )
 
 
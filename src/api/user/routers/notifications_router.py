@@ -6,10 +6,12 @@ from src.apps.notifications.repository import NotificationRepository
 from src.apps.notifications.service import NotificationService
 from src.apps.users.model import UserModel
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/notifications",
     tags=["Уведомления"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -4,8 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.regex import schemas
 from src.apps.regex.service import RegexService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/regex", tags=["Регулярные выражения"])
+router = APIRouter(
+    prefix="/regex",
+    tags=["Регулярные выражения"],
+    route_class=ORJSONRoute,
+)
 
 
 @router.get(
@@ -7,8 +7,9 @@ from src.apps.users.model import UserModel
 from src.core import dependencies
 from src.core.constants import PermissionEnum
 from src.core.dependencies import get_session
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/requisites", tags=["Реквизиты"])
+router = APIRouter(prefix="/requisites", tags=["Реквизиты"], route_class=ORJSONRoute)
 
 
 # MARK: Post
@@ -5,10 +5,12 @@ from src.apps.users.model import UserModel
 from src.apps.users.schemas import pay_schemas
 from src.apps.users.service import UserService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/users",
     tags=["Пользователи"],
+    route_class=ORJSONRoute,
 )
 
 
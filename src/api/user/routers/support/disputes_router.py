@@ -4,8 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.disputes import schemas
 from src.apps.disputes.service import DisputeService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
-router = APIRouter(prefix="/support/disputes", tags=["Диспуты для суппорта"])
+router = APIRouter(
+    prefix="/support/disputes",
+    tags=["Диспуты для суппорта"],
+    route_class=ORJSONRoute,
+)
 
 
 # MARK: Get
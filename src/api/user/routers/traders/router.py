@@ -5,10 +5,12 @@ from src.apps.traders.service import TraderService
 from src.apps.users.model import UserModel
 from src.apps.users.service import UserService
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/traders",
     tags=["Трейдер"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -5,10 +5,12 @@ from src.apps.transactions import schemas
 from src.apps.transactions.service import TransactionService
 from src.apps.users.model import UserModel
 from src.core import constants, dependencies
+from src.core.routing import ORJSONRoute
 
 router = APIRouter(
     prefix="/transactions",
     tags=["Транзакции"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -58,6 +60,9 @@ async def get_transactions_route(
     """
     Получить транзакции с фильтрацией и пагинацией.
 
+    Общее количество не считается, наличие следующей страницы
+    возвращается в поле `has_more`.
+
     Требуется разрешение: `получить свою транзакцию`.
     """
     return await TransactionService.get_all(
@@ -66,4 +71,5 @@ async def get_transactions_route(
             user_id=user.id,
             **query_params.model_dump(),
         ),
+        count_strategy=constants.CountStrategyEnum.NONE,
     )
@@ -54,3 +54,39 @@ class InvalidTokenException(HTTPException):
             status_code=status_code,
             detail=data,
         )
+
+
+class TokenRevokedException(HTTPException):
+    def __init__(
+        self,
+        code: int = 2004,
+        message: str = "Токен отозван, обновите токены.",
+        status_code: int = status.HTTP_401_UNAUTHORIZED,
+    ):
+        data = {
+            "code": code,
+            "message": message,
+        }
+
+        super().__init__(
+            status_code=status_code,
+            detail=data,
+        )
+
+
+class TokenRevokeFailedException(HTTPException):
+    def __init__(
+        self,
+        code: int = 2005,
+        message: str = "Не удалось отозвать токены, повторите запрос.",
+        status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE,
+    ):
+        data = {
+            "code": code,
+            "message": message,
+        }
+
+        super().__init__(
+            status_code=status_code,
+            detail=data,
+        )
@@ -18,6 +18,19 @@ class JWTGetSchema(JWTRefreshSchema):
     token_type: str = "Bearer"
 
 
+class AccessTokenClaimsSchema(BaseModel):
+    """
+    Pydantic схема claims access токена.
+
+    Разрешения, активность и версия заполняются при `JWT_CLAIMS_ENABLED`.
+    """
+
+    id: int
+    permissions: list[str] | None = None
+    is_active: bool | None = None
+    version: int | None = None
+
+
 # MARK: 2FA
 class TwoFactorCodeCheckSchema(BaseModel):
     """Pydantic схема для получения кода 2FA."""
@@ -1,4 +1,3 @@
-import orjson
 from fastapi import BackgroundTasks
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -43,22 +42,16 @@ class AuthService:
 
         logger.info("Отправка кода 2FA для пользователя: {}", user.email)
 
-        redis_key_hash = HashService.generate(f"2fa_code:{user.id}")
-        # Если в Redis есть ключ, то письмо уже отправлено
-        if await RedisService.get(redis_key_hash):
-            return {"message": "Письмо с кодом подтверждения уже отправлено на почту."}
-
-        # Сгенерировать код и сохранить его хэш в Redis
+        # Сохранить хэш кода в Redis, если письмо еще не отправлено
         code = RandomService.generate_str()
-        code_hash = HashService.generate(code)
-        await RedisService.set(
-            redis_key_hash,
-            str(
-                orjson.dumps(
-                    auth_schemas.Redis2FAValueSchema(code_hash=code_hash).model_dump()
-                )
-            ),
+        is_code_created = await RedisService.set_hash(
+            HashService.generate(constants.TWO_FACTOR_CODE_KEY.format(user_id=user.id)),
+            auth_schemas.Redis2FAValueSchema(
+                code_hash=HashService.generate(code)
+            ).model_dump(),
         )
+        if not is_code_created:
+            return {"message": "Письмо с кодом подтверждения уже отправлено на почту."}
 
         # Добавить отправку письма в фоновую задачу
         background_tasks.add_task(
@@ -93,30 +86,26 @@ class AuthService:
             code,
         )
 
-        redis_key_hash = HashService.generate(f"2fa_code:{user.id}")
-        raw_redis_value = await RedisService.get(redis_key_hash)
+        # Получить код и сразу учесть попытку ввода одной атомарной операцией,
+        # чтобы параллельные запросы не обходили ограничение попыток
+        redis_key_hash = HashService.generate(
+            constants.TWO_FACTOR_CODE_KEY.format(user_id=user.id)
+        )
+        raw_redis_value = await RedisService.get_and_incr_hash(redis_key_hash, "tries")
 
         if not raw_redis_value:
             raise exceptions.BadRequestException(
                 "Нет действующих кодов подтверждения, отправьте новый код."
             )
 
-        redis_value_schema = auth_schemas.Redis2FAValueSchema(
-            **orjson.loads(raw_redis_value)
-        )
+        redis_value_schema = auth_schemas.Redis2FAValueSchema(**raw_redis_value)
         # Проверить количество попыток ввода кода
         if redis_value_schema.tries >= constants.TWO_FACTOR_MAX_CODE_TRIES:
             raise exceptions.BadRequestException(
                 "Превышено количество попыток ввода кода."
             )
 
-        # Если код неверный, увеличить количество попыток и вернуть ошибку
         if HashService.generate(code) != redis_value_schema.code_hash:
-            redis_value_schema.tries += 1
-            await RedisService.set(
-                redis_key_hash,
-                str(orjson.dumps(redis_value_schema.model_dump())),
-            )
             raise exceptions.BadRequestException("Неверный код.")
 
         # Удалить код из Redis
@@ -166,7 +155,7 @@ class AuthService:
             return await cls._send_2fa_code(user, background_tasks)
 
         # Создание токенов
-        tokens = await JWTService.create_tokens(user_id=user.id)
+        tokens = await JWTService.create_user_tokens(session=session, user=user)
 
         return tokens
 
@@ -211,7 +200,7 @@ class AuthService:
         await cls._check_and_delete_2fa_code(code_schema.code, user)
 
         # Создание токенов
-        tokens = await JWTService.create_tokens(user_id=user.id)
+        tokens = await JWTService.create_user_tokens(session=session, user=user)
 
         return tokens
 
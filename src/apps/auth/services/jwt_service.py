@@ -2,11 +2,16 @@ from datetime import datetime, timedelta, timezone
 from typing import Literal
 
 import jwt
+from loguru import logger
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.auth import exceptions as auth_exceptions
 from src.apps.auth import schemas
+from src.apps.auth.services.token_version_service import TokenVersionService
+from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
+from src.apps.users_permissions.repository import UsersPermissionsRepository
 from src.core import constants, exceptions
 from src.core.settings import settings
 
@@ -51,12 +56,77 @@ class JWTService:
             else:
                 raise auth_exceptions.InvalidTokenException()
 
+    @classmethod
+    def decode_access_token(cls, access_token: str) -> schemas.AccessTokenClaimsSchema:
+        """
+        Декодировать access_token.
+
+        Args:
+            access_token (str): access_token без префикса `Bearer `.
+
+        Returns:
+            AccessTokenClaimsSchema: Claims токена.
+
+        Raises:
+            InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
+            TokenExpiredException: Время действия токена истекло
+                `HTTP_401_UNAUTHORIZED`.
+        """
+
+        try:
+            payload = jwt.decode(
+                jwt=access_token,
+                key=settings.JWT_ACCESS_SECRET,
+                algorithms=[constants.ALGORITHM],
+            )
+            if not payload.get("id"):
+                raise auth_exceptions.InvalidTokenException()
+
+            return schemas.AccessTokenClaimsSchema(**payload)
+
+        except Exception as e:
+            if isinstance(e, jwt.ExpiredSignatureError):
+                raise auth_exceptions.TokenExpiredException()
+            else:
+                raise auth_exceptions.InvalidTokenException()
+
+    @classmethod
+    async def get_permissions_from_claims(
+        cls,
+        claims: schemas.AccessTokenClaimsSchema,
+    ) -> set[str] | None:
+        """
+        Получить разрешения из claims токена без обращения к БД.
+
+        Args:
+            claims (AccessTokenClaimsSchema): Claims токена.
+
+        Returns:
+            set[str] | None: Разрешения или `None`, если токен выдан без claims
+                или версию не удалось проверить.
+
+        Raises:
+            TokenRevokedException: Токен отозван `HTTP_401_UNAUTHORIZED`.
+        """
+
+        if claims.permissions is None or claims.version is None:
+            return None
+
+        is_current = await TokenVersionService.check(claims.id, claims.version)
+        if is_current is None:
+            return None
+        if not is_current:
+            raise auth_exceptions.TokenRevokedException()
+
+        return set(claims.permissions)
+
     # MARK: Create
     @classmethod
     async def _create_token(
         cls,
         user_id: int,
         token_type: Literal["access_token", "refresh_token"],
+        claims: schemas.AccessTokenClaimsSchema | None = None,
     ) -> tuple[str, datetime]:
         """
         Создать access_token или refresh_token для пользователя.
@@ -65,6 +135,7 @@ class JWTService:
             user_id(int): id пользователя.
             token_type(Literal["access_token", "refresh_token"]):
                 access_token или refresh_token.
+            claims(AccessTokenClaimsSchema | None): Дополнительные claims токена.
 
         Returns:
             (token, expires_at): токен в формате `Bearer <token>` и время его истечения.
@@ -79,8 +150,11 @@ class JWTService:
 
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=expires_delta)
 
+        payload = claims.model_dump(exclude_none=True) if claims else {}
+
         encoded_jwt = jwt.encode(
             payload={
+                **payload,
                 "id": user_id,
                 "exp": expires_at,
             },
@@ -91,12 +165,17 @@ class JWTService:
         return f"Bearer {encoded_jwt}", expires_at
 
     @classmethod
-    async def create_tokens(cls, user_id: int) -> schemas.JWTGetSchema:
+    async def create_tokens(
+        cls,
+        user_id: int,
+        claims: schemas.AccessTokenClaimsSchema | None = None,
+    ) -> schemas.JWTGetSchema:
         """
         Метод для создания access и refresh токенов.
 
         Args:
             user_id (int): id пользователя.
+            claims (AccessTokenClaimsSchema | None): Claims access токена.
 
         Returns:
             schemas.JWTGetSchema: Схема с access и refresh токенами.
@@ -105,6 +184,7 @@ class JWTService:
         access_token, expires_at = await cls._create_token(
             user_id=user_id,
             token_type="access_token",
+            claims=claims,
         )
         refresh_token, _ = await cls._create_token(
             user_id=user_id,
@@ -117,6 +197,51 @@ class JWTService:
             expires_at=expires_at,
         )
 
+    @classmethod
+    async def create_user_tokens(
+        cls,
+        session: AsyncSession,
+        user: UserModel,
+    ) -> schemas.JWTGetSchema:
+        """
+        Метод для создания токенов пользователя.
+        При `JWT_CLAIMS_ENABLED` в access токен добавляются разрешения,
+        активность и версия пользователя.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            user (UserModel): Пользователь.
+
+        Returns:
+            schemas.JWTGetSchema: Схема с access и refresh токенами.
+        """
+
+        if not settings.JWT_CLAIMS_ENABLED:
+            return await cls.create_tokens(user_id=user.id)
+
+        # Версия читается до разрешений: если разрешения изменятся
+        # между чтениями, токен получит устаревшую версию и будет отозван
+        try:
+            version = await TokenVersionService.get(user.id)
+        except RedisError as e:
+            logger.warning("Не удалось получить версию токена: {}", e)
+            return await cls.create_tokens(user_id=user.id)
+
+        permissions = await UsersPermissionsRepository.get_permission_names(
+            session=session,
+            user_id=user.id,
+        )
+
+        return await cls.create_tokens(
+            user_id=user.id,
+            claims=schemas.AccessTokenClaimsSchema(
+                id=user.id,
+                permissions=sorted(permissions),
+                is_active=user.is_active,
+                version=version,
+            ),
+        )
+
     # MARK: Refresh
     @classmethod
     async def refresh_tokens(
@@ -145,11 +270,11 @@ class JWTService:
 
         user_id = await cls._decode_refresh_token(refresh_token=refresh_token)
 
-        user_db = await UserRepository.get_one_or_none(
+        user_db = await UserRepository.get_by_id(
             session=session,
             id=user_id,
         )
         if user_db is None:
             raise exceptions.NotFoundException()
 
-        return await cls.create_tokens(user_id=user_id)
+        return await cls.create_user_tokens(session=session, user=user_db)
@@ -0,0 +1,110 @@
+import asyncio
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from src.apps.auth import exceptions as auth_exceptions
+from src.core import constants
+from src.core.settings import settings
+from src.libs.services.redis_service import RedisService
+
+
+class TokenVersionService:
+    """
+    Версии access токенов пользователей для отзыва токенов с claims.
+
+    Версия хранится в Redis по ключу `USER_TOKEN_VERSION_KEY`,
+    отсутствующий ключ означает версию 0.
+    Увеличение версии отзывает все выданные ранее access токены пользователя.
+    Время жизни ключа продлевается при каждой выдаче токена,
+    поэтому ключ не истекает раньше выданных с его версией токенов.
+    """
+
+    _expire = settings.JWT_ACCESS_EXPIRE_MINUTES * 60
+
+    @staticmethod
+    def _get_key(user_id: int) -> str:
+        return constants.USER_TOKEN_VERSION_KEY.format(user_id=user_id)
+
+    # MARK: Get
+    @classmethod
+    async def get(cls, user_id: int) -> int:
+        """
+        Получить версию для выдачи нового токена.
+
+        Args:
+            user_id (int): ID пользователя.
+
+        Returns:
+            int: Текущая версия.
+        """
+
+        version = await RedisService.get_and_expire(
+            cls._get_key(user_id),
+            expire=cls._expire,
+        )
+
+        return int(version or 0)
+
+    @classmethod
+    async def check(cls, user_id: int, version: int) -> bool | None:
+        """
+        Проверить, что версия токена текущая.
+
+        Args:
+            user_id (int): ID пользователя.
+            version (int): Версия из токена.
+
+        Returns:
+            bool | None: Текущая ли версия или `None`, если Redis недоступен.
+        """
+
+        try:
+            current_version = await RedisService.get(cls._get_key(user_id))
+        except RedisError as e:
+            logger.warning("Не удалось проверить версию токена: {}", e)
+            return None
+
+        return int(current_version or 0) == version
+
+    # MARK: Revoke
+    @classmethod
+    async def revoke(cls, user_ids: list[int]) -> None:
+        """
+        Отозвать access токены пользователей, увеличив их версии.
+
+        При ошибке Redis запрос повторяется, а если отозвать токены
+        так и не удалось, изменяющий запрос завершается ошибкой,
+        чтобы токены со старыми claims не продолжали действовать.
+        Повторное увеличение версии безопасно: оно только отзывает токены.
+
+        Args:
+            user_ids (list[int]): ID пользователей.
+
+        Raises:
+            TokenRevokeFailedException: Redis недоступен
+                `HTTP_503_SERVICE_UNAVAILABLE`.
+        """
+
+        delay = constants.USER_TOKEN_REVOKE_RETRY_DELAY
+        for attempt in range(constants.USER_TOKEN_REVOKE_MAX_RETRIES):
+            try:
+                await RedisService.incr_many(
+                    [cls._get_key(user_id) for user_id in user_ids],
+                    expire=cls._expire,
+                )
+                return
+            except RedisError as e:
+                logger.warning(
+                    "Не удалось отозвать токены пользователей {} ({}): {}",
+                    user_ids,
+                    attempt + 1,
+                    e,
+                )
+
+            if attempt + 1 < constants.USER_TOKEN_REVOKE_MAX_RETRIES:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        logger.error("Токены пользователей {} не отозваны", user_ids)
+        raise auth_exceptions.TokenRevokeFailedException()
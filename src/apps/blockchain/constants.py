@@ -10,3 +10,5 @@ ALREADY_EXISTS_EXCEPTION_MESSAGE, ALREADY_EXISTS_EXCEPTION_CODE = (
     "Блокчейн транзакция уже существует.",
     3003,
 )
+
+DEPOSIT_WATCHER_CURSOR_NAME: str = "deposits"
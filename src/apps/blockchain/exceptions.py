@@ -67,6 +67,10 @@ class GetTronTransactionException(HTTPException):
         )
 
 
+class TronTransactionNotFoundException(GetTronTransactionException):
+    """Транзакции нет в сети: RPC успешно ответил `result: null`."""
+
+
 class CreateTronTransactionException(HTTPException):
     def __init__(
         self,
@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta
 
-from sqlalchemy import TIMESTAMP, ForeignKey, String
+from sqlalchemy import TIMESTAMP, BigInteger, ForeignKey, Index, String, text
 from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.apps.transactions.model import TransactionStatusEnum, TransactionTypeEnum
@@ -11,6 +12,30 @@ from src.core.database import Base
 
 class BlockchainTransactionModel(Base):
     __tablename__ = "blockchain_transactions"
+    __table_args__ = (
+        # Сопоставление переводов с блокчейна с ожидающими пополнениями
+        Index(
+            "blockchain_transactions_pending_pay_in_idx",
+            "to_address",
+            "amount",
+            postgresql_where=text("status = 'PENDING' AND type = 'PAY_IN'"),
+        ),
+        # Перевод с блокчейна засчитывается не более одной транзакции
+        Index(
+            "blockchain_transactions_hash_key",
+            "hash",
+            unique=True,
+            postgresql_where=text("hash IS NOT NULL"),
+        ),
+        # Очередь одобренных выводов средств на отправку в сеть
+        Index(
+            "blockchain_transactions_approved_pay_out_idx",
+            "id",
+            postgresql_where=text(
+                "status = 'PENDING' AND type = 'PAY_OUT' AND approved_at IS NOT NULL"
+            ),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -33,5 +58,21 @@ class BlockchainTransactionModel(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP, default=datetime.now, onupdate=datetime.now
     )
+    # Вывод средств одобрен и ожидает отправки в сеть
+    approved_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+    signed_transaction: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    broadcast_attempts: Mapped[int] = mapped_column(default=0, server_default="0")
 
     user: Mapped["UserModel"] = relationship(back_populates="blockchain_transactions")
+
+
+class BlockchainCursorModel(Base):
+    """Позиция обработчика блокчейна: номер последнего обработанного блока."""
+
+    __tablename__ = "blockchain_cursors"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    block_number: Mapped[int] = mapped_column(BigInteger)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, default=datetime.now, onupdate=datetime.now
+    )
@@ -1,9 +1,12 @@
 from typing import Tuple
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.blockchain import schemas
-from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.model import BlockchainCursorModel, BlockchainTransactionModel
+from src.apps.transactions.model import TransactionStatusEnum, TransactionTypeEnum
 from src.libs.base.repository import BaseRepository
 
 
@@ -52,9 +55,179 @@ class BlockchainTransactionRepository(
             stmt = stmt.where(cls.model.amount <= query_params.max_amount)
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
+
+    @classmethod
+    async def get_pending_pay_ins_by_transfers(
+        cls,
+        session: AsyncSession,
+        transfers: list[tuple[str, int]],
+    ) -> list[BlockchainTransactionModel]:
+        """
+        Получить ожидающие пополнения, однозначно подходящие под переводы
+        с блокчейна, с блокировкой строк.
+
+        Пополнения с одинаковыми адресом получателя и суммой не возвращаются,
+        так как по переводу нельзя определить, какой пользователь его отправил.
+        Такие пополнения подтверждаются вручную по хэшу.
+        Строки, заблокированные другой транзакцией
+        (например, ручным подтверждением), пропускаются.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            transfers (list[tuple[str, int]]): Адреса получателей и суммы переводов.
+
+        Returns:
+            list[BlockchainTransactionModel]: Пополнения, не более одного
+                на адрес получателя и сумму.
+        """
+
+        pending_filters = (
+            tuple_(cls.model.to_address, cls.model.amount).in_(transfers),
+            cls.model.status == TransactionStatusEnum.PENDING,
+            cls.model.type == TransactionTypeEnum.PAY_IN,
+        )
+
+        # Количество считается без блокировок,
+        #   чтобы заблокированные строки тоже делали перевод неоднозначным.
+        unambiguous_stmt = (
+            select(cls.model.to_address, cls.model.amount)
+            .where(*pending_filters)
+            .group_by(cls.model.to_address, cls.model.amount)
+            .having(func.count() == 1)
+        )
+
+        result = await session.execute(
+            select(cls.model)
+            .where(
+                *pending_filters,
+                tuple_(cls.model.to_address, cls.model.amount).in_(unambiguous_stmt),
+            )
+            .with_for_update(skip_locked=True)
+        )
+
+        return list(result.scalars().all())
+
+    @classmethod
+    async def get_existing_hashes(
+        cls,
+        session: AsyncSession,
+        hashes: list[str],
+    ) -> set[str]:
+        """
+        Получить хэши, уже привязанные к транзакциям.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            hashes (list[str]): Хэши транзакций на блокчейне.
+
+        Returns:
+            set[str]: Найденные хэши.
+        """
+
+        result = await session.execute(
+            select(cls.model.hash).where(cls.model.hash.in_(hashes))
+        )
+
+        return set(result.scalars().all())
+
+    @classmethod
+    async def get_approved_pay_outs(
+        cls,
+        session: AsyncSession,
+        is_signed: bool,
+        limit: int,
+        exclude_ids: set[int] | None = None,
+    ) -> list[BlockchainTransactionModel]:
+        """
+        Получить одобренные выводы средств, ожидающие отправки в сеть,
+        с блокировкой строк. Строки, заблокированные другим обработчиком,
+        пропускаются.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            is_signed (bool): Подписана ли уже транзакция на блокчейне.
+            limit (int): Максимальное количество транзакций.
+            exclude_ids (set[int] | None): ID транзакций, которые нужно пропустить.
+
+        Returns:
+            list[BlockchainTransactionModel]: Выводы средств в порядке одобрения.
+        """
+
+        stmt = (
+            select(cls.model)
+            .where(
+                cls.model.status == TransactionStatusEnum.PENDING,
+                cls.model.type == TransactionTypeEnum.PAY_OUT,
+                cls.model.approved_at.is_not(None),
+                cls.model.signed_transaction.is_not(None)
+                if is_signed
+                else cls.model.signed_transaction.is_(None),
+            )
+            .order_by(cls.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if exclude_ids:
+            stmt = stmt.where(cls.model.id.not_in(exclude_ids))
+
+        result = await session.execute(stmt)
+
+        return list(result.scalars().all())
+
+
+class BlockchainCursorRepository:
+    """Репозиторий позиций обработчиков блокчейна."""
+
+    model = BlockchainCursorModel
+
+    @classmethod
+    async def get_for_update(
+        cls,
+        session: AsyncSession,
+        name: str,
+    ) -> BlockchainCursorModel | None:
+        """
+        Получить позицию с блокировкой строки.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            name (str): Название позиции.
+
+        Returns:
+            BlockchainCursorModel | None:
+                Позиция или `None`, если ее нет или она занята другим обработчиком.
+        """
+
+        result = await session.execute(
+            select(cls.model)
+            .where(cls.model.name == name)
+            .with_for_update(skip_locked=True)
+        )
+
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def create_if_not_exists(
+        cls,
+        session: AsyncSession,
+        name: str,
+        block_number: int,
+    ) -> None:
+        """
+        Создать позицию, если ее еще нет.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            name (str): Название позиции.
+            block_number (int): Номер последнего обработанного блока.
+        """
+
+        await session.execute(
+            insert(cls.model)
+            .values(name=name, block_number=block_number)
+            .on_conflict_do_nothing(index_elements=[cls.model.name])
+        )
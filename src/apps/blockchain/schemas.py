@@ -30,6 +30,7 @@ class TransactionGetSchema(BaseModel):
     from_address: str | None = None
     status: TransactionStatusEnum
     created_at: datetime
+    approved_at: datetime | None = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,90 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.blockchain import constants as blockchain_constants
+from src.apps.blockchain.repository import BlockchainCursorRepository
+from src.apps.blockchain.services.transaction_service import (
+    BlockchainTransactionService,
+)
+from src.apps.blockchain.services.tron_service import TronService
+from src.core import constants
+
+
+class DepositWatcherService:
+    """
+    Обработчик новых блоков, подтверждающий пополнения без участия пользователя.
+
+    Номер последнего обработанного блока хранится в `blockchain_cursors`
+    и сдвигается в одной транзакции с подтверждением пополнений,
+    поэтому каждый блок обрабатывается ровно один раз.
+    Обрабатываются только блоки глубже `TRON_DEPOSIT_CONFIRMATIONS`,
+    которые уже не могут быть отменены.
+    Строка позиции блокируется на время обработки,
+    поэтому параллельные запуски не обрабатывают одни и те же блоки.
+    """
+
+    cursor_name = blockchain_constants.DEPOSIT_WATCHER_CURSOR_NAME
+
+    @classmethod
+    async def process_next_blocks(cls, session: AsyncSession) -> int:
+        """
+        Обработать следующую пачку блоков и подтвердить найденные пополнения.
+
+        При первом запуске позиция создается на текущем необратимом блоке,
+        история блокчейна не сканируется.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+
+        Returns:
+            int: Количество обработанных блоков.
+
+        Raises:
+            GetTronBlockException: Ошибка при попытке получения блока с TronScan.
+        """
+
+        cursor_db = await BlockchainCursorRepository.get_for_update(
+            session=session,
+            name=cls.cursor_name,
+        )
+        last_block_number = (
+            await TronService.get_block_number() - constants.TRON_DEPOSIT_CONFIRMATIONS
+        )
+
+        if cursor_db is None:
+            # Позиция занята другим обработчиком или еще не создана
+            await BlockchainCursorRepository.create_if_not_exists(
+                session=session,
+                name=cls.cursor_name,
+                block_number=last_block_number,
+            )
+            await session.commit()
+            return 0
+
+        start = cursor_db.block_number + 1
+        end = min(
+            last_block_number,
+            cursor_db.block_number + constants.TRON_DEPOSIT_BLOCKS_BATCH_SIZE,
+        )
+        if start > end:
+            await session.commit()
+            return 0
+
+        transfers = await TronService.get_blocks_transfers(list(range(start, end + 1)))
+        confirmed_count = await BlockchainTransactionService.confirm_pay_ins(
+            session=session,
+            transfers=transfers,
+        )
+
+        cursor_db.block_number = end
+        await session.commit()
+
+        if confirmed_count:
+            logger.info(
+                "Подтверждено пополнений: {} в блоках {}-{}",
+                confirmed_count,
+                start,
+                end,
+            )
+
+        return end - start + 1
@@ -0,0 +1,393 @@
+import asyncio
+import time
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.blockchain import exceptions as blockchain_exceptions
+from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.repository import BlockchainTransactionRepository
+from src.apps.blockchain.services.tron_service import TronService
+from src.apps.ledger import schemas as ledger_schemas
+from src.apps.ledger.model import LedgerEntryReasonEnum
+from src.apps.ledger.service import LedgerService
+from src.apps.notifications import schemas as notification_schemas
+from src.apps.notifications.service import NotificationService
+from src.apps.transactions.model import TransactionStatusEnum
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
+from src.apps.wallets.repository import WalletRepository
+from src.core import constants
+
+
+class PayOutBroadcastService:
+    """
+    Очередь отправки одобренных выводов средств в сеть Tron.
+
+    Вывод средств проходит два шага, каждый из которых коммитится отдельно:
+    1. Создание транзакций на блокчейне и подпись всей пачки в пуле потоков
+       (`TronService.sign_transactions`). Подписанная транзакция
+       и ее хэш сохраняются в БД до отправки, поэтому при сбое воркера
+       повторно отправляется та же транзакция, а не создается новая.
+    2. Отправка подписанной транзакции. Транзакции одного кошелька
+       отправляются последовательно в порядке одобрения, разные кошельки -
+       параллельно, не более `TRON_BROADCAST_CONCURRENCY` одновременно.
+
+    Строки транзакций блокируются с `SKIP LOCKED`,
+    поэтому параллельные запуски обрабатывают разные транзакции.
+    """
+
+    repository = BlockchainTransactionRepository
+
+    # MARK: Process
+    @classmethod
+    async def process(cls, session: AsyncSession) -> int:
+        """
+        Подписать и отправить в сеть одобренные выводы средств пачками,
+        коммитя каждую пачку, пока очередь не опустеет.
+
+        Транзакции, которые не удалось обработать, откладываются
+        до следующего запуска, чтобы не расходовать попытки подряд.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+
+        Returns:
+            int: Количество обработанных выводов средств. Вывод средств,
+                подписанный и отправленный за один запуск, учитывается один раз.
+        """
+
+        deferred_ids: set[int] = set()
+        processed_ids: set[int] = set()
+        while True:
+            batch_ids = await cls._sign_batch(
+                session=session, deferred_ids=deferred_ids
+            )
+            batch_ids |= await cls._broadcast_batch(
+                session=session, deferred_ids=deferred_ids
+            )
+            if not batch_ids:
+                return len(processed_ids)
+
+            processed_ids |= batch_ids
+
+    @classmethod
+    async def _sign_batch(
+        cls,
+        session: AsyncSession,
+        deferred_ids: set[int],
+    ) -> set[int]:
+        """
+        Создать и подписать транзакции на блокчейне для пачки выводов средств.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            deferred_ids (set[int]): ID отложенных до следующего запуска транзакций.
+
+        Returns:
+            set[int]: ID обработанных транзакций.
+        """
+
+        transactions_db = await cls.repository.get_approved_pay_outs(
+            session=session,
+            is_signed=False,
+            limit=constants.TRON_BROADCAST_BATCH_SIZE,
+            exclude_ids=deferred_ids,
+        )
+        if not transactions_db:
+            return set()
+
+        private_keys = await WalletRepository.get_private_keys(
+            session=session,
+            addresses=list(
+                {transaction_db.from_address for transaction_db in transactions_db}
+            ),
+        )
+        semaphore = asyncio.Semaphore(constants.TRON_BROADCAST_CONCURRENCY)
+
+        async def create(transaction_db: BlockchainTransactionModel) -> dict | None:
+            if transaction_db.from_address not in private_keys:
+                logger.error(
+                    "Кошелек {} вывода средств {} не найден",
+                    transaction_db.from_address,
+                    transaction_db.id,
+                )
+                cls._fail(session=session, transaction_db=transaction_db)
+                return None
+
+            async with semaphore:
+                try:
+                    return await TronService.create_transaction(
+                        from_address=transaction_db.from_address,
+                        to_address=transaction_db.to_address,
+                        amount=transaction_db.amount,
+                    )
+                except blockchain_exceptions.CreateTronTransactionException as e:
+                    logger.warning(
+                        "Не удалось создать транзакцию вывода средств {}: {}",
+                        transaction_db.id,
+                        e.detail,
+                    )
+                    cls._retry_later(session=session, transaction_db=transaction_db)
+                    return None
+
+        transactions = await asyncio.gather(
+            *(create(transaction_db) for transaction_db in transactions_db)
+        )
+        created = [
+            (transaction_db, transaction)
+            for transaction_db, transaction in zip(transactions_db, transactions)
+            if transaction is not None
+        ]
+
+        # Подпись всей пачки в пуле потоков одним вызовом
+        signed_transactions = await TronService.sign_transactions(
+            [
+                (transaction, private_keys[transaction_db.from_address])
+                for transaction_db, transaction in created
+            ]
+        )
+        for (transaction_db, _), signed_transaction in zip(
+            created, signed_transactions
+        ):
+            transaction_db.signed_transaction = signed_transaction
+            transaction_db.hash = signed_transaction["txID"]
+
+        await session.commit()
+        await cls._revert_failed_balances(transactions_db)
+
+        deferred_ids.update(
+            transaction_db.id
+            for transaction_db in transactions_db
+            if transaction_db.status == TransactionStatusEnum.PENDING
+            and transaction_db.signed_transaction is None
+        )
+
+        return {transaction_db.id for transaction_db in transactions_db}
+
+    @classmethod
+    async def _broadcast_batch(
+        cls,
+        session: AsyncSession,
+        deferred_ids: set[int],
+    ) -> set[int]:
+        """
+        Отправить в сеть пачку подписанных транзакций вывода средств.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            deferred_ids (set[int]): ID отложенных до следующего запуска транзакций.
+
+        Returns:
+            set[int]: ID обработанных транзакций.
+        """
+
+        transactions_db = await cls.repository.get_approved_pay_outs(
+            session=session,
+            is_signed=True,
+            limit=constants.TRON_BROADCAST_BATCH_SIZE,
+            exclude_ids=deferred_ids,
+        )
+        if not transactions_db:
+            return set()
+
+        wallets_transactions: dict[str, list[BlockchainTransactionModel]] = {}
+        for transaction_db in transactions_db:
+            wallets_transactions.setdefault(transaction_db.from_address, []).append(
+                transaction_db
+            )
+
+        semaphore = asyncio.Semaphore(constants.TRON_BROADCAST_CONCURRENCY)
+
+        async def broadcast_wallet(
+            wallet_transactions: list[BlockchainTransactionModel],
+        ) -> None:
+            async with semaphore:
+                for transaction_db in wallet_transactions:
+                    await cls._broadcast(session=session, transaction_db=transaction_db)
+
+        await asyncio.gather(
+            *(
+                broadcast_wallet(wallet_transactions)
+                for wallet_transactions in wallets_transactions.values()
+            )
+        )
+        await session.commit()
+        await cls._revert_failed_balances(transactions_db)
+
+        deferred_ids.update(
+            transaction_db.id
+            for transaction_db in transactions_db
+            if transaction_db.status == TransactionStatusEnum.PENDING
+        )
+
+        return {transaction_db.id for transaction_db in transactions_db}
+
+    @classmethod
+    async def _broadcast(
+        cls,
+        session: AsyncSession,
+        transaction_db: BlockchainTransactionModel,
+    ) -> None:
+        """
+        Отправить подписанную транзакцию с повторами и обновить ее статус.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            transaction_db (BlockchainTransactionModel): Вывод средств.
+        """
+
+        delay = constants.TRON_BROADCAST_RETRY_DELAY
+        for attempt in range(constants.TRON_BROADCAST_MAX_RETRIES):
+            try:
+                await TronService.broadcast_transaction(
+                    transaction_db.signed_transaction
+                )
+                cls._complete(session=session, transaction_db=transaction_db)
+                return
+
+            except blockchain_exceptions.BroadcastTronTransactionException as e:
+                logger.warning(
+                    "Не удалось отправить транзакцию вывода средств {} ({}): {}",
+                    transaction_db.id,
+                    attempt + 1,
+                    e.detail,
+                )
+
+            if attempt + 1 < constants.TRON_BROADCAST_MAX_RETRIES:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        # Истекшая транзакция уже не может попасть в блок, если ее нет в сети.
+        #   Подпись сбрасывается только при явном ответе RPC, что транзакции нет:
+        #   при ошибке запроса транзакция могла быть уже включена в блок.
+        expiration = transaction_db.signed_transaction["raw_data"]["expiration"]
+        if expiration / 1000 < time.time():
+            try:
+                await TronService.get_transaction_by_hash(transaction_db.hash)
+            except blockchain_exceptions.TronTransactionNotFoundException:
+                transaction_db.signed_transaction = None
+                transaction_db.hash = None
+            except blockchain_exceptions.GetTronTransactionException as e:
+                logger.warning(
+                    "Не удалось проверить транзакцию вывода средств {}: {}",
+                    transaction_db.id,
+                    e.detail,
+                )
+            else:
+                cls._complete(session=session, transaction_db=transaction_db)
+                return
+
+        cls._retry_later(session=session, transaction_db=transaction_db)
+
+    # MARK: Status
+    @staticmethod
+    def _complete(
+        session: AsyncSession,
+        transaction_db: BlockchainTransactionModel,
+    ) -> None:
+        """
+        Отметить вывод средств успешным и списать средства со счета пользователя.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            transaction_db (BlockchainTransactionModel): Вывод средств.
+        """
+
+        transaction_db.status = TransactionStatusEnum.SUCCESS
+
+        # Списание средств со счета пользователя
+        LedgerService.enqueue(
+            session=session,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=transaction_db.user_id,
+                reason=LedgerEntryReasonEnum.WITHDRAWAL,
+                balance_delta=-transaction_db.amount,
+                blockchain_transaction_id=transaction_db.id,
+            ),
+        )
+
+        # Отправление уведомления
+        NotificationService.enqueue(
+            session=session,
+            data=notification_schemas.NotificationCreateSchema(
+                user_id=transaction_db.user_id,
+                message=constants.NOTIFICATION_MESSAGE_PAY_OUT.format(
+                    amount=transaction_db.amount,
+                    address=transaction_db.to_address,
+                ),
+            ),
+        )
+
+    @classmethod
+    def _retry_later(
+        cls,
+        session: AsyncSession,
+        transaction_db: BlockchainTransactionModel,
+    ) -> None:
+        """
+        Оставить вывод средств в очереди до следующего запуска
+        или отменить его, если исчерпаны попытки.
+        Подписанная транзакция не отменяется, пока может попасть в блок.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            transaction_db (BlockchainTransactionModel): Вывод средств.
+        """
+
+        transaction_db.broadcast_attempts += 1
+        if (
+            transaction_db.broadcast_attempts >= constants.TRON_PAY_OUT_MAX_ATTEMPTS
+            and transaction_db.signed_transaction is None
+        ):
+            cls._fail(session=session, transaction_db=transaction_db)
+
+    @staticmethod
+    async def _revert_failed_balances(
+        transactions_db: list[BlockchainTransactionModel],
+    ) -> None:
+        """
+        Вернуть в кэш балансов суммы отмененных выводов средств,
+        оптимистично списанные с кошельков при запросе вывода.
+
+        Args:
+            transactions_db (list[BlockchainTransactionModel]): Выводы средств пачки.
+        """
+
+        await WalletBalanceCacheService.revert(
+            [
+                transaction_db
+                for transaction_db in transactions_db
+                if transaction_db.status == TransactionStatusEnum.FAILED
+            ]
+        )
+
+    @staticmethod
+    def _fail(
+        session: AsyncSession,
+        transaction_db: BlockchainTransactionModel,
+    ) -> None:
+        """
+        Отменить вывод средств.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            transaction_db (BlockchainTransactionModel): Вывод средств.
+        """
+
+        transaction_db.status = TransactionStatusEnum.FAILED
+
+        # Отправление уведомления
+        NotificationService.enqueue(
+            session=session,
+            data=notification_schemas.NotificationCreateSchema(
+                user_id=transaction_db.user_id,
+                message=constants.NOTIFICATION_MESSAGE_PAY_OUT_FAILED.format(
+                    amount=transaction_db.amount,
+                    address=transaction_db.to_address,
+                ),
+            ),
+        )
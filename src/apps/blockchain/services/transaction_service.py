@@ -7,11 +7,13 @@ from src.apps.blockchain import constants as blockchain_constants
 from src.apps.blockchain import schemas
 from src.apps.blockchain.model import BlockchainTransactionModel
 from src.apps.blockchain.repository import BlockchainTransactionRepository
-from src.apps.blockchain.services.tron_service import TronService
+from src.apps.ledger import schemas as ledger_schemas
+from src.apps.ledger.model import LedgerEntryReasonEnum
+from src.apps.ledger.service import LedgerService
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
 from src.apps.transactions.model import TransactionStatusEnum, TransactionTypeEnum
-from src.apps.users.repository import UserRepository
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
 from src.apps.wallets.repository import WalletRepository
 from src.apps.wallets.service import WalletService
 from src.core import constants, exceptions
@@ -91,6 +93,7 @@ class BlockchainTransactionService(
                 id=transaction_db.id,
                 status=TransactionStatusEnum.FAILED,
             )
+            await WalletBalanceCacheService.revert([transaction_db])
 
             raise exceptions.NotFoundException(
                 message=cls.not_found_exception_message,
@@ -121,7 +124,7 @@ class BlockchainTransactionService(
 
         logger.info("Обновление статуса транзакции по ID: {}, статус: {}", id, status)
 
-        transaction_db = await cls.repository.get_one_or_none(
+        transaction_db = await cls.repository.get_by_id(
             session=session,
             id=id,
         )
@@ -145,9 +148,9 @@ class BlockchainTransactionService(
         """
         Подтвердить вывод средств транзакции по ID.
 
-        Проверяет статус и тип транзакции,
-            создает и подписывает транзакцию на блокчейне,
-            обновляет статус транзакции в БД
+        Проверяет статус и тип транзакции и ставит ее в очередь на отправку.
+            Транзакция на блокчейне создается, подписывается и отправляется
+            периодической задачей, которая обновляет статус транзакции в БД
             и меняет баланс пользователя.
 
         Args:
@@ -159,11 +162,12 @@ class BlockchainTransactionService(
             BadRequestException:
                 - Транзакция не в статусе PENDING.
                 - Транзакция не является выводом средств.
+                - Транзакция уже подтверждена.
         """
 
         logger.info("Подтверждение вывода средств транзакции по ID: {}", id)
 
-        transaction_db = await cls.repository.get_one_or_none(
+        transaction_db = await cls.repository.get_by_id(
             session=session,
             id=id,
         )
@@ -179,6 +183,8 @@ class BlockchainTransactionService(
             err_msgs.append("не в статусе PENDING")
         elif transaction_db.type != TransactionTypeEnum.PAY_OUT:
             err_msgs.append("не является выводом средств")
+        elif transaction_db.approved_at is not None:
+            err_msgs.append("уже подтверждена")
         elif transaction_db.expires_at < datetime.now():
             err_msgs.append("просрочена")
         if err_msgs:
@@ -194,33 +200,121 @@ class BlockchainTransactionService(
                 code=WalletService.not_found_exception_code,
             )
 
-        # Создание и подписание транзакции на блокчейне
-        hash = await TronService.create_and_sign_transaction(
-            from_address=transaction_db.from_address,
-            to_address=transaction_db.to_address,
-            amount=transaction_db.amount,
-            private_key=wallet_db.private_key,
-        )
+        # Отправка в сеть выполняется очередью `PayOutBroadcastService`
+        transaction_db.approved_at = datetime.now()
+        await session.commit()
 
-        transaction_db.status = TransactionStatusEnum.SUCCESS
-        transaction_db.hash = hash
+    @staticmethod
+    def enqueue_deposit(
+        session: AsyncSession,
+        transaction_db: BlockchainTransactionModel,
+    ) -> None:
+        """
+        Добавить зачисление пополнения на счет пользователя
+        за вычетом комиссии платформы в очередь текущей транзакции сессии.
+        (Не создает коммит транзакции)
+
+        Args:
+            session: Сессия базы данных.
+            transaction_db: Подтвержденное пополнение.
+        """
 
-        user = await UserRepository.get_one_or_none(
+        LedgerService.enqueue(
             session=session,
-            id=transaction_db.user_id,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=transaction_db.user_id,
+                reason=LedgerEntryReasonEnum.DEPOSIT,
+                balance_delta=int(
+                    transaction_db.amount
+                    - transaction_db.amount * constants.PLATFORM_PAY_IN_COMMISSION
+                ),
+                blockchain_transaction_id=transaction_db.id,
+            ),
         )
 
-        user.balance -= transaction_db.amount
-        await session.commit()
+    @classmethod
+    async def confirm_pay_ins(
+        cls,
+        session: AsyncSession,
+        transfers: list[dict],
+    ) -> int:
+        """
+        Подтвердить ожидающие пополнения по переводам с блокчейна.
 
-        # Отправление уведомления
-        await NotificationService.create(
+        Переводы на кошельки платформы сопоставляются с пополнениями
+        по адресу получателя и сумме одним запросом к БД.
+        Если подходящих пополнений несколько, перевод пропускается
+        и пополнение подтверждается пользователем вручную по хэшу,
+        иначе перевод одного пользователя может быть зачислен другому.
+        Хэши, уже привязанные к транзакциям, повторно не засчитываются.
+        (Не создает коммит транзакции)
+
+        Args:
+            session: Сессия базы данных.
+            transfers: Переводы с блокчейна:
+                (hash, from_address, to_address, amount, created_at)
+
+        Returns:
+            Количество подтвержденных пополнений.
+        """
+
+        wallets_addresses = await WalletRepository.get_addresses(session=session)
+        transfers = [
+            transfer
+            for transfer in transfers
+            if transfer["to_address"] in wallets_addresses
+        ]
+        if not transfers:
+            return 0
+
+        used_hashes = await cls.repository.get_existing_hashes(
             session=session,
-            data=notification_schemas.NotificationCreateSchema(
-                user_id=transaction_db.user_id,
-                message=constants.NOTIFICATION_MESSAGE_PAY_OUT.format(
-                    amount=transaction_db.amount,
-                    address=transaction_db.to_address,
-                ),
+            hashes=[transfer["hash"] for transfer in transfers],
+        )
+        transfers = [
+            transfer for transfer in transfers if transfer["hash"] not in used_hashes
+        ]
+        if not transfers:
+            return 0
+
+        transactions_db = await cls.repository.get_pending_pay_ins_by_transfers(
+            session=session,
+            transfers=list(
+                {(transfer["to_address"], transfer["amount"]) for transfer in transfers}
             ),
         )
+        pending = {
+            (transaction_db.to_address, transaction_db.amount): transaction_db
+            for transaction_db in transactions_db
+        }
+
+        confirmed_count = 0
+        for transfer in transfers:
+            transaction_db = pending.pop(
+                (transfer["to_address"], transfer["amount"]), None
+            )
+            if transaction_db is None:
+                continue
+
+            transaction_db.status = TransactionStatusEnum.SUCCESS
+            transaction_db.hash = transfer["hash"]
+            transaction_db.from_address = transfer["from_address"]
+            transaction_db.created_at = transfer["created_at"]
+
+            cls.enqueue_deposit(session=session, transaction_db=transaction_db)
+
+            # Отправление уведомления
+            NotificationService.enqueue(
+                session=session,
+                data=notification_schemas.NotificationCreateSchema(
+                    user_id=transaction_db.user_id,
+                    message=constants.NOTIFICATION_MESSAGE_PAY_IN.format(
+                        amount=transaction_db.amount,
+                        address=transaction_db.to_address,
+                    ),
+                ),
+            )
+
+            confirmed_count += 1
+
+        return confirmed_count
@@ -1,23 +1,44 @@
 import asyncio
 import hashlib
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import aiohttp
 import orjson
+from loguru import logger
+from redis.exceptions import RedisError
 from tronpy.keys import PrivateKey
 
 from src.apps.blockchain import exceptions
 from src.core import constants
 from src.core.settings import settings
+from src.libs.services.http_client_service import HTTPClientService
+from src.libs.services.lru_cache_service import LRUCacheService
+from src.libs.services.redis_service import RedisService
 
 
 class TronService:
+    _block_timestamps: LRUCacheService[str, int] = LRUCacheService(
+        maxsize=constants.TRON_BLOCK_CACHE_SIZE,
+        ttl=constants.TRON_BLOCK_CACHE_TTL,
+    )
+    _transactions: LRUCacheService[str, dict] = LRUCacheService(
+        maxsize=constants.TRON_TRANSACTION_CACHE_SIZE,
+        ttl=constants.TRON_TRANSACTION_CACHE_TTL,
+    )
+    _private_keys: LRUCacheService[str, PrivateKey] = LRUCacheService(
+        maxsize=constants.TRON_PRIVATE_KEY_CACHE_SIZE,
+        ttl=constants.TRON_PRIVATE_KEY_CACHE_TTL,
+    )
+    _private_keys_lock = threading.Lock()
+    _sign_executor: ThreadPoolExecutor | None = None
+
     # MARK: Utils
-    @classmethod
-    async def _get_block_timestamp(cls, hash: str) -> int:
+    @staticmethod
+    async def _fetch_block_timestamp(hash: str) -> int:
         """
-        Получить timestamp блока.
+        Запросить timestamp блока с блокчейна.
 
         Args:
             hash: Хэш блока.
@@ -29,26 +50,26 @@ class TronService:
             GetTronBlockException: Ошибка при попытке получения блока с TronScan.
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                constants.TRON_JRPC_API_URL,
-                json={
-                    "jsonrpc": constants.TRON_JRPC_VERSION,
-                    "method": constants.TRON_GET_BLOCK_BY_HASH_METHOD,
-                    "params": [hash, False],
-                    "id": random.randint(1, 1000000),
-                },
-                headers={
-                    "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise exceptions.GetTronBlockException(
-                        error_status_code=response.status,
-                        error_text=await response.text(),
-                    )
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json={
+                "jsonrpc": constants.TRON_JRPC_VERSION,
+                "method": constants.TRON_GET_BLOCK_BY_HASH_METHOD,
+                "params": [hash, False],
+                "id": random.randint(1, 1000000),
+            },
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                raise exceptions.GetTronBlockException(
+                    error_status_code=response.status,
+                    error_text=await response.text(),
+                )
 
-                block_data: dict = orjson.loads(await response.text())
+            block_data: dict = orjson.loads(await response.text())
 
         if block_data.get("result") is None:
             raise exceptions.GetTronBlockException(
@@ -58,6 +79,53 @@ class TronService:
 
         return int(block_data["result"]["timestamp"], 16)
 
+    @classmethod
+    async def _get_block_timestamp(cls, hash: str) -> int:
+        """
+        Получить timestamp блока.
+        Блоки неизменяемы, поэтому timestamp кэшируется в памяти процесса
+        и, если включено `TRON_BLOCK_CACHE_REDIS_ENABLED`, в Redis.
+
+        Args:
+            hash: Хэш блока.
+
+        Returns:
+            Timestamp блока.
+
+        Raises:
+            GetTronBlockException: Ошибка при попытке получения блока с TronScan.
+        """
+
+        timestamp = cls._block_timestamps.get(hash)
+        if timestamp is not None:
+            return timestamp
+
+        key = constants.TRON_BLOCK_TIMESTAMP_KEY.format(hash=hash)
+        if settings.TRON_BLOCK_CACHE_REDIS_ENABLED:
+            try:
+                cached = await RedisService.get(key)
+            except RedisError as e:
+                logger.warning("Не удалось прочитать timestamp блока: {}", e)
+                cached = None
+
+            if cached is not None:
+                timestamp = int(cached)
+                cls._block_timestamps.set(hash, timestamp)
+                return timestamp
+
+        timestamp = await cls._fetch_block_timestamp(hash)
+        cls._block_timestamps.set(hash, timestamp)
+
+        if settings.TRON_BLOCK_CACHE_REDIS_ENABLED:
+            try:
+                await RedisService.set(
+                    key, str(timestamp), expire=constants.TRON_BLOCK_CACHE_TTL
+                )
+            except RedisError as e:
+                logger.warning("Не удалось сохранить timestamp блока: {}", e)
+
+        return timestamp
+
     # MARK: Check
     @staticmethod
     async def does_wallet_exist(address: str) -> bool:
@@ -74,26 +142,26 @@ class TronService:
             GetTronWalletException: Ошибка при попытке получения кошелька с Tron.
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                constants.TRON_JRPC_API_URL,
-                json={
-                    "jsonrpc": constants.TRON_JRPC_VERSION,
-                    "method": constants.TRON_GET_BALANCE_METHOD,
-                    "params": [address, "latest"],
-                    "id": random.randint(1, 1000000),
-                },
-                headers={
-                    "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise exceptions.GetTronWalletException(
-                        error_status_code=response.status,
-                        error_text=await response.text(),
-                    )
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json={
+                "jsonrpc": constants.TRON_JRPC_VERSION,
+                "method": constants.TRON_GET_BALANCE_METHOD,
+                "params": [address, "latest"],
+                "id": random.randint(1, 1000000),
+            },
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                raise exceptions.GetTronWalletException(
+                    error_status_code=response.status,
+                    error_text=await response.text(),
+                )
 
-                data_json: dict = orjson.loads(await response.text())
+            data_json: dict = orjson.loads(await response.text())
 
         if data_json.get("result") is None:
             return False
@@ -102,10 +170,12 @@ class TronService:
 
     # MARK: Get
     @staticmethod
-    async def get_wallets_balances(addresses: list[str]) -> dict[str, int]:
+    async def _get_wallets_balances_batch(addresses: list[str]) -> dict[str, int]:
         """
-        Получить балансы кошельков.
-        Обращается к API TronScan и получает балансы кошельков.
+        Получить балансы кошельков одним пакетным JSON-RPC запросом.
+
+        Ответы пакета могут прийти в любом порядке,
+        поэтому сопоставляются с адресами по `id` запроса.
 
         Args:
             addresses: Список адресов кошельков.
@@ -114,31 +184,73 @@ class TronService:
             Словарь с адресами кошельков и их балансами.
         """
 
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json=[
+                {
+                    "jsonrpc": constants.TRON_JRPC_VERSION,
+                    "method": constants.TRON_GET_BALANCE_METHOD,
+                    "params": [address, "latest"],
+                    "id": id,
+                }
+                for id, address in enumerate(addresses)
+            ],
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                return {}
+
+            data_json = orjson.loads(await response.read())
+
+        # Ошибка всего пакета приходит одним объектом вместо списка
+        if not isinstance(data_json, list):
+            return {}
+
         balances: dict[str, int] = {}
+        for item in data_json:
+            id = item.get("id")
+            if (
+                item.get("result") is None
+                or not isinstance(id, int)
+                or not 0 <= id < len(addresses)
+            ):
+                continue
+
+            balances[addresses[id]] = int(
+                item["result"], 16
+            )  # Конвертация в 10-ричную систему
+
+        return balances
+
+    @classmethod
+    async def get_wallets_balances(cls, addresses: list[str]) -> dict[str, int]:
+        """
+        Получить балансы кошельков.
+        Обращается к API TronScan пакетными JSON-RPC запросами
+        по `TRON_JRPC_BATCH_SIZE` кошельков и получает балансы кошельков.
+
+        Args:
+            addresses: Список адресов кошельков.
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                session.post(
-                    constants.TRON_JRPC_API_URL,
-                    json={
-                        "jsonrpc": constants.TRON_JRPC_VERSION,
-                        "method": constants.TRON_GET_BALANCE_METHOD,
-                        "params": [address, "latest"],
-                        "id": random.randint(1, 1000000),
-                    },
-                    headers={
-                        "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                    },
+        Returns:
+            Словарь с адресами кошельков и их балансами.
+        """
+
+        batches_balances = await asyncio.gather(
+            *(
+                cls._get_wallets_balances_batch(
+                    addresses[i : i + settings.TRON_JRPC_BATCH_SIZE]
                 )
-                for address in addresses
-            ]
-            for i, response in enumerate(await asyncio.gather(*tasks)):
-                if response.status == 200:
-                    data_json: dict = orjson.loads(await response.text())
-                    if data_json.get("result") is not None:
-                        balances[addresses[i]] = int(
-                            data_json["result"], 16
-                        )  # Конвертация в 10-ричную систему
+                for i in range(0, len(addresses), settings.TRON_JRPC_BATCH_SIZE)
+            )
+        )
+
+        balances: dict[str, int] = {}
+        for batch_balances in batches_balances:
+            balances.update(batch_balances)
 
         return balances
 
@@ -146,6 +258,9 @@ class TronService:
     async def get_transaction_by_hash(cls, hash: str) -> dict:
         """
         Получить транзакцию по хэшу.
+        Транзакции в блоках глубже `TRON_DEPOSIT_CONFIRMATIONS`, которые
+        уже не могут быть отменены, кэшируются в памяти процесса,
+        поэтому повторное подтверждение не повторяет запросы к блокчейну.
 
         Args:
             hash: Хэш транзакции.
@@ -155,38 +270,61 @@ class TronService:
                 (hash, from_address, to_address, amount, created_at)
 
         Raises:
+            TronTransactionNotFoundException: Транзакции нет в сети.
             GetTronTransactionException:
-                Ошибка при попытке получения транзакции с TronScan.
+                Ошибка при попытке получения транзакции с TronScan
+                или транзакция еще не включена в блок.
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                constants.TRON_JRPC_API_URL,
-                json={
-                    "jsonrpc": constants.TRON_JRPC_VERSION,
-                    "method": constants.TRON_GET_TRANSACTION_BY_HASH_METHOD,
-                    "params": [hash],
-                    "id": random.randint(1, 1000000),
-                },
-                headers={
-                    "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise exceptions.GetTronTransactionException(
-                        error_status_code=response.status,
-                        error_text=await response.text(),
-                    )
+        transaction = cls._transactions.get(hash)
+        if transaction is not None:
+            return dict(transaction)
+
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json={
+                "jsonrpc": constants.TRON_JRPC_VERSION,
+                "method": constants.TRON_GET_TRANSACTION_BY_HASH_METHOD,
+                "params": [hash],
+                "id": random.randint(1, 1000000),
+            },
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            response_text = await response.text()
+            if response.status != 200:
+                raise exceptions.GetTronTransactionException(
+                    error_status_code=response.status,
+                    error_text=response_text,
+                )
 
-                data_json: dict = orjson.loads(await response.text())
+            data_json: dict = orjson.loads(response_text)
+
+        if "result" in data_json and data_json["result"] is None:
+            raise exceptions.TronTransactionNotFoundException(
+                error_status_code=response.status,
+                error_text=response_text,
+            )
 
         if data_json.get("result") is None:
             raise exceptions.GetTronTransactionException(
                 error_status_code=response.status,
-                error_text=await response.text(),
+                error_text=response_text,
+            )
+
+        # Транзакция в сети, но еще не включена в блок
+        if (
+            data_json["result"].get("blockHash") is None
+            or data_json["result"].get("blockNumber") is None
+        ):
+            raise exceptions.GetTronTransactionException(
+                error_status_code=response.status,
+                error_text=response_text,
             )
 
-        return {
+        transaction = {
             "hash": data_json["result"]["hash"],
             "from_address": data_json["result"]["from"],
             "to_address": data_json["result"]["to"],
@@ -196,9 +334,172 @@ class TronService:
             ),
         }
 
-    # MARK: Confirm
+        # Блок еще может быть отменен, такая транзакция не кэшируется
+        block_number = int(data_json["result"]["blockNumber"], 16)
+        if (
+            block_number
+            <= await cls.get_block_number() - constants.TRON_DEPOSIT_CONFIRMATIONS
+        ):
+            cls._transactions.set(hash, transaction)
+
+        return dict(transaction)
+
+    @staticmethod
+    async def get_block_number() -> int:
+        """
+        Получить номер последнего блока.
+
+        Returns:
+            Номер блока.
+
+        Raises:
+            GetTronBlockException: Ошибка при попытке получения блока с TronScan.
+        """
+
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json={
+                "jsonrpc": constants.TRON_JRPC_VERSION,
+                "method": constants.TRON_GET_BLOCK_NUMBER_METHOD,
+                "params": [],
+                "id": random.randint(1, 1000000),
+            },
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                raise exceptions.GetTronBlockException(
+                    error_status_code=response.status,
+                    error_text=await response.text(),
+                )
+
+            data_json: dict = orjson.loads(await response.read())
+
+        if data_json.get("result") is None:
+            raise exceptions.GetTronBlockException(
+                error_status_code=response.status,
+                error_text=str(data_json.get("error")),
+            )
+
+        return int(data_json["result"], 16)
+
+    @staticmethod
+    async def _get_blocks_batch(numbers: list[int]) -> list[dict]:
+        """
+        Получить блоки с транзакциями одним пакетным JSON-RPC запросом.
+
+        Args:
+            numbers: Номера блоков.
+
+        Returns:
+            Блоки в порядке номеров.
+
+        Raises:
+            GetTronBlockException:
+                Ошибка при попытке получения блока, блоки нельзя пропускать.
+        """
+
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_JRPC_API_URL,
+            json=[
+                {
+                    "jsonrpc": constants.TRON_JRPC_VERSION,
+                    "method": constants.TRON_GET_BLOCK_BY_NUMBER_METHOD,
+                    "params": [hex(number), True],
+                    "id": id,
+                }
+                for id, number in enumerate(numbers)
+            ],
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                raise exceptions.GetTronBlockException(
+                    error_status_code=response.status,
+                    error_text=await response.text(),
+                )
+
+            data_json = orjson.loads(await response.read())
+
+        if not isinstance(data_json, list):
+            raise exceptions.GetTronBlockException(
+                error_status_code=response.status,
+                error_text=str(data_json.get("error")),
+            )
+
+        blocks: list[dict | None] = [None] * len(numbers)
+        for item in data_json:
+            id = item.get("id")
+            if isinstance(id, int) and 0 <= id < len(numbers):
+                blocks[id] = item.get("result")
+
+        if None in blocks:
+            raise exceptions.GetTronBlockException(
+                error_status_code=response.status,
+                error_text=f"Блок {numbers[blocks.index(None)]} не получен",
+            )
+
+        return blocks
+
+    @classmethod
+    async def get_blocks_transfers(cls, numbers: list[int]) -> list[dict]:
+        """
+        Получить переводы TRX из блоков.
+        Блоки запрашиваются пакетными JSON-RPC запросами
+        по `TRON_JRPC_BATCH_SIZE` блоков.
+
+        Args:
+            numbers: Номера блоков.
+
+        Returns:
+            Список переводов в порядке блоков:
+                (hash, from_address, to_address, amount, created_at)
+
+        Raises:
+            GetTronBlockException: Ошибка при попытке получения блока с TronScan.
+        """
+
+        batches = await asyncio.gather(
+            *(
+                cls._get_blocks_batch(numbers[i : i + settings.TRON_JRPC_BATCH_SIZE])
+                for i in range(0, len(numbers), settings.TRON_JRPC_BATCH_SIZE)
+            )
+        )
+
+        transfers = []
+        for blocks in batches:
+            for block in blocks:
+                timestamp = int(block["timestamp"], 16)
+                cls._block_timestamps.set(block["hash"], timestamp)
+
+                for transaction in block.get("transactions") or []:
+                    # В блоке могут быть только хэши или вызовы без получателя
+                    if not isinstance(transaction, dict) or not transaction.get("to"):
+                        continue
+
+                    amount = int(transaction.get("value") or "0x0", 16)
+                    if not amount:
+                        continue
+
+                    transfers.append(
+                        {
+                            "hash": transaction["hash"],
+                            "from_address": transaction["from"],
+                            "to_address": transaction["to"],
+                            "amount": amount,
+                            "created_at": datetime.fromtimestamp(timestamp),
+                        }
+                    )
+
+        return transfers
+
+    # MARK: Pay out
     @staticmethod
-    async def _create_transaction(
+    async def create_transaction(
         from_address: str,
         to_address: str,
         amount: int,
@@ -219,37 +520,63 @@ class TronService:
                 Ошибка при попытке создать транзакцию с Tron API.
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                constants.TRON_CREATE_TRANSACTION_URL,
-                json={
-                    "owner_address": from_address,
-                    "to_address": to_address,
-                    "amount": amount,
-                    "visible": True,
-                },
-                headers={
-                    "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise exceptions.CreateTronTransactionException(
-                        error_status_code=response.status,
-                        error_text=await response.text(),
-                    )
-                data = orjson.loads(await response.text())
-
-            if data.get("Error"):
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_CREATE_TRANSACTION_URL,
+            json={
+                "owner_address": from_address,
+                "to_address": to_address,
+                "amount": amount,
+                "visible": True,
+            },
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
                 raise exceptions.CreateTronTransactionException(
-                    error_text=data.get("Error"),
+                    error_status_code=response.status,
+                    error_text=await response.text(),
                 )
+            data = orjson.loads(await response.text())
+
+        if data.get("Error"):
+            raise exceptions.CreateTronTransactionException(
+                error_status_code=response.status,
+                error_text=data.get("Error"),
+            )
 
-            return data
+        return data
 
-    @staticmethod
-    async def _sign_transaction(transaction: dict, private_key: str) -> dict:
+    @classmethod
+    def _get_private_key(cls, private_key: str) -> PrivateKey:
+        """
+        Получить объект приватного ключа из кэша, создав его при необходимости.
+        Создание объекта вычисляет публичный ключ, поэтому объекты кэшируются.
+
+        Args:
+            private_key: Приватный ключ в hex.
+
+        Returns:
+            Объект приватного ключа.
+        """
+
+        with cls._private_keys_lock:
+            key = cls._private_keys.get(private_key)
+
+        if key is None:
+            key = PrivateKey(bytes.fromhex(private_key))
+            with cls._private_keys_lock:
+                cls._private_keys.set(private_key, key)
+
+        return key
+
+    @classmethod
+    def sign_transaction(cls, transaction: dict, private_key: str) -> dict:
         """
         Подписание транзакции используя tronpy с приватным ключом.
+        Вычисление подписи занимает процессор, поэтому из асинхронного кода
+        транзакции подписываются через `sign_transactions` в пуле потоков.
 
         Args:
             transaction: Транзакция.
@@ -259,74 +586,116 @@ class TronService:
             Транзакция с подписью.
         """
 
-        private_key = PrivateKey(bytes.fromhex(private_key))
-
         msg_hash = hashlib.sha256(bytes.fromhex(transaction["raw_data_hex"])).digest()
-        signature = private_key.sign_msg_hash(msg_hash)
+        signature = cls._get_private_key(private_key).sign_msg_hash(msg_hash)
         transaction["signature"] = [signature.hex()]
 
         return transaction
 
-    @staticmethod
-    async def _broadcast_transaction(signed_transaction: dict) -> None:
+    @classmethod
+    def _sign_transactions_chunk(
+        cls, transactions: list[tuple[dict, str]]
+    ) -> list[dict]:
+        return [
+            cls.sign_transaction(transaction, private_key)
+            for transaction, private_key in transactions
+        ]
+
+    @classmethod
+    def _get_sign_executor(cls) -> ThreadPoolExecutor:
+        if cls._sign_executor is None:
+            cls._sign_executor = ThreadPoolExecutor(
+                max_workers=settings.TRON_SIGN_WORKERS,
+                thread_name_prefix="tron-sign",
+            )
+
+        return cls._sign_executor
+
+    @classmethod
+    async def sign_transactions(
+        cls,
+        transactions: list[tuple[dict, str]],
+    ) -> list[dict]:
         """
-        Отправка подписанной транзакции в сеть.
+        Подписать пачку транзакций в пуле из `TRON_SIGN_WORKERS` потоков.
+
+        Подпись вычисляется в C библиотеке secp256k1, которая отпускает GIL,
+        поэтому потоки подписывают параллельно и не блокируют event loop.
+        Пачка делится на части по числу потоков, чтобы не создавать
+        отдельную задачу пула на каждую транзакцию.
 
         Args:
-            signed_transaction: Подписанная транзакция.
+            transactions: Транзакции и приватные ключи для их подписи.
 
-        Raises:
-            BroadcastTronTransactionException:
-                Ошибка при попытке отправить транзакцию.
+        Returns:
+            Транзакции с подписью в исходном порядке.
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                constants.TRON_BROADCAST_TRANSACTION_URL,
-                json=signed_transaction,
-                headers={
-                    "TRON-PRO-API-KEY": settings.TRON_API_KEY,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise exceptions.BroadcastTronTransactionException(
-                        error_status_code=response.status,
-                        error_text=await response.text(),
-                    )
+        if not transactions:
+            return []
+
+        loop = asyncio.get_running_loop()
+        executor = cls._get_sign_executor()
+        chunk_size = -(-len(transactions) // settings.TRON_SIGN_WORKERS)
+
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    cls._sign_transactions_chunk,
+                    transactions[i : i + chunk_size],
+                )
+                for i in range(0, len(transactions), chunk_size)
+            )
+        )
+
+        return [transaction for chunk in chunks for transaction in chunk]
 
     @classmethod
-    async def create_and_sign_transaction(
-        cls,
-        from_address: str,
-        to_address: str,
-        amount: int,
-        private_key: str,
-    ) -> str:
+    def shutdown_sign_executor(cls) -> None:
+        """Остановить пул потоков подписи и очистить кэш ключей."""
+
+        if cls._sign_executor is not None:
+            cls._sign_executor.shutdown(wait=True)
+            cls._sign_executor = None
+
+        with cls._private_keys_lock:
+            cls._private_keys.clear()
+
+    @staticmethod
+    async def broadcast_transaction(signed_transaction: dict) -> None:
         """
-        Отправить и подписать транзакцию на блокчейне.
+        Отправка подписанной транзакции в сеть.
+        Повторная отправка уже принятой сетью транзакции считается успешной.
 
         Args:
-            from_address: Адрес отправителя.
-            to_address: Адрес получателя.
-            amount: Сумма транзакции.
-            private_key: Приватный ключ.
-
-        Returns:
-            Хэш транзакции.
+            signed_transaction: Подписанная транзакция.
 
         Raises:
-            CreateTronTransactionException:
-                Ошибка при попытке создать транзакцию.
             BroadcastTronTransactionException:
                 Ошибка при попытке отправить транзакцию.
         """
 
-        transaction = await cls._create_transaction(
-            from_address,
-            to_address,
-            amount,
-        )
-        signed_transaction = await cls._sign_transaction(transaction, private_key)
-        await cls._broadcast_transaction(signed_transaction)
+        session = HTTPClientService.get_session()
+        async with session.post(
+            constants.TRON_BROADCAST_TRANSACTION_URL,
+            json=signed_transaction,
+            headers={
+                "TRON-PRO-API-KEY": settings.TRON_API_KEY,
+            },
+        ) as response:
+            if response.status != 200:
+                raise exceptions.BroadcastTronTransactionException(
+                    error_status_code=response.status,
+                    error_text=await response.text(),
+                )
+            data = orjson.loads(await response.read())
 
-        return transaction["txID"]
+        if (
+            not data.get("result")
+            and data.get("code") != constants.TRON_DUPLICATE_TRANSACTION_CODE
+        ):
+            raise exceptions.BroadcastTronTransactionException(
+                error_status_code=response.status,
+                error_text=f"{data.get('code')}: {data.get('message')}",
+            )
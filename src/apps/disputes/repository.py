@@ -59,9 +59,6 @@ class DisputeRepository(
             )
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
@@ -5,14 +5,18 @@ from src.apps.disputes import constants as dispute_constants
 from src.apps.disputes import schemas
 from src.apps.disputes.model import DisputeModel, DisputeStatusEnum
 from src.apps.disputes.repository import DisputeRepository
+from src.apps.ledger import schemas as ledger_schemas
+from src.apps.ledger.model import LedgerEntryReasonEnum
+from src.apps.ledger.service import LedgerService
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
-from src.apps.transactions.model import TransactionStatusEnum
+from src.apps.traders.requisite_index import RequisiteIndexService
+from src.apps.transactions.model import TransactionModel, TransactionStatusEnum
 from src.apps.transactions.repository import TransactionRepository
 from src.apps.transactions.service import TransactionService
 from src.apps.users.model import UserModel
-from src.apps.users.repository import UserRepository
 from src.core import constants, exceptions
+from src.core.constants import RequisiteIndexEventEnum
 from src.libs.base.service import BaseService
 
 
@@ -63,7 +67,7 @@ class DisputeService(
 
         logger.info("Получение диспута по ID: {}, user_id: {}", id, user_id)
 
-        dispute_db = await cls.repository.get_one_or_none(
+        dispute_db = await cls.repository.get_by_id(
             session=session,
             id=id,
         )
@@ -74,7 +78,7 @@ class DisputeService(
             )
 
         if user_id:
-            transaction_db = await TransactionRepository.get_one_or_none(
+            transaction_db = await TransactionRepository.get_by_id(
                 session=session,
                 id=dispute_db.transaction_id,
             )
@@ -144,10 +148,15 @@ class DisputeService(
         transaction.status = TransactionStatusEnum.DISPUTED
 
         # Заморозка средств на счете трейдера
-        trader_db = await UserRepository.get_one_or_none(
-            session=session, id=transaction.trader_id
+        LedgerService.enqueue(
+            session=session,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=transaction.trader_id,
+                reason=LedgerEntryReasonEnum.DISPUTE,
+                amount_frozen_delta=transaction.amount,
+                transaction_id=transaction.id,
+            ),
         )
-        trader_db.amount_frozen += transaction.amount
 
         # Создание диспута в БД
         data = {
@@ -201,11 +210,11 @@ class DisputeService(
 
         logger.info("Обновление диспута: {}, trader_id: {}", id, trader_db.id)
 
-        dispute_db = await cls.repository.get_one_or_none(session=session, id=id)
+        dispute_db = await cls.repository.get_by_id(session=session, id=id)
         if not dispute_db or dispute_db.transaction.trader_id != trader_db.id:
             raise exceptions.NotFoundException(message=cls.not_found_exception_message)
 
-        transaction_db = await TransactionRepository.get_one_or_none(
+        transaction_db = await TransactionRepository.get_by_id(
             session=session, id=dispute_db.transaction_id
         )
 
@@ -217,20 +226,11 @@ class DisputeService(
 
         # Трейдер принимает вину
         if data.accept:
-            # Списание средств с трейдера
-            trader_db.amount_frozen -= transaction_db.amount
-            trader_db.balance -= (
-                transaction_db.amount
-                + transaction_db.amount * constants.TRADER_DISPUTE_PENALTY
-            )
-
-            # Пополнение баланса мерчанта
-            merchant_db = await UserRepository.get_one_or_none(
-                session=session, id=transaction_db.merchant_id
-            )
-            merchant_db.balance += (
-                transaction_db.amount
-                - transaction_db.amount * constants.MERCHANT_TRANSACTION_COMMISSION
+            # Списание средств с трейдера, пополнение баланса мерчанта
+            cls.enqueue_resolution(
+                session=session,
+                transaction_db=transaction_db,
+                is_merchant_winner=True,
             )
 
             # Закрытие диспута и транзакции
@@ -240,6 +240,8 @@ class DisputeService(
         await session.commit()
 
         if data.accept:
+            await cls.publish_requisite_free(transaction_db=transaction_db)
+
             # Отправление уведомления
             await NotificationService.create(
                 session=session,
@@ -281,7 +283,7 @@ class DisputeService(
             "Вынесение решения по диспуту: {}, winner_id: {}", id, data.winner_id
         )
 
-        dispute_db = await cls.repository.get_one_or_none(session=session, id=id)
+        dispute_db = await cls.repository.get_by_id(session=session, id=id)
         if (
             not dispute_db
             or dispute_db.status != DisputeStatusEnum.PENDING
@@ -295,41 +297,25 @@ class DisputeService(
                 code=cls.not_found_exception_code,
             )
 
-        transaction_db = await TransactionRepository.get_one_or_none(
+        transaction_db = await TransactionRepository.get_by_id(
             session=session, id=dispute_db.transaction_id
         )
-        trader_db = await UserRepository.get_one_or_none(
-            session=session, id=transaction_db.trader_id
-        )
-
-        if data.winner_id == dispute_db.transaction.trader_id:
-            trader_db.amount_frozen -= transaction_db.amount
-        elif data.winner_id == dispute_db.transaction.merchant_id:
-            # Пополнение баланса мерчанта
-            merchant_db = await UserRepository.get_one_or_none(
-                session=session, id=transaction_db.merchant_id
-            )
-            merchant_db.balance += (
-                transaction_db.amount
-                - transaction_db.amount * constants.MERCHANT_TRANSACTION_COMMISSION
-            )
 
-            # Списание средств с трейдера
-            trader_db.amount_frozen -= transaction_db.amount
-            trader_db.balance -= (
-                transaction_db.amount
-                + transaction_db.amount * constants.TRADER_DISPUTE_PENALTY
-            )
+        # Разморозка средств трейдера, а если победил мерчант,
+        # то пополнение его баланса и списание средств с трейдера
+        cls.enqueue_resolution(
+            session=session,
+            transaction_db=transaction_db,
+            is_merchant_winner=data.winner_id == dispute_db.transaction.merchant_id,
+        )
 
         # Закрытие диспута и транзакции
         dispute_db.status = DisputeStatusEnum.CLOSED
         transaction_db.status = TransactionStatusEnum.SUCCESS
         dispute_db.winner_id = data.winner_id
 
-        await session.commit()
-
         # Отправление уведомления
-        await NotificationService.create(
+        NotificationService.enqueue(
             session=session,
             data=notification_schemas.NotificationCreateSchema(
                 user_id=dispute_db.winner_id,
@@ -338,7 +324,7 @@ class DisputeService(
                 ),
             ),
         )
-        await NotificationService.create(
+        NotificationService.enqueue(
             session=session,
             data=notification_schemas.NotificationCreateSchema(
                 user_id=transaction_db.trader_id
@@ -349,3 +335,81 @@ class DisputeService(
                 ),
             ),
         )
+
+        await session.commit()
+
+        await cls.publish_requisite_free(transaction_db=transaction_db)
+
+    # MARK: Requisite index
+    @staticmethod
+    async def publish_requisite_free(transaction_db: TransactionModel) -> None:
+        """
+        Отметить реквизит транзакции свободным в индексе реквизитов.
+
+        Закрытый диспут больше не удерживает реквизит,
+        поэтому он снова доступен для подбора, не дожидаясь перезагрузки индекса.
+
+        Args:
+            transaction_db (TransactionModel): Транзакция закрытого диспута.
+        """
+
+        if transaction_db.requisite_id is None:
+            return
+
+        await RequisiteIndexService.publish(
+            event=RequisiteIndexEventEnum.FREE,
+            requisite_ids=[transaction_db.requisite_id],
+        )
+
+    # MARK: Ledger
+    @classmethod
+    def enqueue_resolution(
+        cls,
+        session: AsyncSession,
+        transaction_db: TransactionModel,
+        is_merchant_winner: bool,
+    ) -> None:
+        """
+        Добавить в журнал изменения балансов по решению диспута.
+        (Не создает коммит транзакции)
+
+        Средства трейдера, замороженные на время диспута, размораживаются.
+        Если победил мерчант, то с трейдера списывается сумма со штрафом,
+        а баланс мерчанта пополняется с учетом комиссии.
+
+        Args:
+            session (AsyncSession): Сессия БД.
+            transaction_db (TransactionModel): Транзакция диспута.
+            is_merchant_winner (bool): Победил ли мерчант.
+        """
+
+        trader_balance_delta = 0
+        if is_merchant_winner:
+            trader_balance_delta = -int(
+                transaction_db.amount
+                + transaction_db.amount * constants.TRADER_DISPUTE_PENALTY
+            )
+            LedgerService.enqueue(
+                session=session,
+                data=ledger_schemas.LedgerEntryCreateSchema(
+                    user_id=transaction_db.merchant_id,
+                    reason=LedgerEntryReasonEnum.DISPUTE,
+                    balance_delta=int(
+                        transaction_db.amount
+                        - transaction_db.amount
+                        * constants.MERCHANT_TRANSACTION_COMMISSION
+                    ),
+                    transaction_id=transaction_db.id,
+                ),
+            )
+
+        LedgerService.enqueue(
+            session=session,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=transaction_db.trader_id,
+                reason=LedgerEntryReasonEnum.DISPUTE,
+                balance_delta=trader_balance_delta,
+                amount_frozen_delta=-transaction_db.amount,
+                transaction_id=transaction_db.id,
+            ),
+        )
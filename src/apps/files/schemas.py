@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+
+from src.core import constants
+
+
+class FileListQuerySchema(BaseModel):
+    """Схема query параметров для постраничного получения файлов из S3."""
+
+    prefix: str | None = Field(
+        default=None,
+        description="Префикс ключей файлов, например `disputes/1/`.",
+    )
+    limit: int = Field(
+        default=constants.DEFAULT_QUERY_LIMIT,
+        ge=1,
+        le=constants.S3_LIST_MAX_KEYS,
+        description="Размер страницы.",
+    )
+    continuation_token: str | None = Field(
+        default=None,
+        description="Токен следующей страницы из предыдущего ответа.",
+    )
+
+
+class FileListSchema(BaseModel):
+    """Схема страницы файлов из S3."""
+
+    file_urls: list[str] = Field(
+        description="URL файлов страницы.",
+    )
+    next_continuation_token: str | None = Field(
+        default=None,
+        description="Токен следующей страницы, отсутствует на последней странице.",
+    )
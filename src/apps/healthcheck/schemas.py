@@ -11,3 +11,32 @@ class HealthCheckSchema(BaseModel):
     mode: Literal["DEV", "TEST", "PROD"] = settings.MODE
     version: str = settings.APP_VERSION
     status: str = "OK"
+
+
+class DatabasePoolStatsSchema(BaseModel):
+    """Схема ответа с состоянием пула соединений с БД."""
+
+    mode: Literal["queue", "null"]
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    connects: int
+    checkouts: int
+    checkins: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class RedisStatsSchema(BaseModel):
+    """Схема ответа с состоянием Redis и пула соединений."""
+
+    is_available: bool
+    ping_seconds: float | None
+    max_connections: int
+    in_use_connections: int
+    commands: int
+    errors: int
+    latency_seconds_total: float
+    latency_seconds_max: float
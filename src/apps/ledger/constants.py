@@ -0,0 +1,2 @@
+# Ключ `session.info` для очереди записей журнала текущей транзакции
+PENDING_LEDGER_ENTRIES_KEY = "pending_ledger_entries"
@@ -0,0 +1,60 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, text
+from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core import constants
+from src.core.database import Base
+
+
+class LedgerEntryReasonEnum(str, Enum):
+    OPENING = "начальный баланс"
+    RESERVE = "заморозка средств"
+    SETTLEMENT = "расчет по транзакции"
+    EXPIRATION = "отмена по истечении времени"
+    DISPUTE = "диспут"
+    DEPOSIT = "пополнение с блокчейна"
+    WITHDRAWAL = "вывод на блокчейн"
+
+
+class LedgerEntryModel(Base):
+    """
+    Запись журнала изменений баланса пользователя.
+
+    Записи только добавляются. `users.balance` и `users.amount_frozen`
+    являются агрегатом записей, в который уже свернуты записи
+    с заполненным `folded_at`.
+    """
+
+    __tablename__ = "ledger_entries"
+    __table_args__ = (
+        Index(
+            "ledger_entries_user_id_unfolded_idx",
+            "user_id",
+            postgresql_where=text("folded_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    balance_delta: Mapped[int] = mapped_column(default=0)
+    amount_frozen_delta: Mapped[int] = mapped_column(default=0)
+    reason: Mapped[LedgerEntryReasonEnum] = mapped_column(
+        SQLAlchemyEnum(LedgerEntryReasonEnum)
+    )
+    transaction_id: Mapped[int | None] = mapped_column(
+        ForeignKey("transactions.id"), nullable=True
+    )
+    blockchain_transaction_id: Mapped[int | None] = mapped_column(
+        ForeignKey("blockchain_transactions.id"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=constants.CURRENT_TIMESTAMP_UTC,
+    )
+    folded_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
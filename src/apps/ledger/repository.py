@@ -0,0 +1,183 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, ScalarSelect, Update, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.ledger import schemas
+from src.apps.ledger.model import LedgerEntryModel
+from src.apps.users.model import UserModel
+from src.libs.base.repository import BaseRepository
+
+
+class LedgerRepository(
+    BaseRepository[
+        LedgerEntryModel,
+        schemas.LedgerEntryCreateSchema,
+        schemas.LedgerEntryUpdateSchema,
+    ],
+):
+    """Репозиторий для работы с журналом изменений балансов."""
+
+    model = LedgerEntryModel
+
+    @classmethod
+    def get_unfolded_available_stmt(
+        cls,
+        user_id: ColumnElement[int] | int,
+    ) -> ScalarSelect[int]:
+        """
+        Создать подзапрос изменения свободных средств пользователя
+        по записям, еще не свернутым в `users.balance` и `users.amount_frozen`.
+
+        Args:
+            user_id: ID пользователя или колонка с ним для коррелированного запроса.
+
+        Returns:
+            ScalarSelect[int]: Подзапрос с суммой изменений.
+        """
+
+        return (
+            select(
+                func.coalesce(
+                    func.sum(cls.model.balance_delta - cls.model.amount_frozen_delta),
+                    0,
+                )
+            )
+            .where(
+                cls.model.user_id == user_id,
+                cls.model.folded_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+
+    @classmethod
+    def get_fold_stmt(
+        cls,
+        user_ids: list[int] | None = None,
+        limit: int | None = None,
+    ) -> Update:
+        """
+        Создать запрос свертки записей журнала в балансы пользователей.
+
+        Записи помечаются свернутыми и суммируются по пользователю
+        в одном запросе `WITH folded AS (UPDATE ... RETURNING) UPDATE users`.
+        Строки пользователей берутся с `FOR UPDATE SKIP LOCKED`:
+        пользователь, которого сейчас сворачивает другая транзакция,
+        пропускается и будет свернут позже, поэтому свертка никогда не ждет
+        блокировки горячей строки.
+
+        Args:
+            user_ids: ID пользователей, если `None` - все с несвернутыми записями.
+            limit: Максимальное количество записей в одной свертке.
+
+        Returns:
+            Update: Запрос, возвращающий ID и новые балансы пользователей.
+        """
+
+        users_stm = select(UserModel.id).with_for_update(skip_locked=True)
+        if user_ids is not None:
+            users_stm = users_stm.where(UserModel.id.in_(user_ids))
+        else:
+            users_stm = users_stm.where(
+                UserModel.id.in_(
+                    select(cls.model.user_id).where(cls.model.folded_at.is_(None))
+                )
+            )
+
+        entries_stm = (
+            select(cls.model.id)
+            .where(
+                cls.model.folded_at.is_(None),
+                cls.model.user_id.in_(users_stm),
+            )
+            .order_by(cls.model.id)
+        )
+        if limit is not None:
+            entries_stm = entries_stm.limit(limit)
+
+        # Повторная проверка `folded_at` во внешнем условии исключает
+        # двойную свертку записи, свернутой параллельной транзакцией
+        folded_cte = (
+            update(cls.model)
+            .where(
+                cls.model.id.in_(entries_stm),
+                cls.model.folded_at.is_(None),
+            )
+            .values(folded_at=func.now())
+            .returning(
+                cls.model.user_id,
+                cls.model.balance_delta,
+                cls.model.amount_frozen_delta,
+            )
+            .cte("folded")
+        )
+        totals = (
+            select(
+                folded_cte.c.user_id,
+                func.sum(folded_cte.c.balance_delta).label("balance_delta"),
+                func.sum(folded_cte.c.amount_frozen_delta).label("amount_frozen_delta"),
+            )
+            .group_by(folded_cte.c.user_id)
+            .subquery("totals")
+        )
+
+        return (
+            update(UserModel)
+            .where(UserModel.id == totals.c.user_id)
+            .values(
+                balance=UserModel.balance + totals.c.balance_delta,
+                amount_frozen=UserModel.amount_frozen + totals.c.amount_frozen_delta,
+            )
+            .returning(UserModel.id, UserModel.balance, UserModel.amount_frozen)
+            .execution_options(synchronize_session=False)
+        )
+
+    @classmethod
+    async def get_unfolded_available(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+    ) -> int:
+        """
+        Получить изменение свободных средств пользователя
+        по еще не свернутым записям журнала.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            user_id (int): ID пользователя.
+
+        Returns:
+            int: Сумма изменений.
+        """
+
+        result = await session.execute(
+            select(cls.get_unfolded_available_stmt(user_id=user_id))
+        )
+
+        return result.scalar_one()
+
+    @classmethod
+    async def fold(
+        cls,
+        session: AsyncSession,
+        user_ids: list[int] | None = None,
+        limit: int | None = None,
+    ) -> list[Any]:
+        """
+        Свернуть записи журнала в балансы пользователей.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            user_ids (list[int] | None): ID пользователей.
+            limit (int | None): Максимальное количество записей.
+
+        Returns:
+            list[Any]: ID и новые балансы свернутых пользователей.
+        """
+
+        result = await session.execute(
+            cls.get_fold_stmt(user_ids=user_ids, limit=limit)
+        )
+
+        return result.all()
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.apps.ledger.model import LedgerEntryReasonEnum
+
+
+class LedgerEntryCreateSchema(BaseModel):
+    user_id: int
+    reason: LedgerEntryReasonEnum
+    balance_delta: int = 0
+    amount_frozen_delta: int = 0
+    transaction_id: int | None = None
+    blockchain_transaction_id: int | None = None
+    folded_at: datetime | None = None
+
+
+class LedgerEntryUpdateSchema(BaseModel):
+    folded_at: datetime | None = None
@@ -0,0 +1,150 @@
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.apps.ledger import constants, schemas
+from src.apps.ledger.model import LedgerEntryModel
+from src.apps.ledger.repository import LedgerRepository
+from src.apps.users.model import UserModel
+
+
+class LedgerService:
+    """
+    Сервис для работы с журналом изменений балансов.
+
+    Изменения балансов записываются в журнал вставками без блокировки
+    строки пользователя. Записи сворачиваются в `users.balance`
+    и `users.amount_frozen` при коммите, если строка пользователя свободна,
+    и периодической задачей Celery для пропущенных пользователей.
+    Актуальный баланс - агрегат в `users` плюс несвернутые записи.
+    """
+
+    repository = LedgerRepository
+
+    # MARK: Batch
+    @classmethod
+    def enqueue(
+        cls,
+        session: AsyncSession,
+        data: schemas.LedgerEntryCreateSchema,
+    ) -> None:
+        """
+        Добавить запись журнала в очередь текущей транзакции сессии.
+
+        Записи из очереди вставляются одним многострочным INSERT
+        при ближайшем `session.commit()` и отбрасываются при `rollback`.
+        Запись с заполненным `folded_at` считается уже примененной
+        к балансу пользователя и не сворачивается повторно.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            data (LedgerEntryCreateSchema): Данные записи.
+        """
+
+        if not data.balance_delta and not data.amount_frozen_delta:
+            return
+
+        session.info.setdefault(constants.PENDING_LEDGER_ENTRIES_KEY, []).append(
+            data.model_dump()
+        )
+
+    # MARK: Get
+    @classmethod
+    async def get_available_amount(
+        cls,
+        session: AsyncSession,
+        user_db: UserModel,
+    ) -> int:
+        """
+        Получить актуальную сумму свободных средств пользователя
+        с учетом несвернутых записей журнала.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            user_db (UserModel): Пользователь.
+
+        Returns:
+            int: Свободные средства.
+        """
+
+        unfolded_available = await cls.repository.get_unfolded_available(
+            session=session,
+            user_id=user_db.id,
+        )
+
+        return user_db.balance - user_db.amount_frozen + unfolded_available
+
+    # MARK: Fold
+    @classmethod
+    async def fold(cls, session: AsyncSession, limit: int) -> int:
+        """
+        Свернуть пачку записей журнала в балансы пользователей.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            limit (int): Максимальное количество записей в пачке.
+
+        Returns:
+            int: Количество пользователей, балансы которых обновлены.
+        """
+
+        rows = await cls.repository.fold(session=session, limit=limit)
+        cls._set_balances(session=session.sync_session, rows=rows)
+
+        return len(rows)
+
+    @staticmethod
+    def _set_balances(session: Session, rows: list[Any]) -> None:
+        """
+        Обновить балансы загруженных в сессию пользователей после свертки,
+        не помечая их измененными.
+
+        Args:
+            session (Session): Синхронная сессия.
+            rows (list[Any]): ID и новые балансы пользователей.
+        """
+
+        for user_id, balance, amount_frozen in rows:
+            user_db = session.identity_map.get(session.identity_key(UserModel, user_id))
+            if user_db is None:
+                continue
+
+            set_committed_value(user_db, "balance", balance)
+            set_committed_value(user_db, "amount_frozen", amount_frozen)
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_pending_ledger_entries(session: Session) -> None:
+    pending = session.info.pop(constants.PENDING_LEDGER_ENTRIES_KEY, None)
+    if not pending:
+        return
+
+    # Изменения моделей должны попасть в БД раньше свертки балансов
+    session.flush()
+    session.execute(insert(LedgerEntryModel), pending)
+
+    user_ids = sorted(
+        {entry["user_id"] for entry in pending if entry["folded_at"] is None}
+    )
+    if not user_ids:
+        return
+
+    rows = session.execute(LedgerRepository.get_fold_stmt(user_ids=user_ids)).all()
+    LedgerService._set_balances(session=session, rows=rows)
+
+    if len(rows) < len(user_ids):
+        logger.debug(
+            "Свертка журнала отложена для {} пользователей",
+            len(user_ids) - len(rows),
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_ledger_entries(session: Session) -> None:
+    session.info.pop(constants.PENDING_LEDGER_ENTRIES_KEY, None)
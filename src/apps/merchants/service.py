@@ -1,11 +1,19 @@
+from datetime import datetime, timezone
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.ledger import schemas as ledger_schemas
+from src.apps.ledger.model import LedgerEntryReasonEnum
+from src.apps.ledger.service import LedgerService
 from src.apps.merchants import constants as merchant_constants
 from src.apps.merchants import schemas
+from src.apps.requisites.model import RequisiteModel
 from src.apps.requisites.repository import RequisiteRepository
+from src.apps.requisites.schemas import RequisiteIndexItemSchema
 from src.apps.requisites.service import RequisiteService
 from src.apps.traders.repository import TraderRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions import schemas as transaction_schemas
 from src.apps.transactions.model import (
     TransactionPaymentMethodEnum,
@@ -14,7 +22,10 @@ from src.apps.transactions.model import (
 from src.apps.transactions.repository import TransactionRepository
 from src.apps.transactions.service import TransactionService
 from src.apps.users.model import UserModel
+from src.apps.users.repository import UserRepository
 from src.core import constants, exceptions
+from src.core.constants import RequisiteIndexEventEnum
+from src.core.settings import settings
 
 
 class MerchantService:
@@ -80,21 +91,27 @@ class MerchantService:
                 code=cls.conflict_exception_code,
             )
 
-        # Получение трейдера и его реквизитов
-        trader_db, requisite_db = await TraderRepository.get_by_filters(
+        # Получение трейдера и его реквизитов с заморозкой средств трейдера
+        trader_db, requisite_db = await cls._reserve_trader_from_index(
             session=session,
-            payment_method=schema.payment_method,
-            amount=schema.amount,
-            bank_name=schema.bank_name,
-        ) or (None, None)
-        if not trader_db or not requisite_db:
-            raise exceptions.NotFoundException(
-                message=RequisiteService.not_found_exception_message,
-                code=RequisiteService.not_found_exception_code,
+            schema=schema,
+        )
+        if not trader_db:
+            trader_db, requisite_db = await cls._reserve_trader(
+                session=session,
+                schema=schema,
             )
 
-        # Заморозка средств трейдера
-        trader_db.amount_frozen += schema.amount
+        # Запись заморозки в журнал, сумма уже заморожена условным UPDATE
+        LedgerService.enqueue(
+            session=session,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=trader_db.id,
+                reason=LedgerEntryReasonEnum.RESERVE,
+                amount_frozen_delta=schema.amount,
+                folded_at=datetime.now(timezone.utc),
+            ),
+        )
 
         # Создание транзакции на перевод средств
         await TransactionService.create(
@@ -111,6 +128,11 @@ class MerchantService:
 
         await session.commit()
 
+        await RequisiteIndexService.publish(
+            event=RequisiteIndexEventEnum.BUSY,
+            requisite_ids=[requisite_db.id],
+        )
+
         # Возвращение ответа с реквизитами для оплаты
         if schema.payment_method == TransactionPaymentMethodEnum.CARD:
             return schemas.MerchantPayInResponseCardSchema(
@@ -125,6 +147,98 @@ class MerchantService:
                 bank_name=requisite_db.bank_name,
             )
 
+    @classmethod
+    async def _reserve_trader_from_index(
+        cls,
+        session: AsyncSession,
+        schema: schemas.MerchantPayInRequestSchema,
+    ) -> tuple[UserModel | None, RequisiteIndexItemSchema | None]:
+        """
+        Подобрать трейдера по индексу реквизитов в памяти
+        и заморозить его средства условным UPDATE.
+
+        Кандидаты перебираются в порядке приоритета, пока резервирование
+        не пройдет или не закончатся попытки.
+
+        Args:
+            session: Сессия базы данных.
+            schema: Схема запроса на пополнение баланса.
+
+        Returns:
+            Трейдер и его реквизиты или `(None, None)`,
+            если индекс выключен или подходящий кандидат не найден.
+        """
+
+        if not settings.REQUISITE_INDEX_ENABLED:
+            return None, None
+
+        candidates = await RequisiteIndexService.get_candidates(
+            session=session,
+            payment_method=schema.payment_method,
+            amount=schema.amount,
+            bank_name=schema.bank_name,
+        )
+        for requisite in candidates:
+            trader_db = await TraderRepository.reserve_amount(
+                session=session,
+                trader_id=requisite.user_id,
+                requisite_id=requisite.id,
+                amount=schema.amount,
+            )
+            if trader_db:
+                return trader_db, requisite
+
+        return None, None
+
+    @classmethod
+    async def _reserve_trader(
+        cls,
+        session: AsyncSession,
+        schema: schemas.MerchantPayInRequestSchema,
+    ) -> tuple[UserModel, RequisiteModel]:
+        """
+        Подобрать трейдера запросом в БД и заморозить его средства условным UPDATE.
+
+        Между подбором и заморозкой трейдера может занять параллельный запрос,
+        тогда подбор повторяется, но не более `TRADER_RESERVE_MAX_ATTEMPTS` раз.
+        Одновременное создание двух пополнений по одним реквизитам исключается
+        уникальным индексом `transactions_requisite_id_pending_pay_in_key`.
+
+        Args:
+            session: Сессия базы данных.
+            schema: Схема запроса на пополнение баланса.
+
+        Returns:
+            Трейдер и его реквизиты.
+
+        Raises:
+            NotFoundException: Нет свободных трейдеров с такими реквизитами.
+        """
+
+        for _ in range(constants.TRADER_RESERVE_MAX_ATTEMPTS):
+            trader_db, requisite_db = await TraderRepository.get_by_filters(
+                session=session,
+                payment_method=schema.payment_method,
+                amount=schema.amount,
+                bank_name=schema.bank_name,
+            ) or (None, None)
+            if not trader_db or not requisite_db:
+                break
+
+            trader_db = await TraderRepository.reserve_amount(
+                session=session,
+                trader_id=trader_db.id,
+                requisite_id=requisite_db.id,
+                amount=schema.amount,
+            )
+            if trader_db:
+                return trader_db, requisite_db
+
+        raise exceptions.NotFoundException(
+            message=RequisiteService.not_found_exception_message,
+            code=RequisiteService.not_found_exception_code,
+        )
+
     # MARK: Pay out
     @classmethod
     async def request_pay_out(
@@ -138,7 +252,8 @@ class MerchantService:
 
         Если есть досточное количество денег на балансе,
         то находится трейдер с похожими реквизитами и с достаточным балансом,
-        замораживаются средства трейдера, создается транзакция на перевод средств.
+        средства мерчанта замораживаются условным UPDATE,
+        создается транзакция на перевод средств.
 
         Args:
             session: Сессия базы данных.
@@ -162,9 +277,15 @@ class MerchantService:
             schema.amount,
         )
 
+        required_amount = (
+            schema.amount + schema.amount * constants.MERCHANT_TRANSACTION_COMMISSION
+        )
         if (
-            merchant_db.balance - merchant_db.amount_frozen
-            < schema.amount + schema.amount * constants.MERCHANT_TRANSACTION_COMMISSION
+            await LedgerService.get_available_amount(
+                session=session,
+                user_db=merchant_db,
+            )
+            < required_amount
         ):
             raise exceptions.ConflictException(
                 message=cls.not_enough_balance_exception_message,
@@ -183,7 +304,7 @@ class MerchantService:
             )
 
         # Получение реквезитов мерчанта
-        requisite_merchant_db = await RequisiteRepository.get_one_or_none(
+        requisite_merchant_db = await RequisiteRepository.get_by_id(
             session=session,
             id=schema.requisite_id,
         )
@@ -206,8 +327,29 @@ class MerchantService:
                 code=RequisiteService.not_found_exception_code,
             )
 
-        # Заморозка средств трейдера
-        merchant_db.amount_frozen += schema.amount
+        # Заморозка средств мерчанта условным UPDATE: параллельный вывод
+        #   мог занять средства после проверки баланса
+        if not await UserRepository.reserve_amount(
+            session=session,
+            user_id=merchant_db.id,
+            amount=schema.amount,
+            required_amount=required_amount,
+        ):
+            raise exceptions.ConflictException(
+                message=cls.not_enough_balance_exception_message,
+                code=cls.not_enough_balance_exception_code,
+            )
+
+        # Запись заморозки в журнал, сумма уже заморожена условным UPDATE
+        LedgerService.enqueue(
+            session=session,
+            data=ledger_schemas.LedgerEntryCreateSchema(
+                user_id=merchant_db.id,
+                reason=LedgerEntryReasonEnum.RESERVE,
+                amount_frozen_delta=schema.amount,
+                folded_at=datetime.now(timezone.utc),
+            ),
+        )
 
         # Создание транзакции на перевод средств
         await TransactionService.create(
@@ -6,3 +6,6 @@ NOT_FOUND_EXCEPTION_MESSAGE, NOT_FOUND_EXCEPTION_CODE = (
     "Уведомления не найдены.",
     7002,
 )
+
+# Ключ `session.info` для очереди уведомлений текущей транзакции
+PENDING_NOTIFICATIONS_KEY = "pending_notifications"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -8,6 +8,7 @@ from src.core.database import Base
 
 class NotificationModel(Base):
     __tablename__ = "notifications"
+    __table_args__ = (Index("notifications_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(autoincrement=True, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
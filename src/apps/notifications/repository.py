@@ -48,10 +48,7 @@ class NotificationRepository(
             )
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(NotificationModel.created_at.desc())
-        else:
-            stmt = stmt.order_by(NotificationModel.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
 
@@ -1,3 +1,7 @@
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from src.apps.notifications import constants, schemas
 from src.apps.notifications.model import NotificationModel
 from src.apps.notifications.repository import NotificationRepository
@@ -25,3 +29,38 @@ class NotificationService(
         constants.CONFLICT_EXCEPTION_MESSAGE,
         constants.CONFLICT_EXCEPTION_CODE,
     )
+
+    # MARK: Batch
+    @classmethod
+    def enqueue(
+        cls,
+        session: AsyncSession,
+        data: schemas.NotificationCreateSchema,
+    ) -> None:
+        """
+        Добавить уведомление в очередь текущей транзакции сессии.
+
+        Уведомления из очереди вставляются одним многострочным INSERT
+        при ближайшем `session.commit()` и отбрасываются при `rollback`.
+        (Не создает коммит транзакции)
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            data (NotificationCreateSchema): Данные уведомления.
+        """
+
+        session.info.setdefault(constants.PENDING_NOTIFICATIONS_KEY, []).append(
+            data.model_dump()
+        )
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_pending_notifications(session: Session) -> None:
+    pending = session.info.pop(constants.PENDING_NOTIFICATIONS_KEY, None)
+    if pending:
+        session.execute(insert(NotificationModel), pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_notifications(session: Session) -> None:
+    session.info.pop(constants.PENDING_NOTIFICATIONS_KEY, None)
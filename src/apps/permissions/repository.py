@@ -42,9 +42,6 @@ class PermissionRepository(
             stmt = stmt.where(cls.model.name.ilike(f"%{query_params.name}%"))
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
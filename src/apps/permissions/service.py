@@ -4,6 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.permissions import constants, schemas
 from src.apps.permissions.model import PermissionModel
 from src.apps.permissions.repository import PermissionRepository
+from src.apps.users_permissions.permissions_cache import UserPermissionsCacheService
+from src.apps.users_permissions.repository import UsersPermissionsRepository
 from src.libs.base.service import BaseService
 
 
@@ -72,3 +74,61 @@ class PermissionService(
         )
 
         return permissions
+
+    # MARK: Update
+    @classmethod
+    async def update(
+        cls,
+        session: AsyncSession,
+        id: int,
+        data: schemas.PermissionCreateSchema,
+    ) -> schemas.PermissionGetSchema:
+        """
+        Обновить разрешение и удалить из кэша разрешения его пользователей.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            id (int): ID разрешения.
+            data (PermissionCreateSchema): Данные для обновления.
+
+        Returns:
+            PermissionGetSchema: Обновленное разрешение.
+
+        Raises:
+            NotFoundException: Разрешение не найдено.
+            ConflictException: Разрешение с такими данными уже существует.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователей.
+        """
+
+        permission = await super().update(session, id, data)
+
+        await UserPermissionsCacheService.invalidate(
+            await UsersPermissionsRepository.get_user_ids(session, id)
+        )
+
+        return permission
+
+    # MARK: Delete
+    @classmethod
+    async def delete(
+        cls,
+        session: AsyncSession,
+        id: int,
+    ) -> None:
+        """
+        Удалить разрешение и удалить из кэша разрешения его пользователей.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            id (int): ID разрешения.
+
+        Raises:
+            NotFoundException: Разрешение не найдено.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователей.
+        """
+
+        user_ids = await UsersPermissionsRepository.get_user_ids(session, id)
+
+        await super().delete(session, id)
+
+        await UserPermissionsCacheService.invalidate(user_ids)
@@ -44,9 +44,6 @@ class RegexRepository(
             stmt = stmt.where(cls.model.is_card == query_params.is_card)
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -8,6 +8,21 @@ from src.core.database import Base
 
 class RequisiteModel(Base):
     __tablename__ = "requisites"
+    __table_args__ = (
+        Index(
+            "requisites_card_user_id_priority_idx",
+            "user_id",
+            text("priority DESC"),
+            postgresql_where=text("card_number IS NOT NULL"),
+        ),
+        Index(
+            "requisites_sbp_user_id_bank_name_priority_idx",
+            "user_id",
+            "bank_name",
+            text("priority DESC"),
+            postgresql_where=text("phone_number IS NOT NULL AND bank_name IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
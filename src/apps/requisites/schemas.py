@@ -82,3 +82,23 @@ class RequisiteUpdateAdminSchema(RequisiteUpdateSchema):
 
 class RequisitePaginationAdminSchema(RequisitePaginationSchema):
     user_id: int | None = None
+
+
+class RequisiteIndexItemSchema(BaseModel):
+    """Снимок реквизита для индекса подбора трейдера в памяти процесса."""
+
+    id: int
+    user_id: int
+    priority: int
+    full_name: str
+
+    phone_number: str | None = None
+    bank_name: str | None = None
+    card_number: str | None = None
+
+    min_amount: int | None = None
+    max_amount: int | None = None
+
+    class Config:
+        from_attributes = True
+        frozen = True
@@ -3,8 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.requisites import constants, schemas
 from src.apps.requisites.model import RequisiteModel
 from src.apps.requisites.repository import RequisiteRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.users.model import UserModel
 from src.core import exceptions
+from src.core.constants import RequisiteIndexEventEnum
 from src.libs.base.service import BaseService
 
 
@@ -30,6 +32,32 @@ class RequisiteService(
         constants.CONFLICT_EXCEPTION_CODE,
     )
 
+    # MARK: Create
+    @classmethod
+    async def create(
+        cls,
+        session: AsyncSession,
+        data: schemas.RequisiteCreateAdminSchema,
+    ) -> schemas.RequisiteGetSchema:
+        """
+        Создать реквизиты.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            data (schemas.RequisiteCreateAdminSchema): Данные для создания.
+
+        Returns:
+            schemas.RequisiteGetSchema: Реквизиты.
+
+        Raises:
+            ConflictException: Конфликт при создании.
+        """
+        requisite = await super().create(session, data)
+
+        await RequisiteIndexService.publish(event=RequisiteIndexEventEnum.RELOAD)
+
+        return requisite
+
     # MARK: Get
     @classmethod
     async def get_by_id(
@@ -99,7 +127,11 @@ class RequisiteService(
                 code=cls.not_found_exception_code,
             )
 
-        return await super().update(session, id, data)
+        requisite = await super().update(session, id, data)
+
+        await RequisiteIndexService.publish(event=RequisiteIndexEventEnum.RELOAD)
+
+        return requisite
 
     # MARK: Delete
     @classmethod
@@ -131,3 +163,5 @@ class RequisiteService(
             )
 
         await super().delete(session, id)
+
+        await RequisiteIndexService.publish(event=RequisiteIndexEventEnum.RELOAD)
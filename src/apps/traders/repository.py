@@ -1,6 +1,7 @@
-from sqlalchemy import Row, and_, not_, or_, select
+from sqlalchemy import Row, and_, exists, literal, not_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.ledger.repository import LedgerRepository
 from src.apps.requisites.model import RequisiteModel
 from src.apps.transactions.model import (
     TransactionModel,
@@ -8,7 +9,9 @@ from src.apps.transactions.model import (
     TransactionStatusEnum,
 )
 from src.apps.users.model import UserModel
+from src.apps.users.repository import UserRepository
 from src.apps.users.schemas import user_schemas
+from src.core.constants import UserLoadProfileEnum
 from src.libs.base.repository import BaseRepository
 
 
@@ -36,7 +39,18 @@ class TraderRepository(
     ) -> Row[tuple[UserModel, RequisiteModel]] | None:
         """
         Получить трейдера по методу оплаты,
-        у которого нет транзакций в процессе обработки.
+        у которого нет транзакций в процессе обработки
+        и достаточно свободных средств с учетом несвернутых записей журнала.
+
+        Подбирается одна пара (трейдер, реквизит) с наибольшими приоритетами,
+        трейдер загружается профилем `MINIMAL`.
+        Запрос рассчитан на частичные индексы:
+            - `users_active_priority_idx`: активные трейдеры по приоритету;
+            - `requisites_card_user_id_priority_idx`
+              и `requisites_sbp_user_id_bank_name_priority_idx`:
+              реквизиты трейдера для метода оплаты по приоритету;
+            - `transactions_requisite_id_pending_idx`:
+              проверка отсутствия транзакции в процессе обработки.
 
         Args:
             session: Сессия для работы с БД.
@@ -46,20 +60,15 @@ class TraderRepository(
 
         Returns:
             Row[tuple[UserModel, RequisiteModel]] | None: Трейдер и его реквизиты.
-
-        Raises:
-            NotFoundException: Тренер с таким методом оплаты не найден.
         """
 
         # Фильтрация по методу оплаты
         if payment_method == TransactionPaymentMethodEnum.CARD:
-            payment_method_stmt = not_(RequisiteModel.card_number.is_(None))
+            payment_method_stmt = RequisiteModel.card_number.isnot(None)
         else:
-            payment_method_stmt = not_(
-                or_(
-                    RequisiteModel.phone_number.is_(None),
-                    RequisiteModel.bank_name.is_(None),
-                )
+            payment_method_stmt = and_(
+                RequisiteModel.phone_number.isnot(None),
+                RequisiteModel.bank_name.isnot(None),
             )
 
         # Фильтрация по банку
@@ -70,17 +79,29 @@ class TraderRepository(
             )
 
         # Определение условия для фильтрации по реквизитам,
-        #   которые не находятся в процессе обработки
-        requisite_not_pending_stm = RequisiteModel.id.notin_(
-            select(TransactionModel.requisite_id).where(
-                TransactionModel.status == TransactionStatusEnum.PENDING.value
+        #   которые не находятся в процессе обработки.
+        #   Статус подставляется литералом, иначе планировщик
+        #   не сможет использовать частичный индекс по статусу.
+        requisite_not_pending_stm = not_(
+            exists().where(
+                TransactionModel.requisite_id == RequisiteModel.id,
+                TransactionModel.status
+                == literal(
+                    TransactionStatusEnum.PENDING,
+                    TransactionModel.status.type,
+                    literal_execute=True,
+                ),
             )
         )
 
-        # Определение условий для фильтрации по трейдеру
+        # Определение условий для фильтрации по трейдеру,
+        #   свободные средства считаются так же, как в `reserve_amount`.
         trader_checks = [
             cls.model.is_active,
-            cls.model.balance - cls.model.amount_frozen >= amount,
+            cls.model.balance
+            - cls.model.amount_frozen
+            + LedgerRepository.get_unfolded_available_stmt(user_id=cls.model.id)
+            >= amount,
         ]
 
         # Определение условий для фильтрации по сумме транзакции,
@@ -98,18 +119,101 @@ class TraderRepository(
 
         stmt = (
             select(cls.model, RequisiteModel)
-            .outerjoin(cls.model.trader_transactions)
+            .join(RequisiteModel, RequisiteModel.user_id == cls.model.id)
             .where(
-                and_(
-                    payment_method_stmt,
-                    requisite_not_pending_stm,
-                    *trader_checks,
-                    *requisite_amount_checks,
-                )
+                payment_method_stmt,
+                requisite_not_pending_stm,
+                *trader_checks,
+                *requisite_amount_checks,
+            )
+            .order_by(
+                cls.model.priority.desc(),
+                cls.model.id,
+                RequisiteModel.priority.desc(),
+                RequisiteModel.id,
             )
-            .order_by(cls.model.priority.desc())
-            .order_by(RequisiteModel.priority.desc())
+            .limit(1)
+            .options(*UserRepository.get_load_options(UserLoadProfileEnum.MINIMAL))
         )
         result = await session.execute(stmt)
 
         return result.first()
+
+    @classmethod
+    async def get_active_requisites(
+        cls,
+        session: AsyncSession,
+    ) -> list[Row[tuple[RequisiteModel, int]]]:
+        """
+        Получить реквизиты активных трейдеров вместе с приоритетом трейдера.
+
+        Args:
+            session: Сессия для работы с БД.
+
+        Returns:
+            list[Row[tuple[RequisiteModel, int]]]: Реквизиты и приоритет трейдера.
+        """
+
+        stmt = (
+            select(RequisiteModel, cls.model.priority)
+            .join(cls.model, RequisiteModel.user_id == cls.model.id)
+            .where(cls.model.is_active)
+        )
+        result = await session.execute(stmt)
+
+        return result.all()
+
+    @classmethod
+    async def reserve_amount(
+        cls,
+        session: AsyncSession,
+        trader_id: int,
+        requisite_id: int,
+        amount: int,
+    ) -> UserModel | None:
+        """
+        Заморозить сумму на балансе трейдера одним условным UPDATE,
+        если трейдер активен, у него достаточно свободных средств
+        с учетом несвернутых записей журнала
+        и по реквизиту нет транзакции в процессе обработки.
+
+        Args:
+            session: Сессия для работы с БД.
+            trader_id: ID трейдера.
+            requisite_id: ID реквизита трейдера.
+            amount: Сумма для заморозки.
+
+        Returns:
+            UserModel | None: Трейдер, загруженный профилем `MINIMAL`,
+                или `None`, если условия не выполнены.
+        """
+
+        requisite_pending_stm = exists().where(
+            TransactionModel.requisite_id == requisite_id,
+            TransactionModel.status
+            == literal(
+                TransactionStatusEnum.PENDING,
+                TransactionModel.status.type,
+                literal_execute=True,
+            ),
+        )
+
+        stmt = (
+            update(cls.model)
+            .where(
+                cls.model.id == trader_id,
+                cls.model.is_active,
+                cls.model.balance
+                - cls.model.amount_frozen
+                + LedgerRepository.get_unfolded_available_stmt(user_id=cls.model.id)
+                >= amount,
+                not_(requisite_pending_stm),
+            )
+            .values(amount_frozen=cls.model.amount_frozen + amount)
+            .returning(cls.model)
+            .options(*UserRepository.get_load_options(UserLoadProfileEnum.MINIMAL))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await session.execute(stmt)
+
+        return result.scalars().one_or_none()
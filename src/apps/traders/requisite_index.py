@@ -0,0 +1,292 @@
+import asyncio
+import bisect
+import time
+
+import orjson
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.requisites.schemas import RequisiteIndexItemSchema
+from src.apps.traders.repository import TraderRepository
+from src.apps.transactions.model import TransactionPaymentMethodEnum
+from src.apps.transactions.repository import TransactionRepository
+from src.core import constants
+from src.core.constants import RequisiteIndexEventEnum
+from src.core.settings import settings
+from src.libs.services.redis_service import RedisService
+
+BucketKey = tuple[TransactionPaymentMethodEnum, str | None, int]
+
+
+class RequisiteIndexService:
+    """
+    Индекс реквизитов активных трейдеров в памяти процесса.
+
+    Реквизиты разложены по корзинам (метод оплаты, банк, диапазон суммы)
+    и отсортированы так же, как в `TraderRepository.get_by_filters`:
+    по приоритету трейдера, затем по приоритету реквизита.
+    Реквизиты с транзакциями в процессе обработки хранятся отдельным множеством.
+
+    Индекс является подсказкой: выбранный кандидат всегда подтверждается
+    условным UPDATE в БД (`TraderRepository.reserve_amount`).
+    Согласованность между процессами поддерживается событиями
+    в Redis канале `REQUISITE_INDEX_CHANNEL` и полной перезагрузкой
+    не реже чем раз в `REQUISITE_INDEX_TTL` секунд.
+    """
+
+    _buckets: dict[BucketKey, list[RequisiteIndexItemSchema]] = {}
+    _busy_requisite_ids: set[int] = set()
+    _loaded_at: float | None = None
+    _lock = asyncio.Lock()
+
+    # MARK: Utils
+    @staticmethod
+    def _get_band(amount: int) -> int:
+        """
+        Получить номер диапазона суммы по границам `REQUISITE_INDEX_AMOUNT_BANDS`.
+
+        Args:
+            amount (int): Сумма.
+
+        Returns:
+            int: Номер диапазона.
+        """
+
+        return bisect.bisect_left(constants.REQUISITE_INDEX_AMOUNT_BANDS, amount)
+
+    @classmethod
+    def _get_bucket_keys(cls, requisite: RequisiteIndexItemSchema) -> list[BucketKey]:
+        """
+        Получить ключи всех корзин, в которые попадает реквизит.
+
+        Реквизит с банком попадает и в корзину без банка,
+        так как подбор может выполняться без указания банка.
+
+        Args:
+            requisite (RequisiteIndexItemSchema): Реквизит.
+
+        Returns:
+            list[BucketKey]: Ключи корзин.
+        """
+
+        payment_methods = []
+        if requisite.card_number is not None:
+            payment_methods.append(TransactionPaymentMethodEnum.CARD)
+        if requisite.phone_number is not None and requisite.bank_name is not None:
+            payment_methods.append(TransactionPaymentMethodEnum.SBP)
+
+        bank_names = [None]
+        if requisite.bank_name is not None:
+            bank_names.append(requisite.bank_name)
+
+        min_band = cls._get_band(requisite.min_amount or 0)
+        max_band = (
+            cls._get_band(requisite.max_amount)
+            if requisite.max_amount is not None
+            else len(constants.REQUISITE_INDEX_AMOUNT_BANDS)
+        )
+
+        return [
+            (payment_method, bank_name, band)
+            for payment_method in payment_methods
+            for bank_name in bank_names
+            for band in range(min_band, max_band + 1)
+        ]
+
+    @classmethod
+    def _is_stale(cls) -> bool:
+        return (
+            cls._loaded_at is None
+            or time.monotonic() - cls._loaded_at > constants.REQUISITE_INDEX_TTL
+        )
+
+    # MARK: Load
+    @classmethod
+    async def reload(cls, session: AsyncSession) -> None:
+        """
+        Перестроить индекс по данным из БД.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+        """
+
+        async with cls._lock:
+            if not cls._is_stale():
+                return
+
+            started_at = time.perf_counter()
+            rows = await TraderRepository.get_active_requisites(session=session)
+            busy_requisite_ids = await TransactionRepository.get_pending_requisite_ids(
+                session=session,
+            )
+
+            keyed_buckets: dict[BucketKey, list[tuple]] = {}
+            for requisite_db, user_priority in rows:
+                # Снимок не привязан к сессии запроса
+                requisite = RequisiteIndexItemSchema.model_validate(requisite_db)
+                sort_key = (
+                    -user_priority,
+                    requisite.user_id,
+                    -requisite.priority,
+                    requisite.id,
+                )
+                for key in cls._get_bucket_keys(requisite):
+                    keyed_buckets.setdefault(key, []).append((sort_key, requisite))
+
+            cls._buckets = {
+                key: [
+                    requisite
+                    for _, requisite in sorted(items, key=lambda item: item[0])
+                ]
+                for key, items in keyed_buckets.items()
+            }
+            cls._busy_requisite_ids = set(busy_requisite_ids)
+            cls._loaded_at = time.monotonic()
+
+            logger.info(
+                "Индекс реквизитов перестроен: {} реквизитов за {:.3f} с",
+                len(rows),
+                time.perf_counter() - started_at,
+            )
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Пометить индекс устаревшим, он будет перестроен при следующем подборе."""
+
+        cls._loaded_at = None
+
+    # MARK: Get
+    @classmethod
+    async def get_candidates(
+        cls,
+        session: AsyncSession,
+        payment_method: TransactionPaymentMethodEnum,
+        amount: int,
+        bank_name: str | None = None,
+        limit: int = constants.REQUISITE_INDEX_MAX_ATTEMPTS,
+    ) -> list[RequisiteIndexItemSchema]:
+        """
+        Получить свободные реквизиты, подходящие для транзакции,
+        в порядке приоритета.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            payment_method (TransactionPaymentMethodEnum): Метод оплаты.
+            amount (int): Сумма транзакции.
+            bank_name (str | None): Название банка.
+            limit (int): Максимальное количество кандидатов.
+
+        Returns:
+            list[RequisiteIndexItemSchema]: Реквизиты-кандидаты.
+        """
+
+        if cls._is_stale():
+            await cls.reload(session=session)
+
+        bucket = cls._buckets.get(
+            (payment_method, bank_name or None, cls._get_band(amount)),
+            [],
+        )
+
+        candidates = []
+        for requisite in bucket:
+            if (
+                requisite.id in cls._busy_requisite_ids
+                or (requisite.min_amount is not None and amount < requisite.min_amount)
+                or (requisite.max_amount is not None and amount > requisite.max_amount)
+            ):
+                continue
+
+            candidates.append(requisite)
+            if len(candidates) >= limit:
+                break
+
+        return candidates
+
+    # MARK: Events
+    @classmethod
+    def apply(
+        cls,
+        event: RequisiteIndexEventEnum,
+        requisite_ids: list[int] | None = None,
+    ) -> None:
+        """
+        Применить событие к индексу текущего процесса.
+
+        Args:
+            event (RequisiteIndexEventEnum): Событие.
+            requisite_ids (list[int] | None): ID реквизитов для BUSY и FREE.
+        """
+
+        if event == RequisiteIndexEventEnum.BUSY:
+            cls._busy_requisite_ids.update(requisite_ids or [])
+        elif event == RequisiteIndexEventEnum.FREE:
+            cls._busy_requisite_ids.difference_update(requisite_ids or [])
+        else:
+            cls.invalidate()
+
+    @classmethod
+    async def publish(
+        cls,
+        event: RequisiteIndexEventEnum,
+        requisite_ids: list[int] | None = None,
+    ) -> None:
+        """
+        Применить событие локально и разослать его остальным процессам.
+        Вызывается после коммита изменений.
+
+        Ошибка Redis не прерывает запрос: остальные процессы
+        догонят состояние при плановой перезагрузке индекса.
+
+        Args:
+            event (RequisiteIndexEventEnum): Событие.
+            requisite_ids (list[int] | None): ID реквизитов для BUSY и FREE.
+        """
+
+        if not settings.REQUISITE_INDEX_ENABLED:
+            return
+
+        cls.apply(event=event, requisite_ids=requisite_ids)
+
+        try:
+            await RedisService.publish(
+                constants.REQUISITE_INDEX_CHANNEL,
+                orjson.dumps({"event": event, "requisite_ids": requisite_ids}).decode(),
+            )
+        except Exception as ex:
+            logger.warning("Не удалось опубликовать событие индекса: {}", ex)
+
+    @classmethod
+    async def listen(cls) -> None:
+        """
+        Слушать события индекса от других процессов до отмены задачи.
+        При переподключении индекс перестраивается, так как события
+        за время разрыва могли быть потеряны.
+        """
+
+        while True:
+            pubsub = RedisService.pubsub()
+            try:
+                await pubsub.subscribe(constants.REQUISITE_INDEX_CHANNEL)
+                cls.invalidate()
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    data = orjson.loads(message["data"])
+                    cls.apply(
+                        event=RequisiteIndexEventEnum(data["event"]),
+                        requisite_ids=data.get("requisite_ids"),
+                    )
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as ex:
+                logger.warning("Подписка на события индекса прервана: {}", ex)
+                cls.invalidate()
+                await asyncio.sleep(1)
+
+            finally:
+                await pubsub.aclose()
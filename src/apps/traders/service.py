@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions.model import (
     TransactionStatusEnum,
     TransactionTypeEnum,
@@ -11,6 +12,7 @@ from src.apps.transactions.repository import TransactionRepository
 from src.apps.transactions.service import TransactionService
 from src.apps.users.model import UserModel
 from src.core import constants, exceptions
+from src.core.constants import RequisiteIndexEventEnum
 
 
 class TraderService:
@@ -62,13 +64,10 @@ class TraderService:
         await TransactionService.update_users_balances(
             session=session,
             transaction_db=transaction_db,
-            trader_db=trader_db,
         )
 
-        await session.commit()
-
         # Отправление уведомления
-        await NotificationService.create(
+        NotificationService.enqueue(
             session=session,
             data=notification_schemas.NotificationCreateSchema(
                 user_id=transaction_db.merchant_id,
@@ -78,6 +77,13 @@ class TraderService:
             ),
         )
 
+        await session.commit()
+
+        await RequisiteIndexService.publish(
+            event=RequisiteIndexEventEnum.FREE,
+            requisite_ids=[transaction_db.requisite_id],
+        )
+
     # MARK: Pay out
     @classmethod
     async def confirm_merchant_pay_out(
@@ -126,13 +132,10 @@ class TraderService:
         await TransactionService.update_users_balances(
             session=session,
             transaction_db=transaction_db,
-            trader_db=trader_db,
         )
 
-        await session.commit()
-
         # Отправление уведомления
-        await NotificationService.create(
+        NotificationService.enqueue(
             session=session,
             data=notification_schemas.NotificationCreateSchema(
                 user_id=transaction_db.merchant_id,
@@ -141,3 +144,10 @@ class TraderService:
                 ),
             ),
         )
+
+        await session.commit()
+
+        await RequisiteIndexService.publish(
+            event=RequisiteIndexEventEnum.FREE,
+            requisite_ids=[transaction_db.requisite_id],
+        )
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from enum import Enum, StrEnum
 
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,6 +28,21 @@ class TransactionPaymentMethodEnum(str, Enum):
 
 class TransactionModel(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("transactions_created_at_id_idx", "created_at", "id"),
+        Index(
+            "transactions_requisite_id_pending_idx",
+            "requisite_id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Не более одного пополнения в процессе обработки по одним реквизитам
+        Index(
+            "transactions_requisite_id_pending_pay_in_key",
+            "requisite_id",
+            unique=True,
+            postgresql_where=text("status = 'PENDING' AND type = 'PAY_IN'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     merchant_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
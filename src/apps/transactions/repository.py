@@ -1,6 +1,6 @@
 from typing import Tuple
 
-from sqlalchemy import Select, or_, select
+from sqlalchemy import Select, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.transactions import schemas
@@ -72,10 +72,7 @@ class TransactionRepository(
             stmt = stmt.where(cls.model.amount <= query_params.max_amount)
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
 
@@ -124,3 +121,72 @@ class TransactionRepository(
         transaction = transaction.scalar_one_or_none()
 
         return transaction
+
+    @classmethod
+    async def expire_pending(
+        cls,
+        session: AsyncSession,
+        limit: int,
+    ) -> list[TransactionModel]:
+        """
+        Перевести пачку истекших транзакций в статус "не удачна"
+        одним запросом `UPDATE ... RETURNING`.
+
+        Строки, заблокированные параллельными запросами, пропускаются
+        и будут обработаны при следующем запуске.
+
+        Args:
+            session (AsyncSession): Сессия базы данных.
+            limit (int): Максимальное количество транзакций в пачке.
+
+        Returns:
+            list[TransactionModel]: Транзакции, переведенные в статус "не удачна".
+        """
+
+        expired_ids = (
+            select(cls.model.id)
+            .where(
+                cls.model.status == TransactionStatusEnum.PENDING,
+                cls.model.expires_at < func.now(),
+            )
+            .order_by(cls.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(cls.model)
+            .where(cls.model.id.in_(expired_ids.scalar_subquery()))
+            .values(status=TransactionStatusEnum.FAILED)
+            .returning(cls.model)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+
+        return result.scalars().all()
+
+    @classmethod
+    async def get_pending_requisite_ids(
+        cls,
+        session: AsyncSession,
+    ) -> list[int]:
+        """
+        Получить ID реквизитов, по которым есть транзакции в процессе обработки.
+
+        Args:
+            session (AsyncSession): Сессия базы данных.
+
+        Returns:
+            list[int]: ID реквизитов.
+        """
+
+        stmt = (
+            select(cls.model.requisite_id)
+            .where(
+                cls.model.status == TransactionStatusEnum.PENDING,
+                cls.model.requisite_id.isnot(None),
+            )
+            .distinct()
+        )
+        result = await session.execute(stmt)
+
+        return result.scalars().all()
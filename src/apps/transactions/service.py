@@ -1,6 +1,9 @@
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.ledger import schemas as ledger_schemas
+from src.apps.ledger.model import LedgerEntryReasonEnum
+from src.apps.ledger.service import LedgerService
 from src.apps.transactions import constants as transaction_constants
 from src.apps.transactions import schemas
 from src.apps.transactions.model import (
@@ -9,8 +12,6 @@ from src.apps.transactions.model import (
     TransactionTypeEnum,
 )
 from src.apps.transactions.repository import TransactionRepository
-from src.apps.users.model import UserModel
-from src.apps.users.repository import UserRepository
 from src.core import constants, exceptions
 from src.libs.base.service import BaseService
 
@@ -84,47 +85,23 @@ class TransactionService(
         cls,
         session: AsyncSession,
         transaction_db: TransactionModel,
-        trader_db: UserModel | None = None,
-        merchant_db: UserModel | None = None,
     ) -> None:
         """
-        Обновление балансов пользователей. (Не создает коммит транзакции)
+        Обновление балансов пользователей записями в журнал.
+        (Не создает коммит транзакции)
 
         Args:
             session (AsyncSession): Сессия для работы с БД.
             transaction_db (TransactionModel): Транзакция.
-            trader_db (UserModel | None): Тренер.
-            merchant_db (UserModel | None): Мерчант.
         """
 
-        if not trader_db:
-            trader_db = await UserRepository.get_one_or_none(
-                session=session,
-                id=transaction_db.trader_id,
-            )
-            if not trader_db:
-                raise exceptions.NotFoundException(
-                    message=cls.not_found_exception_message,
-                    code=cls.not_found_exception_code,
-                )
-
-        if not merchant_db:
-            merchant_db = await UserRepository.get_one_or_none(
-                session=session,
-                id=transaction_db.merchant_id,
-            )
-            if not merchant_db:
-                raise exceptions.NotFoundException(
-                    message=cls.not_found_exception_message,
-                    code=cls.not_found_exception_code,
-                )
-
         if transaction_db.type == TransactionTypeEnum.PAY_IN:
+            trader_balance_delta, merchant_balance_delta = 0, 0
             if transaction_db.status == TransactionStatusEnum.SUCCESS:
-                # Разморозка и списание средств трейдера с учетом комиссии
-                trader_db.balance -= int(
-                    trader_db.amount_frozen
-                    - trader_db.amount_frozen
+                # Списание средств трейдера с учетом комиссии
+                trader_balance_delta = -int(
+                    transaction_db.amount
+                    - transaction_db.amount
                     * (
                         constants.TRADER_TRANSACTION_COMMISSION
                         - constants.PLATFORM_TRANSACTION_COMMISSION
@@ -132,18 +109,38 @@ class TransactionService(
                 )
 
                 # Пополнение баланса мерчанта с учетом комиссии
-                merchant_db.balance += int(
+                merchant_balance_delta = int(
                     transaction_db.amount
                     - transaction_db.amount
                     * (constants.MERCHANT_TRANSACTION_COMMISSION)
                 )
 
-            trader_db.amount_frozen -= transaction_db.amount
+            # Разморозка средств трейдера
+            LedgerService.enqueue(
+                session=session,
+                data=ledger_schemas.LedgerEntryCreateSchema(
+                    user_id=transaction_db.trader_id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=trader_balance_delta,
+                    amount_frozen_delta=-transaction_db.amount,
+                    transaction_id=transaction_db.id,
+                ),
+            )
+            LedgerService.enqueue(
+                session=session,
+                data=ledger_schemas.LedgerEntryCreateSchema(
+                    user_id=transaction_db.merchant_id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=merchant_balance_delta,
+                    transaction_id=transaction_db.id,
+                ),
+            )
 
         else:
+            trader_balance_delta, merchant_balance_delta = 0, 0
             if transaction_db.status == TransactionStatusEnum.SUCCESS:
                 # Пополнение баланса трейдера с учетом комиссии
-                trader_db.balance += int(
+                trader_balance_delta = int(
                     transaction_db.amount
                     + transaction_db.amount
                     * (
@@ -152,10 +149,76 @@ class TransactionService(
                     )
                 )
 
-                # Разморозка и списание средств мерчанта с учетом комиссии
-                merchant_db.balance -= int(
+                # Списание средств мерчанта с учетом комиссии
+                merchant_balance_delta = -int(
                     transaction_db.amount
                     + transaction_db.amount * constants.MERCHANT_TRANSACTION_COMMISSION
                 )
 
-            merchant_db.amount_frozen -= transaction_db.amount
+            LedgerService.enqueue(
+                session=session,
+                data=ledger_schemas.LedgerEntryCreateSchema(
+                    user_id=transaction_db.trader_id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=trader_balance_delta,
+                    transaction_id=transaction_db.id,
+                ),
+            )
+            # Разморозка средств мерчанта
+            LedgerService.enqueue(
+                session=session,
+                data=ledger_schemas.LedgerEntryCreateSchema(
+                    user_id=transaction_db.merchant_id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=merchant_balance_delta,
+                    amount_frozen_delta=-transaction_db.amount,
+                    transaction_id=transaction_db.id,
+                ),
+            )
+
+    @classmethod
+    async def expire_pending_bulk(
+        cls,
+        session: AsyncSession,
+        limit: int,
+    ) -> list[TransactionModel]:
+        """
+        Отменить пачку истекших транзакций и разморозить суммы пользователей.
+        (Не создает коммит транзакции)
+
+        Для статуса "не удачна" `update_users_balances` только размораживает
+        сумму: у трейдера для пополнения и у мерчанта для списания.
+        Здесь то же самое делается агрегированно: один `UPDATE ... RETURNING`
+        для транзакций и записи журнала, вставляемые одним INSERT при коммите.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            limit (int): Максимальное количество транзакций в пачке.
+
+        Returns:
+            list[TransactionModel]: Отмененные транзакции.
+        """
+
+        transactions_db = await cls.repository.expire_pending(
+            session=session,
+            limit=limit,
+        )
+
+        for transaction_db in transactions_db:
+            if transaction_db.type == TransactionTypeEnum.PAY_IN:
+                user_id = transaction_db.trader_id
+            else:
+                user_id = transaction_db.merchant_id
+
+            if user_id is not None:
+                LedgerService.enqueue(
+                    session=session,
+                    data=ledger_schemas.LedgerEntryCreateSchema(
+                        user_id=user_id,
+                        reason=LedgerEntryReasonEnum.EXPIRATION,
+                        amount_frozen_delta=-transaction_db.amount,
+                        transaction_id=transaction_db.id,
+                    ),
+                )
+
+        return transactions_db
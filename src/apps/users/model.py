@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.apps.blockchain.model import BlockchainTransactionModel
@@ -14,6 +14,14 @@ from src.core.database import Base
 
 class UserModel(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "users_active_priority_idx",
+            text("priority DESC"),
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         autoincrement=True,
@@ -40,12 +48,12 @@ class UserModel(Base):
 
     users_permissions: Mapped[list["UsersPermissionsModel"]] = relationship(
         back_populates="user",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete",
     )
     requisites: Mapped[list[RequisiteModel]] = relationship(
         back_populates="user",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete",
     )
     blockchain_transactions: Mapped[list[BlockchainTransactionModel]] = relationship(
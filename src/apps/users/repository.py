@@ -1,9 +1,15 @@
 from typing import Tuple
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.apps.ledger.repository import LedgerRepository
 from src.apps.users.model import UserModel
 from src.apps.users.schemas import user_schemas
+from src.apps.users_permissions.model import UsersPermissionsModel
+from src.core.constants import UserLoadProfileEnum
 from src.libs.base.repository import BaseRepository
 
 
@@ -21,6 +27,142 @@ class UserRepository(
 
     model = UserModel
 
+    # MARK: Utils
+    @classmethod
+    def get_load_options(cls, profile: UserLoadProfileEnum) -> list[ORMOption]:
+        """
+        Получить опции загрузки пользователя для профиля.
+
+        Связи пользователя по умолчанию не загружаются и выбрасывают исключение
+        при обращении, поэтому загружаются только профилем `FULL`.
+
+        Args:
+            profile (UserLoadProfileEnum): Профиль загрузки.
+
+        Returns:
+            list[ORMOption]: Опции загрузки.
+        """
+
+        if profile == UserLoadProfileEnum.MINIMAL:
+            return [
+                load_only(
+                    cls.model.id,
+                    cls.model.balance,
+                    cls.model.amount_frozen,
+                    cls.model.is_active,
+                    raiseload=True,
+                ),
+                raiseload("*"),
+            ]
+
+        if profile == UserLoadProfileEnum.AUTH:
+            return [raiseload("*")]
+
+        # Связи разрешений и реквизитов не загружают дальше
+        #   других пользователей и их связи.
+        return [
+            selectinload(cls.model.users_permissions).options(
+                raiseload(UsersPermissionsModel.user, sql_only=True),
+                selectinload(UsersPermissionsModel.permission).raiseload(
+                    "*", sql_only=True
+                ),
+            ),
+            selectinload(cls.model.requisites).raiseload("*", sql_only=True),
+        ]
+
+    @classmethod
+    def get_stmt(cls, profile: UserLoadProfileEnum) -> Select[Tuple[UserModel]]:
+        """
+        Создать выражение для получения пользователей с профилем загрузки.
+
+        Профиль `FULL` перезаписывает уже загруженные в сессию объекты,
+        чтобы ответ содержал актуальные разрешения и реквизиты.
+
+        Args:
+            profile (UserLoadProfileEnum): Профиль загрузки.
+
+        Returns:
+            stmt: Подготовленное выражение для запроса в БД.
+        """
+
+        stmt = select(cls.model).options(*cls.get_load_options(profile))
+        if profile == UserLoadProfileEnum.FULL:
+            stmt = stmt.execution_options(populate_existing=True)
+
+        return stmt
+
+    # MARK: Get
+    @classmethod
+    async def get_by_id(
+        cls,
+        session: AsyncSession,
+        id: int,
+        profile: UserLoadProfileEnum = UserLoadProfileEnum.AUTH,
+    ) -> UserModel | None:
+        """
+        Возвращает пользователя по первичному ключу с профилем загрузки.
+
+        Пользователь, уже загруженный в сессию, возвращается из identity map,
+        недостающие для профиля колонки догружаются одним запросом.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            id (int): первичный ключ.
+            profile (UserLoadProfileEnum): профиль загрузки.
+
+        Returns:
+            UserModel: Найденный пользователь или `None`.
+        """
+
+        if profile == UserLoadProfileEnum.FULL:
+            result = await session.execute(
+                cls.get_stmt(profile).where(cls.model.id == id)
+            )
+            return result.scalars().one_or_none()
+
+        user = await session.get(
+            cls.model,
+            id,
+            options=cls.get_load_options(profile),
+        )
+        if user is None or profile == UserLoadProfileEnum.MINIMAL:
+            return user
+
+        unloaded = inspect(user).unloaded.intersection(
+            inspect(cls.model).column_attrs.keys()
+        )
+        if unloaded:
+            await session.refresh(user, attribute_names=list(unloaded))
+
+        return user
+
+    @classmethod
+    async def get_one_or_none(
+        cls,
+        session: AsyncSession,
+        *filter,
+        profile: UserLoadProfileEnum = UserLoadProfileEnum.AUTH,
+        **filter_by,
+    ) -> UserModel | None:
+        """
+        Возвращает как максимум одного пользователя с профилем загрузки.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            *filter: фильтры для запроса.
+            profile (UserLoadProfileEnum): профиль загрузки.
+            **filter_by: фильтры для запроса.
+
+        Returns:
+            UserModel:
+                Найденный пользователь или `None`, если совпадений не было найдено.
+        """
+
+        stmt = cls.get_stmt(profile).filter(*filter).filter_by(**filter_by)
+        result = await session.execute(stmt)
+
+        return result.scalars().one_or_none()
+
     @classmethod
     async def get_stmt_by_query(
         cls,
@@ -38,7 +180,7 @@ class UserRepository(
             stmt: Подготовленное выражение для запроса в БД.
         """
 
-        stmt = select(cls.model)
+        stmt = cls.get_stmt(UserLoadProfileEnum.FULL)
 
         # Фильтрация по строковым полям.
         if query_params.email:
@@ -57,9 +199,49 @@ class UserRepository(
                 stmt = stmt.where(field == value)
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
+
+    # MARK: Update
+    @classmethod
+    async def reserve_amount(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        amount: int,
+        required_amount: float,
+    ) -> UserModel | None:
+        """
+        Заморозить сумму на балансе пользователя одним условным UPDATE,
+        если свободных средств с учетом несвернутых записей журнала
+        не меньше `required_amount`.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            user_id (int): ID пользователя.
+            amount (int): сумма для заморозки.
+            required_amount (float): необходимая сумма свободных средств.
+
+        Returns:
+            UserModel: Пользователь, загруженный профилем `MINIMAL`,
+                или `None`, если средств недостаточно.
+        """
+
+        stmt = (
+            update(cls.model)
+            .where(
+                cls.model.id == user_id,
+                cls.model.balance
+                - cls.model.amount_frozen
+                + LedgerRepository.get_unfolded_available_stmt(user_id=cls.model.id)
+                >= required_amount,
+            )
+            .values(amount_frozen=cls.model.amount_frozen + amount)
+            .returning(cls.model)
+            .options(*cls.get_load_options(UserLoadProfileEnum.MINIMAL))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await session.execute(stmt)
+
+        return result.scalars().one_or_none()
@@ -2,20 +2,27 @@ from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.auth.services.token_version_service import TokenVersionService
 from src.apps.blockchain import schemas as blockchain_schemas
+from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.repository import BlockchainTransactionRepository
 from src.apps.blockchain.services.transaction_service import (
     BlockchainTransactionService,
 )
 from src.apps.blockchain.services.tron_service import TronService
+from src.apps.ledger.service import LedgerService
 from src.apps.permissions.service import PermissionService
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions.model import TransactionStatusEnum, TransactionTypeEnum
 from src.apps.users import constants as user_constants
 from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
 from src.apps.users.schemas import pay_schemas, user_schemas
 from src.apps.users_permissions.service import UsersPermissionsService
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
 from src.apps.wallets.service import WalletService
-from src.core import constants, exceptions
+from src.core import exceptions
+from src.core.constants import RequisiteIndexEventEnum, UserLoadProfileEnum
 from src.libs.base.service import BaseService
 from src.libs.services.hash_service import HashService
 from src.libs.services.random_service import RandomService
@@ -57,6 +64,44 @@ class UserService(
         user_constants.NOT_ENOUGH_FUNDS_EXCEPTION_CODE,
     )
 
+    # MARK: Get
+    @classmethod
+    async def get_by_id(
+        cls,
+        session: AsyncSession,
+        id: int,
+        user_id: int | None = None,
+    ) -> user_schemas.UserGetSchema:
+        """
+        Получить пользователя с разрешениями и реквизитами.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (int): ID пользователя.
+            user_id (int | None): Не используется, пользователи не имеют владельца.
+
+        Returns:
+            UserGetSchema: Найденный пользователь.
+
+        Raises:
+            NotFoundException: Пользователь не найден.
+        """
+
+        logger.info("Поиск пользователя по ID: {}", id)
+
+        user = await cls.repository.get_by_id(
+            session=session,
+            id=id,
+            profile=UserLoadProfileEnum.FULL,
+        )
+        if user is None:
+            raise exceptions.NotFoundException(
+                message=cls.not_found_exception_message,
+                code=cls.not_found_exception_code,
+            )
+
+        return user_schemas.UserGetSchema.model_validate(user)
+
     # MARK: Create
     @classmethod
     async def create(
@@ -117,7 +162,11 @@ class UserService(
                 )
 
             await session.commit()
-            await session.refresh(user)
+            user = await cls.repository.get_by_id(
+                session=session,
+                id=user.id,
+                profile=UserLoadProfileEnum.FULL,
+            )
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(
@@ -153,12 +202,18 @@ class UserService(
         Raises:
             NotFoundException: Пользователь не найден.
             ConflictException: Пользователь с такими данными уже существует.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователя.
         """
 
         logger.info("Обновление пользователя с ID: {}", user_id)
 
         # Поиск пользователя в БД
-        user = await cls.get_by_id(session, user_id)
+        user = await cls.repository.get_by_id(session=session, id=user_id)
+        if user is None:
+            raise exceptions.NotFoundException(
+                message=cls.not_found_exception_message,
+                code=cls.not_found_exception_code,
+            )
 
         # Проверка существования разрешений
         if data.permissions_ids and not await PermissionService.check_all_exist(
@@ -196,7 +251,11 @@ class UserService(
                 )
 
             await session.commit()
-            await session.refresh(updated_user)
+            updated_user = await cls.repository.get_by_id(
+                session=session,
+                id=user_id,
+                profile=UserLoadProfileEnum.FULL,
+            )
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(
@@ -205,6 +264,9 @@ class UserService(
                 exc=ex,
             )
 
+        await TokenVersionService.revoke([user_id])
+        await RequisiteIndexService.publish(event=RequisiteIndexEventEnum.RELOAD)
+
         return user_schemas.UserGetSchema.model_validate(updated_user)
 
     @classmethod
@@ -224,6 +286,7 @@ class UserService(
 
         Raises:
             ConflictException: Пользователь уже находится в этом режиме.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователя.
         """
 
         logger.info(
@@ -241,6 +304,32 @@ class UserService(
         user.is_active = is_active
         await session.commit()
 
+        await TokenVersionService.revoke([user.id])
+        await RequisiteIndexService.publish(event=RequisiteIndexEventEnum.RELOAD)
+
+    # MARK: Delete
+    @classmethod
+    async def delete(
+        cls,
+        session: AsyncSession,
+        id: int,
+    ) -> None:
+        """
+        Удалить пользователя и отозвать его access токены.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (int): ID пользователя.
+
+        Raises:
+            NotFoundException: Пользователь не найден.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователя.
+        """
+
+        await super().delete(session, id)
+
+        await TokenVersionService.revoke([id])
+
     # MARK: Pay in
     @classmethod
     async def request_pay_in(
@@ -302,6 +391,7 @@ class UserService(
                 type=TransactionTypeEnum.PAY_IN,
             ),
         )
+        await WalletBalanceCacheService.adjust(address=wallet_address, amount=amount)
 
         return pay_schemas.ResponsePayInSchema(wallet_address=wallet_address)
 
@@ -314,6 +404,8 @@ class UserService(
 
         Проверяет транзакцию по хэшу, изменяет статус транзакции в БД,
             и зачисляет средства на счет пользователя.
+        Пополнения подтверждаются автоматически `DepositWatcherService`,
+            ручное подтверждение нужно только если перевод еще не обработан.
 
         Args:
             session: Сессия БД.
@@ -322,7 +414,9 @@ class UserService(
 
         Raises:
             NotFoundException: Транзакция не найдена.
-            ConflictException: Не удалось обновить статус транзакции.
+            ConflictException:
+                - Хэш уже привязан к другой транзакции.
+                - Не удалось обновить статус транзакции.
         """
 
         logger.info(
@@ -339,6 +433,15 @@ class UserService(
             type=TransactionTypeEnum.PAY_IN,
         )
 
+        # Перевод уже засчитан другой транзакции
+        if await BlockchainTransactionRepository.get_existing_hashes(
+            session=session, hashes=[transaction_hash]
+        ):
+            raise exceptions.ConflictException(
+                message=BlockchainTransactionService.already_exists_exception_message,
+                code=BlockchainTransactionService.already_exists_exception_code,
+            )
+
         # Получение транзакции по хэшу с блокчейна
         try:
             transaction = await TronService.get_transaction_by_hash(transaction_hash)
@@ -367,24 +470,33 @@ class UserService(
                 code=BlockchainTransactionService.not_found_exception_code,
             )
 
-        # Обновление статуса транзакции в БД на успешный
-        await BlockchainTransactionService.update(
-            session=session,
-            id=transaction_db.id,
-            data=blockchain_schemas.TransactionUpdateSchema(
-                hash=transaction_hash,
-                from_address=transaction["from_address"],
-                status=TransactionStatusEnum.SUCCESS,
-                created_at=transaction["created_at"],
-            ),
-        )
+        # Обновление статуса транзакции и зачисление средств одной транзакцией БД.
+        #   Уникальный индекс по хэшу не дает засчитать перевод дважды,
+        #   если его одновременно подтверждает `DepositWatcherService`.
+        try:
+            await BlockchainTransactionRepository.update(
+                BlockchainTransactionModel.id == transaction_db.id,
+                session=session,
+                obj_in=blockchain_schemas.TransactionUpdateSchema(
+                    hash=transaction_hash,
+                    from_address=transaction["from_address"],
+                    status=TransactionStatusEnum.SUCCESS,
+                    created_at=transaction["created_at"],
+                ),
+            )
 
-        # Зачисление средств на счет пользователя
-        user.balance += int(
-            transaction_db.amount
-            - transaction_db.amount * constants.PLATFORM_PAY_IN_COMMISSION
-        )
-        await session.commit()
+            # Зачисление средств на счет пользователя
+            BlockchainTransactionService.enqueue_deposit(
+                session=session, transaction_db=transaction_db
+            )
+            await session.commit()
+
+        except IntegrityError as ex:
+            raise exceptions.ConflictException(
+                message=BlockchainTransactionService.already_exists_exception_message,
+                code=BlockchainTransactionService.already_exists_exception_code,
+                exc=ex,
+            )
 
     # MARK: Pay out
     @classmethod
@@ -422,7 +534,10 @@ class UserService(
         )
 
         # Проверка баланса
-        if user.balance - user.amount_frozen < data.amount:
+        if (
+            await LedgerService.get_available_amount(session=session, user_db=user)
+            < data.amount
+        ):
             raise exceptions.BadRequestException(
                 message=cls.not_enough_funds_exception_message,
                 code=cls.not_enough_funds_exception_code,
@@ -458,5 +573,8 @@ class UserService(
                 type=TransactionTypeEnum.PAY_OUT,
             ),
         )
+        await WalletBalanceCacheService.adjust(
+            address=wallet_address, amount=-data.amount
+        )
 
         return pay_schemas.ResponsePayOutSchema(transaction_id=transaction_db.id)
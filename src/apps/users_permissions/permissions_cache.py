@@ -0,0 +1,136 @@
+import asyncio
+
+import orjson
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.auth import exceptions as auth_exceptions
+from src.apps.auth.services.token_version_service import TokenVersionService
+from src.apps.users_permissions.repository import UsersPermissionsRepository
+from src.core import constants
+from src.libs.services.lru_cache_service import LRUCacheService
+from src.libs.services.redis_service import RedisService
+
+
+class UserPermissionsCacheService:
+    """
+    Кэш названий разрешений пользователей для проверки доступа без запросов к БД.
+
+    Разрешения пользователя хранятся в Redis по ключу `USER_PERMISSIONS_KEY`
+    и в памяти процесса не дольше `USER_PERMISSIONS_LOCAL_TTL` секунд.
+    При изменении разрешений ключи пользователей удаляются из Redis
+    и локального кэша текущего процесса, остальные процессы
+    увидят изменения после истечения локального кэша.
+    """
+
+    _permissions: LRUCacheService[int, frozenset[str]] = LRUCacheService(
+        maxsize=constants.USER_PERMISSIONS_LOCAL_CACHE_SIZE,
+        ttl=constants.USER_PERMISSIONS_LOCAL_TTL,
+    )
+
+    # MARK: Get
+    @classmethod
+    async def get(cls, session: AsyncSession, user_id: int) -> frozenset[str]:
+        """
+        Получить названия разрешений пользователя.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            user_id (int): ID пользователя.
+
+        Returns:
+            frozenset[str]: Названия разрешений.
+        """
+
+        permissions = cls._permissions.get(user_id)
+        if permissions is not None:
+            return permissions
+
+        key = constants.USER_PERMISSIONS_KEY.format(user_id=user_id)
+        try:
+            cached = await RedisService.get(key)
+        except RedisError as e:
+            logger.warning("Не удалось прочитать разрешения пользователя: {}", e)
+            cached = None
+
+        if cached is not None:
+            permissions = frozenset(orjson.loads(cached))
+            cls._permissions.set(user_id, permissions)
+            return permissions
+
+        permissions = frozenset(
+            await UsersPermissionsRepository.get_permission_names(
+                session=session,
+                user_id=user_id,
+            )
+        )
+        cls._permissions.set(user_id, permissions)
+
+        try:
+            await RedisService.set(
+                key,
+                orjson.dumps(sorted(permissions)).decode(),
+                expire=constants.USER_PERMISSIONS_TTL,
+            )
+        except RedisError as e:
+            logger.warning("Не удалось сохранить разрешения пользователя: {}", e)
+
+        return permissions
+
+    # MARK: Invalidate
+    @classmethod
+    async def invalidate(cls, user_ids: list[int]) -> None:
+        """
+        Удалить разрешения пользователей из кэша
+        и отозвать их access токены с разрешениями в claims.
+
+        При ошибке Redis удаление повторяется, а если удалить ключи
+        так и не удалось, изменяющий запрос завершается ошибкой,
+        чтобы устаревшие разрешения не продолжали действовать из кэша.
+
+        Args:
+            user_ids (list[int]): ID пользователей.
+
+        Raises:
+            TokenRevokeFailedException: Не удалось удалить разрешения из кэша
+                или отозвать токены пользователей `HTTP_503_SERVICE_UNAVAILABLE`.
+        """
+
+        if not user_ids:
+            return
+
+        for user_id in user_ids:
+            cls._permissions.pop(user_id)
+
+        keys = [
+            constants.USER_PERMISSIONS_KEY.format(user_id=user_id)
+            for user_id in user_ids
+        ]
+        delay = constants.USER_TOKEN_REVOKE_RETRY_DELAY
+        for attempt in range(constants.USER_TOKEN_REVOKE_MAX_RETRIES):
+            try:
+                await RedisService.delete(*keys)
+                break
+            except RedisError as e:
+                logger.warning(
+                    "Не удалось удалить разрешения пользователей {} из кэша ({}): {}",
+                    user_ids,
+                    attempt + 1,
+                    e,
+                )
+
+            if attempt + 1 < constants.USER_TOKEN_REVOKE_MAX_RETRIES:
+                await asyncio.sleep(delay)
+                delay *= 2
+        else:
+            logger.error("Разрешения пользователей {} не удалены из кэша", user_ids)
+            raise auth_exceptions.TokenRevokeFailedException()
+
+        await TokenVersionService.revoke(user_ids)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Очистить локальный кэш процесса."""
+
+        cls._permissions.clear()
@@ -1,8 +1,9 @@
 from typing import Any
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.permissions.model import PermissionModel
 from src.apps.users_permissions import schemas
 from src.apps.users_permissions.model import UsersPermissionsModel
 from src.libs.base.repository import BaseRepository
@@ -19,6 +20,55 @@ class UsersPermissionsRepository(
 
     model = UsersPermissionsModel
 
+    # MARK: Get
+    @classmethod
+    async def get_permission_names(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+    ) -> set[str]:
+        """
+        Получить названия разрешений пользователя одним запросом.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            user_id (int): ID пользователя.
+
+        Returns:
+            set[str]: Названия разрешений.
+        """
+
+        result = await session.execute(
+            select(PermissionModel.name)
+            .join(cls.model, cls.model.permission_id == PermissionModel.id)
+            .where(cls.model.user_id == user_id),
+        )
+
+        return set(result.scalars().all())
+
+    @classmethod
+    async def get_user_ids(
+        cls,
+        session: AsyncSession,
+        permission_id: int,
+    ) -> list[int]:
+        """
+        Получить ID пользователей, у которых есть разрешение.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            permission_id (int): ID разрешения.
+
+        Returns:
+            list[int]: ID пользователей.
+        """
+
+        result = await session.execute(
+            select(cls.model.user_id).where(cls.model.permission_id == permission_id),
+        )
+
+        return list(result.scalars().all())
+
     # MARK: Delete
     @classmethod
     async def delete_bulk(
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.apps.permissions.model import PermissionModel
 from src.apps.users_permissions import constants, schemas
 from src.apps.users_permissions.model import UsersPermissionsModel
+from src.apps.users_permissions.permissions_cache import UserPermissionsCacheService
 from src.apps.users_permissions.repository import UsersPermissionsRepository
 from src.core import exceptions
 
@@ -38,6 +39,10 @@ class UsersPermissionsService:
             session (AsyncSession): Сессия для работы с базой данных.
             user_id (int): ID пользователя.
             permission_ids (list[int]): ID разрешений.
+
+        Raises:
+            ConflictException: Конфликт при добавлении разрешений.
+            TokenRevokeFailedException: Не удалось отозвать токены пользователя.
         """
 
         logger.info(
@@ -73,6 +78,8 @@ class UsersPermissionsService:
                 exc=e,
             )
 
+        await UserPermissionsCacheService.invalidate([user_id])
+
     # MARK: Get
     @classmethod
     async def get_user_permissions(
@@ -0,0 +1,266 @@
+import asyncio
+import bisect
+import time
+from typing import Literal
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.services.tron_service import TronService
+from src.apps.transactions.model import TransactionTypeEnum
+from src.apps.wallets.repository import WalletRepository
+from src.core import constants
+from src.libs.services.redis_service import RedisService
+
+
+class WalletBalanceCacheService:
+    """
+    Кэш балансов кошельков платформы для выбора кошелька без обращения к блокчейну.
+
+    Балансы хранятся в Redis ZSET `WALLET_BALANCES_KEY` (адрес -> баланс),
+    который обновляет периодическая задача Celery.
+    Поверх него в памяти процесса хранится отсортированная по балансу копия,
+    которая перечитывается из Redis не реже чем раз в `WALLET_BALANCES_LOCAL_TTL`
+    секунд, поэтому выбор кошелька выполняется бинарным поиском в памяти.
+
+    После назначения кошелька его баланс оптимистично корректируется
+    локально и в Redis до следующего обновления с блокчейна.
+    Если ключ в Redis истек (задача обновления не работает),
+    балансы запрашиваются с блокчейна и кэш заполняется заново.
+    """
+
+    _balances: dict[str, int] = {}
+    _sorted: list[tuple[int, str]] = []
+    _loaded_at: float | None = None
+    _lock = asyncio.Lock()
+
+    # MARK: Utils
+    @classmethod
+    def _is_stale(cls) -> bool:
+        return (
+            cls._loaded_at is None
+            or time.monotonic() - cls._loaded_at > constants.WALLET_BALANCES_LOCAL_TTL
+        )
+
+    @staticmethod
+    def _sort(balances: dict[str, int]) -> list[tuple[int, str]]:
+        return sorted((balance, address) for address, balance in balances.items())
+
+    @staticmethod
+    def _select(
+        sorted_balances: list[tuple[int, str]],
+        min_or_max: Literal["min", "max"],
+        amount: int,
+    ) -> str | None:
+        """
+        Выбрать кошелек с наименьшим или наибольшим балансом не меньше суммы.
+
+        Args:
+            sorted_balances (list[tuple[int, str]]): Балансы и адреса по возрастанию.
+            min_or_max (Literal["min", "max"]): Наименьший или наибольший баланс.
+            amount (int): Минимальный баланс кошелька.
+
+        Returns:
+            str | None: Адрес кошелька или `None`, если подходящего нет.
+        """
+
+        if min_or_max == "min":
+            index = bisect.bisect_left(sorted_balances, (amount, ""))
+            if index < len(sorted_balances):
+                return sorted_balances[index][1]
+        elif sorted_balances and sorted_balances[-1][0] >= amount:
+            return sorted_balances[-1][1]
+
+        return None
+
+    # MARK: Load
+    @classmethod
+    async def _load(cls) -> bool:
+        """
+        Перечитать локальную копию балансов из Redis, если она устарела.
+
+        Returns:
+            bool: Есть ли в кэше балансы.
+        """
+
+        if not cls._is_stale():
+            return True
+
+        async with cls._lock:
+            if not cls._is_stale():
+                return True
+
+            try:
+                items = await RedisService.get_sorted_set(constants.WALLET_BALANCES_KEY)
+            except RedisError as e:
+                logger.warning("Не удалось прочитать балансы кошельков: {}", e)
+                return False
+
+            if not items:
+                return False
+
+            cls._balances = {address: int(balance) for address, balance in items}
+            cls._sorted = [(int(balance), address) for address, balance in items]
+            cls._loaded_at = time.monotonic()
+
+            return True
+
+    @classmethod
+    async def refresh(cls, session: AsyncSession) -> dict[str, int]:
+        """
+        Запросить балансы всех кошельков с блокчейна и сохранить их в Redis.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+
+        Returns:
+            dict[str, int]: Балансы кошельков по адресам.
+        """
+
+        addresses = []
+        async for wallets_db in WalletRepository.iterate_batches(session=session):
+            addresses.extend(wallet_db.address for wallet_db in wallets_db)
+
+        balances = await TronService.get_wallets_balances(addresses)
+
+        try:
+            await RedisService.replace_sorted_set(
+                key=constants.WALLET_BALANCES_KEY,
+                mapping=balances,
+                expire=constants.WALLET_BALANCES_TTL,
+            )
+        except RedisError as e:
+            logger.warning("Не удалось сохранить балансы кошельков: {}", e)
+
+        return balances
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Пометить локальную копию устаревшей, она будет перечитана из Redis."""
+
+        cls._loaded_at = None
+
+    # MARK: Get
+    @classmethod
+    async def get_wallet_address(
+        cls,
+        session: AsyncSession,
+        min_or_max: Literal["min", "max"],
+        amount: int,
+    ) -> str | None:
+        """
+        Получить адрес кошелька с наименьшим или наибольшим балансом
+        не меньше суммы.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            min_or_max (Literal["min", "max"]): Наименьший или наибольший баланс.
+            amount (int): Минимальный баланс кошелька.
+
+        Returns:
+            str | None: Адрес кошелька или `None`, если подходящего нет.
+        """
+
+        if await cls._load():
+            return cls._select(cls._sorted, min_or_max, amount)
+
+        logger.info("Кэш балансов кошельков пуст, запрос балансов с блокчейна")
+        balances = await cls.refresh(session=session)
+
+        return cls._select(cls._sort(balances), min_or_max, amount)
+
+    # MARK: Update
+    @classmethod
+    async def adjust(cls, address: str, amount: int) -> None:
+        """
+        Оптимистично изменить баланс кошелька после его назначения.
+
+        Args:
+            address (str): Адрес кошелька.
+            amount (int): Изменение баланса.
+        """
+
+        if address in cls._balances:
+            balance = cls._balances[address]
+            cls._sorted.pop(bisect.bisect_left(cls._sorted, (balance, address)))
+            cls._balances[address] = balance + amount
+            bisect.insort(cls._sorted, (balance + amount, address))
+
+        try:
+            await RedisService.incr_sorted_set(
+                key=constants.WALLET_BALANCES_KEY,
+                member=address,
+                amount=amount,
+            )
+        except RedisError as e:
+            logger.warning("Не удалось изменить баланс кошелька в кэше: {}", e)
+
+    @classmethod
+    async def revert(cls, transactions_db: list[BlockchainTransactionModel]) -> None:
+        """
+        Отменить оптимистичные изменения балансов кошельков
+        для отмененных транзакций: пополнение не поступит на кошелек,
+        а вывод средств не спишется с него.
+
+        Args:
+            transactions_db (list[BlockchainTransactionModel]): Отмененные транзакции.
+        """
+
+        for transaction_db in transactions_db:
+            if transaction_db.type == TransactionTypeEnum.PAY_IN:
+                await cls.adjust(
+                    address=transaction_db.to_address,
+                    amount=-transaction_db.amount,
+                )
+            elif transaction_db.from_address:
+                await cls.adjust(
+                    address=transaction_db.from_address,
+                    amount=transaction_db.amount,
+                )
+
+    @classmethod
+    async def insert(cls, address: str, balance: int) -> None:
+        """
+        Добавить новый кошелек в кэш.
+        Если кэш в Redis пуст, кошелек попадет в него при следующем обновлении.
+
+        Args:
+            address (str): Адрес кошелька.
+            balance (int): Баланс кошелька.
+        """
+
+        if cls._loaded_at is not None and address not in cls._balances:
+            cls._balances[address] = balance
+            bisect.insort(cls._sorted, (balance, address))
+
+        try:
+            await RedisService.add_to_sorted_set(
+                key=constants.WALLET_BALANCES_KEY,
+                member=address,
+                score=balance,
+            )
+        except RedisError as e:
+            logger.warning("Не удалось добавить кошелек в кэш: {}", e)
+
+    @classmethod
+    async def remove(cls, address: str) -> None:
+        """
+        Удалить кошелек из кэша.
+
+        Args:
+            address (str): Адрес кошелька.
+        """
+
+        balance = cls._balances.pop(address, None)
+        if balance is not None:
+            cls._sorted.remove((balance, address))
+
+        try:
+            await RedisService.remove_from_sorted_set(
+                key=constants.WALLET_BALANCES_KEY,
+                member=address,
+            )
+        except RedisError as e:
+            logger.warning("Не удалось удалить кошелек из кэша: {}", e)
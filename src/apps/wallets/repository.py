@@ -1,6 +1,7 @@
 from typing import Tuple
 
 from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.wallets import schemas
 from src.apps.wallets.model import WalletModel
@@ -39,9 +40,47 @@ class WalletRepository(BaseRepository[WalletModel, schemas.WalletCreateSchema, a
             stmt = stmt.where(cls.model.private_key == query_params.private_key)
 
         # Сортировка по дате создания.
-        if not query_params.asc:
-            stmt = stmt.order_by(cls.model.created_at.desc())
-        else:
-            stmt = stmt.order_by(cls.model.created_at)
+        stmt = cls.order_by_query(stmt, query_params)
 
         return stmt
+
+    @classmethod
+    async def get_addresses(cls, session: AsyncSession) -> set[str]:
+        """
+        Получить адреса всех кошельков.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+
+        Returns:
+            set[str]: Адреса кошельков.
+        """
+
+        result = await session.execute(select(cls.model.address))
+
+        return set(result.scalars().all())
+
+    @classmethod
+    async def get_private_keys(
+        cls,
+        session: AsyncSession,
+        addresses: list[str],
+    ) -> dict[str, str]:
+        """
+        Получить приватные ключи кошельков по адресам.
+
+        Args:
+            session (AsyncSession): Сессия для работы с БД.
+            addresses (list[str]): Адреса кошельков.
+
+        Returns:
+            dict[str, str]: Приватные ключи по адресам найденных кошельков.
+        """
+
+        result = await session.execute(
+            select(cls.model.address, cls.model.private_key).where(
+                cls.model.address.in_(addresses)
+            )
+        )
+
+        return dict(result.tuples().all())
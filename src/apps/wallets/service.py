@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.blockchain.services.tron_service import TronService
 from src.apps.wallets import constants, schemas
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
 from src.apps.wallets.model import WalletModel
 from src.apps.wallets.repository import WalletRepository
 from src.core import exceptions
@@ -40,7 +41,7 @@ class WalletService(
         cls, session: AsyncSession, data: schemas.WalletCreateSchema
     ) -> schemas.WalletGetSchema:
         """
-        Создать кошелек.
+        Создать кошелек и добавить его в кэш балансов.
         Проверяет существование кошелька на блокчейне.
 
         Args:
@@ -61,7 +62,16 @@ class WalletService(
                 code=cls.not_found_exception_code,
             )
 
-        return await super().create(session, data)
+        wallet = await super().create(session, data)
+
+        balances = await TronService.get_wallets_balances([data.address])
+        if data.address in balances:
+            await WalletBalanceCacheService.insert(
+                address=data.address,
+                balance=balances[data.address],
+            )
+
+        return wallet
 
     # MARK: Get
     @classmethod
@@ -104,10 +114,12 @@ class WalletService(
     ) -> str:
         """
         Получить адрес кошелька на блокчейне с наименьшим или наибольшим балансом.
+        Балансы берутся из кэша `WalletBalanceCacheService`.
 
         Args:
             session: Сессия базы данных.
             min_or_max: Наименьший или наибольший баланс.
+            amount: Минимальный баланс кошелька.
 
         Returns:
             Адрес кошелька на блокчейне.
@@ -116,33 +128,17 @@ class WalletService(
             NotFoundException: Нет кошельков, куда можно перевести средства.
         """
 
-        wallets_addresses = [
-            wallet.address
-            for wallet in (
-                await cls.get_all(session, schemas.WalletPaginationSchema())
-            ).data
-        ]
-        if not wallets_addresses:
-            raise exceptions.NotFoundException(
-                message=cls.not_found_exception_message,
-                code=cls.not_found_exception_code,
-            )
-
-        wallets_balances = await TronService.get_wallets_balances(wallets_addresses)
-        wallets_balances = dict(
-            filter(lambda x: x[1] >= amount, wallets_balances.items())
+        wallet_address = await WalletBalanceCacheService.get_wallet_address(
+            session=session, min_or_max=min_or_max, amount=amount
         )
 
-        if not wallets_balances:
+        if not wallet_address:
             raise exceptions.NotFoundException(
                 message=cls.not_found_exception_message,
                 code=cls.not_found_exception_code,
             )
 
-        if min_or_max == "min":
-            return min(wallets_balances.items(), key=lambda x: x[1])[0]
-        else:
-            return max(wallets_balances.items(), key=lambda x: x[1])[0]
+        return wallet_address
 
     # MARK: Delete
     @classmethod
@@ -164,3 +160,5 @@ class WalletService(
 
         await session.execute(delete(WalletModel).where(WalletModel.address == address))
         await session.commit()
+
+        await WalletBalanceCacheService.remove(address)
@@ -24,6 +24,9 @@ CORS_METHODS: list[str] = [
     "PUT",
 ]
 
+# MARK: Requests
+JSON_INLINE_MAX_BODY_SIZE: int = 64 * 1024  # 64 KB, большие тела разбираются в потоке
+
 # MARK: Database
 DB_NAMING_CONVENTION = {
     "ix": "ix_%(column_0_label)s",
@@ -37,6 +40,14 @@ DEFAULT_QUERY_OFFSET: int = 0
 DEFAULT_QUERY_LIMIT: int = 100
 
 
+class CountStrategyEnum(StrEnum):
+    """Способ подсчета общего количества сущностей для списков."""
+
+    EXACT = "точный"  # оконная функция в том же запросе, что и страница
+    ESTIMATED = "оценочный"  # оценка планировщика Postgres
+    NONE = "без подсчета"  # только флаг наличия следующей страницы
+
+
 # MARK: Permissions
 class PermissionEnum(StrEnum):
     """Перечисление разрешений."""
@@ -137,6 +148,33 @@ class PermissionEnum(StrEnum):
 
 # MARK: Redis
 REDIS_EXPIRE_SECONDS: int = 60 * 15  # 15 минут
+# Атомарно создать хэш с временем жизни, если ключа нет.
+# ARGV: время жизни, затем пары поле-значение.
+REDIS_HASH_SET_IF_NOT_EXISTS_SCRIPT: str = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+redis.call("HSET", KEYS[1], unpack(ARGV, 2))
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+return 1
+"""
+# Атомарно получить хэш и увеличить его поле, время жизни ключа сохраняется.
+# ARGV: поле, изменение. Возвращает хэш до увеличения.
+REDIS_HASH_GET_AND_INCR_SCRIPT: str = """
+local value = redis.call("HGETALL", KEYS[1])
+if #value > 0 then
+    redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+end
+return value
+"""
+# Атомарно добавить элемент в отсортированное множество, только если оно есть.
+# ARGV: вес, элемент.
+REDIS_SORTED_SET_ADD_IF_EXISTS_SCRIPT: str = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+return redis.call("ZADD", KEYS[1], "NX", ARGV[1], ARGV[2])
+"""
 
 # MARK: SMTP
 SMTP_SERVER: str = "smtp.gmail.com"
@@ -146,6 +184,8 @@ SMTP_PORT: int = 587
 TWO_FACTOR_LOGIN_CONFIRM_SUBJECT: str = "Код подтверждения системы эквайринга"
 TWO_FACTOR_LOGIN_CONFIRM_MESSAGE: str = "Здравствуйте! Ваш код подтверждения: {code}"
 TWO_FACTOR_MAX_CODE_TRIES: int = 3
+# Код хранится хэшем Redis, у строковых значений прежнего формата другой ключ
+TWO_FACTOR_CODE_KEY: str = "2fa_code_hash:{user_id}"
 
 # MARK: Tron
 TRON_JRPC_API_URL: str = "https://nile.trongrid.io/jsonrpc"
@@ -157,10 +197,43 @@ TRON_CREATE_TRANSACTION_URL: str = "https://nile.trongrid.io/wallet/createtransa
 TRON_BROADCAST_TRANSACTION_URL: str = (
     "https://nile.trongrid.io/wallet/broadcasttransaction"
 )
+TRON_GET_BLOCK_NUMBER_METHOD: str = "eth_blockNumber"
+TRON_GET_BLOCK_BY_NUMBER_METHOD: str = "eth_getBlockByNumber"
+TRON_DEPOSIT_CONFIRMATIONS: int = 19  # блоков до необратимости (solidified)
+TRON_DEPOSIT_BLOCKS_BATCH_SIZE: int = 100
+TRON_DUPLICATE_TRANSACTION_CODE: str = "DUP_TRANSACTION_ERROR"
+TRON_BROADCAST_BATCH_SIZE: int = 100
+TRON_BROADCAST_CONCURRENCY: int = 10  # кошельков, отправляемых параллельно
+TRON_BROADCAST_MAX_RETRIES: int = 3  # повторы отправки в рамках одного запуска
+TRON_BROADCAST_RETRY_DELAY: float = 0.5  # секунд, удваивается с каждым повтором
+TRON_PAY_OUT_MAX_ATTEMPTS: int = 5  # запусков до отмены вывода средств
+TRON_PRIVATE_KEY_CACHE_SIZE: int = 1024
+TRON_PRIVATE_KEY_CACHE_TTL: int = 60 * 60  # 1 час
+TRON_BLOCK_TIMESTAMP_KEY: str = "tron_block_timestamp:{hash}"
+TRON_BLOCK_CACHE_SIZE: int = 4096
+TRON_BLOCK_CACHE_TTL: int = 60 * 60 * 24  # 1 день
+TRON_TRANSACTION_CACHE_SIZE: int = 4096
+TRON_TRANSACTION_CACHE_TTL: int = 60 * 60  # 1 час
 
 # MARK: Transactions
 PENDING_BLOCKCHAIN_TRANSACTION_TIMEOUT: int = 60 * 60 * 24  # 1 день
 PENDING_TRANSACTION_TIMEOUT: int = 60 * 15  # 15 минут
+TRADER_RESERVE_MAX_ATTEMPTS: int = 3  # повторы подбора трейдера при гонке
+
+
+# MARK: Requisite index
+class RequisiteIndexEventEnum(StrEnum):
+    """События для согласования индекса реквизитов между процессами."""
+
+    RELOAD = "reload"  # изменились реквизиты или трейдеры
+    BUSY = "busy"  # по реквизитам создана транзакция в процессе обработки
+    FREE = "free"  # транзакция по реквизитам завершена
+
+
+REQUISITE_INDEX_CHANNEL: str = "requisite_index"
+REQUISITE_INDEX_TTL: int = 60  # полная перезагрузка индекса не реже раза в минуту
+REQUISITE_INDEX_MAX_ATTEMPTS: int = 3  # кандидатов на резервирование до SQL подбора
+REQUISITE_INDEX_AMOUNT_BANDS: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000)
 
 # MARK: Disputes
 PENDING_DISPUTE_TIMEOUT: int = 60 * 60 * 24  # 1 день
@@ -180,12 +253,50 @@ TRADER_DISPUTE_PENALTY: float = (
     0.2  # штраф который идет на счет мерчанта, если трейдер признает вину
 )
 
+# MARK: Wallets
+WALLET_BALANCES_KEY: str = "wallet_balances"
+WALLET_BALANCES_TTL: int = 60 * 5  # 5 минут
+WALLET_BALANCES_LOCAL_TTL: int = 5  # 5 секунд
+
+
+# MARK: Users
+class UserLoadProfileEnum(StrEnum):
+    """Профили загрузки пользователя из БД."""
+
+    MINIMAL = "minimal"  # id, баланс и активность, без связей
+    AUTH = "auth"  # все колонки, без связей
+    FULL = "full"  # все колонки, разрешения и реквизиты
+
+
+# MARK: User permissions
+USER_PERMISSIONS_KEY: str = "user_permissions:{user_id}"
+USER_PERMISSIONS_TTL: int = 60 * 5  # 5 минут
+USER_PERMISSIONS_LOCAL_TTL: int = 10  # 10 секунд
+USER_PERMISSIONS_LOCAL_CACHE_SIZE: int = 10_000
+USER_TOKEN_VERSION_KEY: str = "user_token_version:{user_id}"
+USER_TOKEN_REVOKE_MAX_RETRIES: int = 3  # повторы отзыва токенов при ошибке Redis
+USER_TOKEN_REVOKE_RETRY_DELAY: float = 0.1  # секунд, удваивается с каждым повтором
+
 # MARK: Celery
 CELERY_BEAT_CHECK_BLOCKCHAIN_TRANSACTIONS_PERIOD: int = 60 * 10  # 10 минут
 CELERY_BEAT_CHECK_TRANSACTIONS_PERIOD: int = 60 * 10  # 10 минут
 CELERY_BEAT_CHECK_DISPUTES_PERIOD: int = 60 * 10  # 10 минут
+CELERY_BEAT_FOLD_LEDGER_PERIOD: int = 10  # 10 секунд
+CELERY_BEAT_REFRESH_WALLET_BALANCES_PERIOD: int = 30  # 30 секунд
+CELERY_BEAT_WATCH_DEPOSITS_PERIOD: int = 3  # 3 секунды
+CELERY_BEAT_BROADCAST_PAY_OUTS_PERIOD: int = 5  # 5 секунд
+CELERY_SWEEP_BATCH_SIZE: int = 100
+CELERY_LEDGER_FOLD_BATCH_SIZE: int = 1000
 
 # MARK: S3
+S3_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024  # 8 МБ
+S3_MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024  # 8 МБ
+S3_MULTIPART_CONCURRENCY: int = 4
+S3_LIST_MAX_KEYS: int = 1000  # Максимум ключей в ответе list_objects_v2
+S3_USER_FILES_PREFIX: str = "users/{user_id}"  # Каталог файлов пользователя
+S3_PREFIX_PATTERN: str = (
+    r"^[A-Za-z0-9_\-]+(/[A-Za-z0-9_\-]+)*$"  # Без `..` и `/` в начале
+)
 S3_PUBLIC_BUCKET_POLICY: dict = {
     "Version": "2012-10-17",
     "Statement": [
@@ -200,6 +311,9 @@ S3_PUBLIC_BUCKET_POLICY: dict = {
 }
 
 # MARK: Notifications
+NOTIFICATION_MESSAGE_PAY_IN: str = (
+    "Пополнение средств на сумму {amount} и счет {address} подтверждено"
+)
 NOTIFICATION_MESSAGE_PAY_OUT: str = (
     "Вывод средств на сумму {amount} и счет {address} подтвержден"
 )
@@ -221,6 +335,9 @@ NOTIFICATION_MESSAGE_CONFIRM_MERCHANT_PAY_IN: str = (
 NOTIFICATION_MESSAGE_CONFIRM_MERCHANT_PAY_OUT: str = (
     "Вывод средств мерчантом на сумму {amount} подтвержден"
 )
+NOTIFICATION_MESSAGE_PAY_OUT_FAILED: str = (
+    "Вывод средств на сумму {amount} и счет {address} не удался"
+)
 NOTIFICATION_MESSAGE_BLOCKCHAIN_TRANSACTION_EXPIRED: str = (
     "Транзакция {transaction_id} на блокчейне просрочена"
 )
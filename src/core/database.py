@@ -1,11 +1,19 @@
-from sqlalchemy import MetaData, NullPool
+import time
+from typing import Any
+
+from sqlalchemy import MetaData, NullPool, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from src.core.settings import settings
 
@@ -29,12 +37,142 @@ class Base(AsyncAttrs, DeclarativeBase):
     metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
 
 
+# MARK: Explain
+class Explain(Executable, ClauseElement):
+    """
+    Запрос `EXPLAIN (FORMAT JSON)` для произвольного select выражения.
+    Параметры исходного выражения биндятся как обычно, поэтому
+    план строится для тех же значений фильтров.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kwargs) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+# MARK: Pool metrics
+class DatabasePoolMetrics:
+    """Счетчики использования пула соединений с БД в рамках процесса."""
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    @classmethod
+    def record_wait(cls, seconds: float) -> None:
+        """
+        Учесть время ожидания свободного соединения в пуле.
+
+        Args:
+            seconds (float): Время ожидания в секундах.
+        """
+
+        cls.wait_seconds_total += seconds
+        cls.wait_seconds_max = max(cls.wait_seconds_max, seconds)
+
+    @classmethod
+    def get_stats(cls, engine: AsyncEngine) -> dict[str, Any]:
+        """
+        Получить текущее состояние пула и накопленные счетчики.
+
+        Args:
+            engine (AsyncEngine): Движок, пул которого нужно описать.
+
+        Returns:
+            dict[str, Any]: Состояние пула.
+        """
+
+        pool = engine.pool
+        is_queue_pool = isinstance(pool, AsyncAdaptedQueuePool)
+
+        return {
+            "mode": settings.DB_POOL_MODE,
+            "size": pool.size() if is_queue_pool else 0,
+            "checked_in": pool.checkedin() if is_queue_pool else 0,
+            "checked_out": pool.checkedout() if is_queue_pool else 0,
+            "overflow": pool.overflow() if is_queue_pool else 0,
+            "connects": cls.connects,
+            "checkouts": cls.checkouts,
+            "checkins": cls.checkins,
+            "timeouts": cls.timeouts,
+            "wait_seconds_total": cls.wait_seconds_total,
+            "wait_seconds_max": cls.wait_seconds_max,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания свободного соединения."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DatabasePoolMetrics.timeouts += 1
+            raise
+        finally:
+            DatabasePoolMetrics.record_wait(time.perf_counter() - started_at)
+
+
+def get_engine_options() -> dict[str, Any]:
+    """
+    Получить параметры пула соединений в зависимости от `DB_POOL_MODE`.
+
+    Режим `queue` используется API процессами, которые живут в одном event loop.
+    Режим `null` нужен Celery воркеру, так как его процессы создаются
+    через fork после импорта движка, и соединения asyncpg
+    нельзя переиспользовать между процессами.
+
+    Returns:
+        dict[str, Any]: Именованные аргументы для `create_async_engine`.
+    """
+
+    if settings.DB_POOL_MODE == "null":
+        return {
+            "poolclass": NullPool,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    poolclass=NullPool,
-    pool_pre_ping=True,
+    **get_engine_options(),
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    DatabasePoolMetrics.connects += 1
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    DatabasePoolMetrics.checkouts += 1
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    DatabasePoolMetrics.checkins += 1
+
+
 SessionLocal = async_sessionmaker(
     bind=engine,
     autocommit=False,
@@ -1,17 +1,19 @@
 from typing import AsyncGenerator
 
-import jwt
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.apps.auth.exceptions as auth_exceptions
+from src.apps.auth.schemas import AccessTokenClaimsSchema
+from src.apps.auth.services.jwt_service import JWTService
 from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
-from src.apps.users_permissions.service import UsersPermissionsService
+from src.apps.users_permissions.permissions_cache import UserPermissionsCacheService
 from src.core import constants, exceptions
 from src.core.database import SessionLocal
 from src.core.settings import settings
+from src.core.unit_of_work import UnitOfWork
 
 oauth2_scheme = APIKeyHeader(name=constants.AUTH_HEADER_NAME, auto_error=False)
 
@@ -35,13 +37,52 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise ex
 
 
+async def get_unit_of_work(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> UnitOfWork:
+    """
+    Вернуть контекст запроса с его сессией.
+
+    Контекст хранится в `request.state`, поэтому все зависимости и роут
+    получают один и тот же контекст и одну сессию.
+    """
+
+    unit_of_work = getattr(request.state, "unit_of_work", None)
+    if unit_of_work is None:
+        unit_of_work = request.state.unit_of_work = UnitOfWork(session)
+
+    return unit_of_work
+
+
 # MARK: Auth
-async def get_current_user(
+async def get_access_token_claims(
     header_value: str | None = Depends(oauth2_scheme),
-    session: AsyncSession = Depends(get_session),
+) -> AccessTokenClaimsSchema | None:
+    """
+    Вернуть claims access токена без обращения к БД, если токен передан.
+
+    Returns:
+        AccessTokenClaimsSchema | None: claims токена.
+
+    Raises:
+        InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
+        TokenExpiredException: Время действия токена истекло `HTTP_401_UNAUTHORIZED`.
+    """
+
+    if not header_value:
+        return None
+
+    return JWTService.decode_access_token(header_value.removeprefix("Bearer "))
+
+
+async def get_current_user(
+    claims: AccessTokenClaimsSchema | None = Depends(get_access_token_claims),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> UserModel | None:
     """
-    Вернуть текущего пользователя, если передан верный `access_token`.
+    Вернуть текущего пользователя, если передан верный `access_token`,
+    и сохранить его в контексте запроса.
 
     Returns:
         UserModel | None: модель пользователя.
@@ -53,37 +94,72 @@ async def get_current_user(
         ForbiddenException: Пользователь заблокирован `HTTP_403_FORBIDDEN`.
     """
 
-    if not header_value:
+    if claims is None:
         return None
 
-    token = header_value.removeprefix("Bearer ")
+    if unit_of_work.user is not None:
+        return unit_of_work.user
 
-    try:
-        payload = jwt.decode(
-            jwt=token,
-            key=settings.JWT_ACCESS_SECRET,
-            algorithms=[constants.ALGORITHM],
-        )
-        user_id = payload.get("id")
-        if not user_id:
-            raise auth_exceptions.InvalidTokenException()
-    except Exception as e:
-        if isinstance(e, jwt.ExpiredSignatureError):
-            raise auth_exceptions.TokenExpiredException()
-        else:
-            raise auth_exceptions.InvalidTokenException()
-
-    user_db = await UserRepository.get_one_or_none(
-        session=session,
-        id=user_id,
+    user_db = await UserRepository.get_by_id(
+        session=unit_of_work.session,
+        id=claims.id,
     )
 
     if user_db is None:
         raise exceptions.NotFoundException()
 
+    unit_of_work.user = user_db
+
     return user_db
 
 
+# При `JWT_CLAIMS_ENABLED` проверка разрешений не загружает пользователя из БД
+get_current_principal = (
+    get_access_token_claims if settings.JWT_CLAIMS_ENABLED else get_current_user
+)
+
+
+async def get_current_permissions(
+    principal: UserModel | AccessTokenClaimsSchema | None = Depends(
+        get_current_principal
+    ),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> frozenset[str]:
+    """
+    Вернуть названия разрешений текущего пользователя
+    и сохранить их в контексте запроса.
+
+    Разрешения получаются один раз за запрос: из claims токена,
+    а если их нет - из кэша разрешений.
+
+    Returns:
+        frozenset[str]: Названия разрешений.
+
+    Raises:
+        NotAuthorizedException: Пользователь не авторизован.
+        TokenRevokedException: Токен с claims отозван.
+    """
+
+    if not principal:
+        raise auth_exceptions.NotAuthorizedException()
+
+    if unit_of_work.permissions is not None:
+        return unit_of_work.permissions
+
+    user_permissions_names = None
+    if isinstance(principal, AccessTokenClaimsSchema):
+        user_permissions_names = await JWTService.get_permissions_from_claims(principal)
+    if user_permissions_names is None:
+        user_permissions_names = await UserPermissionsCacheService.get(
+            unit_of_work.session,
+            principal.id,
+        )
+
+    unit_of_work.permissions = frozenset(user_permissions_names)
+
+    return unit_of_work.permissions
+
+
 def check_user_permissions(
     permissions: list[constants.PermissionEnum],
 ):
@@ -96,21 +172,12 @@ def check_user_permissions(
     Raises:
         NotAuthorizedException: Пользователь не авторизован.
         ForbiddenException: Пользователь не имеет необходимых разрешений.
+        TokenRevokedException: Токен с claims отозван.
     """
 
     async def wrapper(
-        user: UserModel | None = Depends(get_current_user),
-        session: AsyncSession = Depends(get_session),
+        user_permissions_names: frozenset[str] = Depends(get_current_permissions),
     ) -> None:
-        if not user:
-            raise auth_exceptions.NotAuthorizedException()
-
-        user_permissions = await UsersPermissionsService.get_user_permissions(
-            session,
-            user.id,
-        )
-        user_permissions_names = {permission.name for permission in user_permissions}
-
         if not set([permission.value for permission in permissions]).issubset(
             user_permissions_names
         ):
@@ -0,0 +1,46 @@
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+
+from src.core import constants
+
+
+class ORJSONRequest(Request):
+    """
+    Запрос с разбором JSON тела через orjson.
+
+    Тела до `JSON_INLINE_MAX_BODY_SIZE` байт разбираются сразу в цикле событий,
+    так как переход в пул потоков дольше самого разбора.
+    Большие тела разбираются в пуле потоков, чтобы не блокировать
+    обработку остальных запросов.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            if len(body) > constants.JSON_INLINE_MAX_BODY_SIZE:
+                self._json = await run_in_threadpool(orjson.loads, body)
+            else:
+                self._json = orjson.loads(body)
+
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Маршрут, передающий обработчику FastAPI `ORJSONRequest`.
+
+    Ошибка разбора `orjson.JSONDecodeError` наследуется от `json.JSONDecodeError`,
+    поэтому невалидный JSON по-прежнему возвращает ответ 422.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
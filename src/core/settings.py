@@ -19,15 +19,33 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
 
+    # Postgres pool
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 60 * 30
+    DB_POOL_PRE_PING: bool = True
+
     # JWT
     JWT_ACCESS_SECRET: str
     JWT_REFRESH_SECRET: str
     JWT_ACCESS_EXPIRE_MINUTES: int
     JWT_REFRESH_EXPIRE_MINUTES: int
+    # Разрешения и версия пользователя в access токене для проверки доступа без БД
+    JWT_CLAIMS_ENABLED: bool = False
 
     # Redis
     REDIS_HOST: str
     REDIS_PORT: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: int = 5
+    REDIS_SOCKET_TIMEOUT: int = 5
+    REDIS_CONNECT_TIMEOUT: int = 2
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    # Индекс реквизитов в памяти процесса для подбора трейдера
+    REQUISITE_INDEX_ENABLED: bool = False
 
     # SMTP
     SMTP_SENDER_EMAIL: str
@@ -35,12 +53,24 @@ class Settings(BaseSettings):
 
     # Tron
     TRON_API_KEY: str
+    TRON_JRPC_BATCH_SIZE: int = 100
+    TRON_BLOCK_CACHE_REDIS_ENABLED: bool = True
+    TRON_SIGN_WORKERS: int = 4
+
+    # Общий HTTP клиент для внешних API
+    HTTP_CLIENT_LIMIT: int = 100
+    HTTP_CLIENT_LIMIT_PER_HOST: int = 20
+    HTTP_CLIENT_TIMEOUT: int = 30
+    HTTP_CLIENT_CONNECT_TIMEOUT: int = 5
+    HTTP_CLIENT_KEEPALIVE_TIMEOUT: int = 60
+    HTTP_CLIENT_DNS_CACHE_TTL: int = 300
 
     # S3
     S3_ENDPOINT: str
     S3_ACCESS_KEY: str
     S3_SECRET_KEY: str
     S3_BUCKET_NAME: str
+    S3_MAX_CONCURRENCY: int = 10
 
     @property
     def DATABASE_URL(self):
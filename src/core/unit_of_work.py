@@ -0,0 +1,42 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.libs.base.types as types
+from src.apps.users.model import UserModel
+
+
+class UnitOfWork:
+    """
+    Контекст запроса: одна сессия БД, текущий пользователь и его разрешения.
+
+    Создается один раз на запрос зависимостью `get_unit_of_work`
+    и хранится в `request.state`, поэтому зависимости авторизации
+    и роуты получают пользователя и разрешения без повторных запросов.
+    Объекты, загруженные в рамках запроса, хранятся в identity map сессии,
+    и `get` по первичному ключу возвращает их без обращения к БД.
+
+    Args:
+        session: Сессия запроса.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.user: UserModel | None = None
+        self.permissions: frozenset[str] | None = None
+
+    async def get(
+        self,
+        model: type[types.ModelType],
+        id: int,
+    ) -> types.ModelType | None:
+        """
+        Получить объект по первичному ключу из identity map или БД.
+
+        Args:
+            model: Модель.
+            id: Первичный ключ.
+
+        Returns:
+            Объект или `None`, если он не найден.
+        """
+
+        return await self.session.get(model, id)
@@ -1,12 +1,25 @@
-from typing import Any, Generic, Tuple
-
-from sqlalchemy import Select, asc, delete, desc, insert, or_, select, update
+from datetime import datetime
+from typing import Any, AsyncGenerator, Generic, Tuple
+
+import orjson
+from sqlalchemy import (
+    Select,
+    asc,
+    delete,
+    desc,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
 import src.libs.base.types as types
 from src.core import constants
-from src.core.database import Base
+from src.core.database import Base, Explain
+from src.libs.base.schemas import PaginationBaseSchema
 
 
 class BaseRepository(
@@ -104,6 +117,28 @@ class BaseRepository(
 
         return result.scalars().one_or_none()
 
+    @classmethod
+    async def get_by_id(
+        cls,
+        session: AsyncSession,
+        id: int,
+    ) -> types.ModelType | None:
+        """
+        Возвращает объект по первичному ключу.
+
+        Объект, уже загруженный в сессию в рамках запроса, возвращается
+        из identity map сессии без запроса к БД.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            id (int): первичный ключ.
+
+        Returns:
+            ModelType: Найденная модель данных или `None`.
+        """
+
+        return await session.get(cls.model, id)
+
     @classmethod
     async def get_all(
         cls,
@@ -217,6 +252,56 @@ class BaseRepository(
 
         return result.scalars().all()
 
+    @classmethod
+    async def iterate_batches(
+        cls,
+        session: AsyncSession,
+        *filter,
+        batch_size: int = constants.DEFAULT_QUERY_LIMIT,
+        **filter_by,
+    ) -> AsyncGenerator[list[types.ModelType], None]:
+        """
+        Последовательно выдавать записи, соответствующие критериям,
+        пачками фиксированного размера с keyset пагинацией по ID.
+
+        В отличие от пагинации через offset, изменение записей между пачками
+        (в том числе полей, по которым идет фильтрация) не приводит
+        к пропуску или повторному чтению строк, а стоимость каждой пачки
+        не зависит от ее номера.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            *filter: фильтры для запроса.
+            batch_size (int): размер пачки.
+            **filter_by: фильтры для запроса.
+
+        Returns:
+            AsyncGenerator[list[ModelType], None]: пачки моделей.
+        """
+
+        last_id = None
+        while True:
+            stmt = (
+                select(cls.model)
+                .filter(*filter)
+                .filter_by(**filter_by)
+                .order_by(cls.model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(cls.model.id > last_id)
+
+            result = await session.execute(stmt)
+            objects_db = result.scalars().all()
+            if not objects_db:
+                return
+
+            yield objects_db
+
+            if len(objects_db) < batch_size:
+                return
+            last_id = objects_db[-1].id
+
     @classmethod
     async def get_all_with_pagination_from_stmt(
         cls,
@@ -246,6 +331,82 @@ class BaseRepository(
 
         return result.scalars().all()
 
+    @classmethod
+    async def get_all_with_count_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[types.ModelType]],
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> tuple[list[types.ModelType], int]:
+        """
+        Применить пагинацию к финальному выражению и в том же запросе
+        посчитать общее количество сущностей оконной функцией `count(*) OVER ()`.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            stmt (Select[Tuple[ModelType]]): финальное выражение для запроса в БД.
+            limit (int | None): количество записей для пагинации.
+            offset (int | None): смещение для пагинации.
+
+        Returns:
+            tuple[list[ModelType], int]:
+                модели с учетом пагинации и общее количество сущностей.
+                Если страница пуста, количество равно 0.
+        """
+
+        stmt = (
+            stmt.add_columns(func.count().over().label("total_count"))
+            .limit(limit=limit)
+            .offset(offset=offset)
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+
+        if not rows:
+            return [], 0
+
+        return [row[0] for row in rows], rows[0][1]
+
+    @classmethod
+    async def get_all_with_cursor_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[types.ModelType]],
+        limit: int | None = None,
+        cursor: tuple[datetime, int] | None = None,
+        ascending: bool = True,
+    ) -> list[types.ModelType]:
+        """
+        Применить keyset пагинацию к финальному выражению для запроса в БД.
+
+        Выражение должно быть отсортировано по (created_at, id)
+        через `order_by_query`, тогда стоимость любой страницы
+        не зависит от ее номера.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            stmt (Select[Tuple[ModelType]]): финальное выражение для запроса в БД.
+            limit (int | None): количество записей для пагинации.
+            cursor (tuple[datetime, int] | None):
+                (created_at, id) последней записи предыдущей страницы.
+            ascending (bool): направление сортировки.
+
+        Returns:
+            list[ModelType]: модели, следующие за курсором.
+        """
+
+        if cursor is not None:
+            keyset = tuple_(cls.model.created_at, cls.model.id)
+            stmt = stmt.where(
+                keyset > tuple_(*cursor) if ascending else keyset < tuple_(*cursor)
+            )
+
+        stmt = stmt.limit(limit=limit)
+        result = await session.execute(stmt)
+
+        return result.scalars().all()
+
     @classmethod
     async def get_all_non_scalars_with_pagination_from_stmt(
         cls,
@@ -275,6 +436,32 @@ class BaseRepository(
 
         return result.all()
 
+    # MARK: Sort
+    @classmethod
+    def order_by_query(
+        cls,
+        stmt: Select[Tuple[types.ModelType]],
+        query_params: PaginationBaseSchema,
+    ) -> Select[Tuple[types.ModelType]]:
+        """
+        Отсортировать выражение по дате создания и ID.
+
+        ID используется как уникальный ключ при одинаковой дате создания,
+        что делает порядок детерминированным и пригодным для keyset пагинации.
+
+        Args:
+            stmt (Select[Tuple[ModelType]]): выражение для запроса в БД.
+            query_params (PaginationBaseSchema): параметры для запроса.
+
+        Returns:
+            stmt: Отсортированное выражение для запроса в БД.
+        """
+
+        if not query_params.asc:
+            return stmt.order_by(cls.model.created_at.desc(), cls.model.id.desc())
+
+        return stmt.order_by(cls.model.created_at, cls.model.id)
+
     # MARK: Update
     @classmethod
     async def update(
@@ -444,3 +631,30 @@ class BaseRepository(
             return 0
 
         return total_count
+
+    @classmethod
+    async def estimate_count_subquery(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[types.ModelType]],
+    ) -> int:
+        """
+        Получить приблизительное количество сущностей по оценке планировщика
+        Postgres (`EXPLAIN`), не выполняя сам запрос.
+
+        Точность зависит от актуальности статистики таблиц (`ANALYZE`).
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            stmt (Select[Tuple[ModelType]]): финальное выражение для запроса в БД.
+
+        Returns:
+            estimated_count: оценка количества сущностей.
+        """
+
+        result = await session.execute(Explain(stmt.order_by(None)))
+        plan = result.scalar()
+        if isinstance(plan, (str, bytes)):
+            plan = orjson.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -18,14 +18,38 @@ class PaginationBaseSchema(BaseModel):
         default=True,
         description="Сортировка по возрастанию.",
     )
+    keyset: bool = Field(
+        default=False,
+        description=(
+            "Пагинация по курсору вместо смещения. "
+            "Для следующей страницы передайте `cursor` из ответа."
+        ),
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы, включает keyset пагинацию.",
+    )
 
 
 class DataListGetBaseSchema(BaseModel):
     """Базовая схема для отображения списка сущностей."""
 
-    count: int = Field(
-        description="Общее количество сущностей без учета пагинации.",
+    count: int | None = Field(
+        default=None,
+        description=(
+            "Общее количество сущностей без учета пагинации. "
+            "Приблизительное при оценочном подсчете, "
+            "отсутствует, если подсчет отключен."
+        ),
+    )
+    has_more: bool | None = Field(
+        default=None,
+        description="Есть ли следующая страница, если подсчет отключен.",
     )
     data: list = Field(
         description="Список сущностей.",
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы при keyset пагинации.",
+    )
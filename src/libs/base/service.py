@@ -6,8 +6,9 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.libs.base.types as types
-from src.core import exceptions
+from src.core import constants, exceptions
 from src.libs.base.repository import BaseRepository
+from src.libs.services.cursor_service import CursorService
 
 
 class BaseService(
@@ -36,6 +37,7 @@ class BaseService(
         "Данные не найдены.",
         1002,
     )
+    count_strategy: constants.CountStrategyEnum = constants.CountStrategyEnum.EXACT
 
     # MARK: Utils
     @classmethod
@@ -128,7 +130,7 @@ class BaseService(
         logger.opt(depth=1).info("Поиск объекта по ID: {}", id)
 
         # Поиск объекта в БД
-        obj_db = await cls.repository.get_one_or_none(session=session, id=id)
+        obj_db = await cls.repository.get_by_id(session=session, id=id)
 
         if obj_db is None or (user_id and obj_db.user_id != user_id):
             raise exceptions.NotFoundException(message=cls.not_found_exception_message)
@@ -142,15 +144,23 @@ class BaseService(
         session: AsyncSession,
         query_params: types.PaginationSchemaType,
         user_id: int | None = None,
+        count_strategy: constants.CountStrategyEnum | None = None,
     ) -> types.GetListSchemaType:
         """
         Получить список объектов и их общее количество
         с фильтрацией по query параметрам, отличным от None.
 
+        Способ подсчета общего количества задается `count_strategy`
+        (по умолчанию `cls.count_strategy`):
+            - EXACT: точное количество оконной функцией в запросе страницы;
+            - ESTIMATED: оценка планировщика Postgres;
+            - NONE: без подсчета, возвращается только флаг `has_more`.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             query_params (GetQuerySchemaType): Query параметры для фильтрации.
             user_id (int | None): Идентификатор пользователя.
+            count_strategy (CountStrategyEnum | None): Способ подсчета количества.
 
         Returns:
             GetListSchemaType: список объектов и их общее количество.
@@ -164,26 +174,79 @@ class BaseService(
             query_params.model_dump(),
         )
 
+        count_strategy = count_strategy or cls.count_strategy
+
         base_stmt = await cls.repository.get_stmt_by_query(
             query_params=query_params,
         )
         if user_id:
             base_stmt = base_stmt.where(cls.repository.model.user_id == user_id)
 
-        objects_db = await cls.repository.get_all_with_pagination_from_stmt(
-            session=session,
-            limit=query_params.limit,
-            offset=query_params.offset,
-            stmt=base_stmt,
+        is_keyset = bool(query_params.keyset or query_params.cursor)
+        limit = query_params.limit
+        # Запрашивается на одну запись больше, чтобы понять,
+        # есть ли следующая страница, не считая все записи.
+        fetch_extra = bool(limit) and (
+            is_keyset or count_strategy == constants.CountStrategyEnum.NONE
         )
+        fetch_limit = limit + 1 if fetch_extra else limit
+
+        objects_count = None
+        if is_keyset:
+            objects_db = await cls.repository.get_all_with_cursor_from_stmt(
+                session=session,
+                stmt=base_stmt,
+                limit=fetch_limit,
+                cursor=CursorService.decode(query_params.cursor)
+                if query_params.cursor
+                else None,
+                ascending=bool(query_params.asc),
+            )
+        elif count_strategy == constants.CountStrategyEnum.EXACT:
+            (
+                objects_db,
+                objects_count,
+            ) = await cls.repository.get_all_with_count_from_stmt(
+                session=session,
+                stmt=base_stmt,
+                limit=fetch_limit,
+                offset=query_params.offset,
+            )
+        else:
+            objects_db = await cls.repository.get_all_with_pagination_from_stmt(
+                session=session,
+                limit=fetch_limit,
+                offset=query_params.offset,
+                stmt=base_stmt,
+            )
 
         if not objects_db:
             raise exceptions.NotFoundException(message=cls.not_found_exception_message)
 
-        objects_count = await cls.repository.count_subquery(
-            session=session,
-            stmt=base_stmt,
-        )
+        has_more, next_cursor = None, None
+        if fetch_extra:
+            has_more = len(objects_db) > limit
+            if has_more:
+                objects_db = objects_db[:limit]
+                if is_keyset:
+                    next_cursor = CursorService.encode(
+                        objects_db[-1].created_at,
+                        objects_db[-1].id,
+                    )
+
+        # Курсор сужает выборку, поэтому при keyset пагинации
+        # точное количество считается отдельно по исходному выражению.
+        if objects_count is None:
+            if count_strategy == constants.CountStrategyEnum.EXACT:
+                objects_count = await cls.repository.count_subquery(
+                    session=session,
+                    stmt=base_stmt,
+                )
+            elif count_strategy == constants.CountStrategyEnum.ESTIMATED:
+                objects_count = await cls.repository.estimate_count_subquery(
+                    session=session,
+                    stmt=base_stmt,
+                )
 
         # Получаем класс схемы для одного объекта
         item_schema_class = await cls._get_schema_class_by_type(types.GetSchemaType)
@@ -195,7 +258,9 @@ class BaseService(
 
         return list_schema_class(
             count=objects_count,
+            has_more=has_more,
             data=objects_schema,
+            next_cursor=next_cursor,
         )
 
     # MARK: Update
@@ -0,0 +1,51 @@
+import base64
+from datetime import datetime
+
+import orjson
+
+from src.core import exceptions
+
+
+class CursorService:
+    """Класс для кодирования курсоров keyset пагинации."""
+
+    @staticmethod
+    def encode(created_at: datetime, id: int) -> str:
+        """
+        Закодировать позицию записи в непрозрачный курсор.
+
+        Args:
+            created_at (datetime): Дата создания последней записи страницы.
+            id (int): ID последней записи страницы.
+
+        Returns:
+            str: Курсор в формате base64url.
+        """
+
+        raw = orjson.dumps([created_at.isoformat(), id])
+
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> tuple[datetime, int]:
+        """
+        Декодировать курсор, полученный от клиента.
+
+        Args:
+            cursor (str): Курсор в формате base64url.
+
+        Returns:
+            tuple[datetime, int]: Дата создания и ID записи.
+
+        Raises:
+            BadRequestException: Невалидный курсор.
+        """
+
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            created_at, id = orjson.loads(raw)
+
+            return datetime.fromisoformat(created_at), int(id)
+
+        except Exception:
+            raise exceptions.BadRequestException(message="Невалидный курсор.")
@@ -0,0 +1,67 @@
+import asyncio
+
+import aiohttp
+import orjson
+
+from src.core.settings import settings
+
+
+class HTTPClientService:
+    """
+    Общий HTTP клиент процесса для обращений к внешним API.
+
+    Одна `aiohttp.ClientSession` на event loop переиспользует соединения
+    (keep-alive) и кэширует DNS, поэтому повторный запрос к тому же хосту
+    не тратит время на установку TCP и TLS соединения.
+    Создается при старте API или процесса воркера и закрывается при остановке.
+    """
+
+    _session: aiohttp.ClientSession | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Получить сессию для текущего event loop, создав ее при необходимости.
+
+        Сессия привязана к event loop, в котором создана, поэтому при смене
+        loop (например, в тестах) создается новая.
+
+        Returns:
+            aiohttp.ClientSession: Сессия с общим пулом соединений.
+        """
+
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._loop is not loop:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.HTTP_CLIENT_LIMIT,
+                    limit_per_host=settings.HTTP_CLIENT_LIMIT_PER_HOST,
+                    keepalive_timeout=settings.HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=settings.HTTP_CLIENT_DNS_CACHE_TTL,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=settings.HTTP_CLIENT_TIMEOUT,
+                    connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+                ),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+            cls._loop = loop
+
+        return cls._session
+
+    @classmethod
+    async def start(cls) -> None:
+        """Создать сессию заранее, при старте процесса."""
+
+        cls.get_session()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Закрыть сессию и все соединения пула."""
+
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+
+        cls._session = None
+        cls._loop = None
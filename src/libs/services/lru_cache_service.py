@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+
+class LRUCacheService(Generic[KeyType, ValueType]):
+    """
+    Ограниченный по размеру кэш в памяти процесса с временем жизни записей.
+
+    При переполнении вытесняется запись, которая дольше всех не запрашивалась.
+    Запись с истекшим временем жизни удаляется при обращении к ней.
+
+    Args:
+        maxsize: Максимальное количество записей.
+        ttl: Время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """
+        Получить значение по ключу.
+
+        Args:
+            key: Ключ.
+
+        Returns:
+            Значение или `None`, если записи нет или она истекла.
+        """
+
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+
+        return value
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        """
+        Сохранить значение по ключу.
+
+        Args:
+            key: Ключ.
+            value: Значение.
+        """
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: KeyType) -> None:
+        """
+        Удалить запись по ключу, если она есть.
+
+        Args:
+            key: Ключ.
+        """
+
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Очистить кэш."""
+
+        self._data.clear()
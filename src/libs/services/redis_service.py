@@ -1,17 +1,162 @@
+import time
+from typing import Any, Awaitable, TypeVar
+
 from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
 
 from src.core import constants
 from src.core.settings import settings
 
+T = TypeVar("T")
+
+REDIS_URL = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}"
+
+
+class RedisMetrics:
+    """Счетчики команд Redis в рамках процесса."""
+
+    commands: int = 0
+    errors: int = 0
+    latency_seconds_total: float = 0.0
+    latency_seconds_max: float = 0.0
+
+    @classmethod
+    def record(cls, seconds: float, is_error: bool = False) -> None:
+        """
+        Учесть выполнение команды или пайплайна.
+
+        Args:
+            seconds (float): Время выполнения в секундах.
+            is_error (bool): Завершилось ли выполнение ошибкой.
+        """
+
+        cls.commands += 1
+        cls.errors += is_error
+        cls.latency_seconds_total += seconds
+        cls.latency_seconds_max = max(cls.latency_seconds_max, seconds)
+
+
+class MeteredConnectionPool(aioredis.BlockingConnectionPool):
+    """
+    Блокирующий пул соединений Redis со счетчиком занятых соединений.
+
+    Счетчик ведется в публичных методах пула, поэтому
+    не зависит от его внутреннего устройства.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._acquired: set[int] = set()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def in_use_connections(self) -> int:
+        return len(self._acquired)
+
+    def reset(self) -> None:
+        super().reset()
+        self._acquired = set()
+
+    async def get_connection(self, command_name, *keys, **options):
+        connection = await super().get_connection(command_name, *keys, **options)
+        self._acquired.add(id(connection))
+        return connection
+
+    async def release(self, connection) -> None:
+        self._acquired.discard(id(connection))
+        await super().release(connection)
+
 
 class RedisService:
-    """Класс для сервиса Redis."""
+    """
+    Класс для сервиса Redis.
 
-    _redis = aioredis.from_url(
-        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+    Команды выполняются через общий пул из `REDIS_MAX_CONNECTIONS` соединений:
+    при исчерпании пула запрос ждет свободное соединение
+    не дольше `REDIS_POOL_TIMEOUT` секунд.
+    Подписки используют отдельный клиент без таймаута чтения,
+    так как ожидают сообщения неограниченно долго.
+    """
+
+    _pool = MeteredConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+    _redis = aioredis.Redis(connection_pool=_pool)
+    _pubsub_redis = aioredis.from_url(
+        REDIS_URL,
         decode_responses=True,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+    _hash_set_if_not_exists = _redis.register_script(
+        constants.REDIS_HASH_SET_IF_NOT_EXISTS_SCRIPT
+    )
+    _hash_get_and_incr = _redis.register_script(
+        constants.REDIS_HASH_GET_AND_INCR_SCRIPT
     )
+    _sorted_set_add_if_exists = _redis.register_script(
+        constants.REDIS_SORTED_SET_ADD_IF_EXISTS_SCRIPT
+    )
+
+    # MARK: Utils
+    @staticmethod
+    async def _call(awaitable: Awaitable[T]) -> T:
+        """
+        Выполнить команду Redis с учетом ее времени в метриках.
+
+        Args:
+            awaitable (Awaitable[T]): Команда или пайплайн.
+
+        Returns:
+            T: Ответ Redis.
+        """
+
+        started_at = time.perf_counter()
+        is_error = False
+        try:
+            return await awaitable
+        except RedisError:
+            is_error = True
+            raise
+        finally:
+            RedisMetrics.record(time.perf_counter() - started_at, is_error)
 
+    @classmethod
+    def pipeline(cls, transaction: bool = True) -> Pipeline:
+        """
+        Метод для создания пайплайна, команды которого
+        отправляются в Redis за один запрос.
+
+        Args:
+            transaction (bool): Выполнить команды атомарно в MULTI/EXEC.
+
+        Returns:
+            Pipeline: Пайплайн, выполняется через `execute`.
+        """
+        return cls._redis.pipeline(transaction=transaction)
+
+    @classmethod
+    async def execute(cls, pipe: Pipeline) -> list[Any]:
+        """
+        Метод для выполнения пайплайна.
+
+        Args:
+            pipe (Pipeline): Пайплайн из `pipeline`.
+
+        Returns:
+            list[Any]: Ответы на команды пайплайна.
+        """
+        async with pipe:
+            return await cls._call(pipe.execute())
+
+    # MARK: Strings
     @classmethod
     async def set(
         cls, key: str, value: str, expire: int = constants.REDIS_EXPIRE_SECONDS
@@ -24,7 +169,7 @@ class RedisService:
             value (str): Значение для установки.
             expire (int): Время жизни ключа в секундах.
         """
-        await cls._redis.set(key, value, ex=expire)
+        await cls._call(cls._redis.set(key, value, ex=expire))
 
     @classmethod
     async def get(cls, key: str) -> str | None:
@@ -37,14 +182,268 @@ class RedisService:
         Returns:
             str | None: Значение из Redis.
         """
-        return await cls._redis.get(key)
+        return await cls._call(cls._redis.get(key))
+
+    @classmethod
+    async def delete(cls, *keys: str) -> None:
+        """
+        Метод для удаления значений из Redis.
+
+        Args:
+            *keys (str): Ключи для удаления значений.
+        """
+        await cls._call(cls._redis.delete(*keys))
+
+    @classmethod
+    async def get_and_expire(cls, key: str, expire: int) -> str | None:
+        """
+        Метод для получения значения с продлением времени жизни ключа.
+
+        Args:
+            key (str): Ключ для получения значения.
+            expire (int): Новое время жизни ключа в секундах.
+
+        Returns:
+            str | None: Значение из Redis.
+        """
+        return await cls._call(cls._redis.getex(key, ex=expire))
+
+    @classmethod
+    async def incr_many(
+        cls,
+        keys: list[str],
+        expire: int = constants.REDIS_EXPIRE_SECONDS,
+    ) -> None:
+        """
+        Метод для увеличения нескольких счетчиков за один запрос.
+
+        Args:
+            keys (list[str]): Ключи счетчиков.
+            expire (int): Время жизни ключей в секундах.
+        """
+        if not keys:
+            return
+
+        pipe = cls.pipeline(transaction=False)
+        for key in keys:
+            pipe.incr(key)
+            pipe.expire(key, expire)
+        await cls.execute(pipe)
+
+    @classmethod
+    async def get_many(cls, keys: list[str]) -> list[str | None]:
+        """
+        Метод для получения нескольких значений за один запрос.
+
+        Args:
+            keys (list[str]): Ключи.
+
+        Returns:
+            list[str | None]: Значения в порядке ключей.
+        """
+        if not keys:
+            return []
+        return await cls._call(cls._redis.mget(keys))
+
+    @classmethod
+    async def set_many(
+        cls,
+        mapping: dict[str, str],
+        expire: int = constants.REDIS_EXPIRE_SECONDS,
+    ) -> None:
+        """
+        Метод для установки нескольких значений за один запрос.
+
+        Args:
+            mapping (dict[str, str]): Значения по ключам.
+            expire (int): Время жизни ключей в секундах.
+        """
+        if not mapping:
+            return
+
+        pipe = cls.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expire)
+        await cls.execute(pipe)
+
+    # MARK: Hashes
+    @classmethod
+    async def set_hash(
+        cls,
+        key: str,
+        mapping: dict[str, str | int],
+        expire: int = constants.REDIS_EXPIRE_SECONDS,
+    ) -> bool:
+        """
+        Метод для атомарного создания хэша, если ключа еще нет.
+
+        Args:
+            key (str): Ключ хэша.
+            mapping (dict[str, str | int]): Поля и значения.
+            expire (int): Время жизни ключа в секундах.
+
+        Returns:
+            bool: Создан ли хэш, `False` если ключ уже существует.
+        """
+        args: list[str | int] = [expire]
+        for field, value in mapping.items():
+            args.extend((field, value))
+
+        return bool(await cls._call(cls._hash_set_if_not_exists(keys=[key], args=args)))
+
+    @classmethod
+    async def get_and_incr_hash(
+        cls, key: str, field: str, amount: int = 1
+    ) -> dict[str, str]:
+        """
+        Метод для атомарного получения хэша и увеличения его поля.
+        Время жизни ключа сохраняется.
+
+        Args:
+            key (str): Ключ хэша.
+            field (str): Поле для увеличения.
+            amount (int): Изменение поля.
+
+        Returns:
+            dict[str, str]: Хэш до увеличения или пустой словарь, если ключа нет.
+        """
+        value = await cls._call(
+            cls._hash_get_and_incr(keys=[key], args=[field, amount])
+        )
 
+        return dict(zip(value[::2], value[1::2]))
+
+    # MARK: Sorted sets
     @classmethod
-    async def delete(cls, key: str) -> None:
+    async def replace_sorted_set(
+        cls,
+        key: str,
+        mapping: dict[str, float],
+        expire: int = constants.REDIS_EXPIRE_SECONDS,
+    ) -> None:
         """
-        Метод для удаления значения из Redis.
+        Метод для атомарной замены содержимого отсортированного множества.
 
         Args:
-            key (str): Ключ для удаления значения.
+            key (str): Ключ множества.
+            mapping (dict[str, float]): Элементы и их веса.
+            expire (int): Время жизни ключа в секундах.
         """
-        await cls._redis.delete(key)
+        pipe = cls.pipeline(transaction=True)
+        pipe.delete(key)
+        if mapping:
+            pipe.zadd(key, mapping)
+            pipe.expire(key, expire)
+        await cls.execute(pipe)
+
+    @classmethod
+    async def get_sorted_set(cls, key: str) -> list[tuple[str, float]]:
+        """
+        Метод для получения всех элементов отсортированного множества.
+
+        Args:
+            key (str): Ключ множества.
+
+        Returns:
+            list[tuple[str, float]]: Элементы и их веса по возрастанию веса.
+        """
+        return await cls._call(cls._redis.zrange(key, 0, -1, withscores=True))
+
+    @classmethod
+    async def incr_sorted_set(cls, key: str, member: str, amount: float) -> None:
+        """
+        Метод для изменения веса существующего элемента отсортированного множества.
+        Отсутствующий элемент не добавляется.
+
+        Args:
+            key (str): Ключ множества.
+            member (str): Элемент.
+            amount (float): Изменение веса.
+        """
+        await cls._call(cls._redis.zadd(key, {member: amount}, xx=True, incr=True))
+
+    @classmethod
+    async def add_to_sorted_set(cls, key: str, member: str, score: float) -> None:
+        """
+        Метод для добавления элемента в существующее отсортированное множество.
+        Отсутствующее множество не создается, существующий элемент не изменяется.
+
+        Args:
+            key (str): Ключ множества.
+            member (str): Элемент.
+            score (float): Вес элемента.
+        """
+        await cls._call(cls._sorted_set_add_if_exists(keys=[key], args=[score, member]))
+
+    @classmethod
+    async def remove_from_sorted_set(cls, key: str, member: str) -> None:
+        """
+        Метод для удаления элемента из отсортированного множества.
+
+        Args:
+            key (str): Ключ множества.
+            member (str): Элемент.
+        """
+        await cls._call(cls._redis.zrem(key, member))
+
+    # MARK: Pub/Sub
+    @classmethod
+    async def publish(cls, channel: str, message: str) -> None:
+        """
+        Метод для публикации сообщения в канал Redis.
+
+        Args:
+            channel (str): Канал для публикации.
+            message (str): Сообщение.
+        """
+        await cls._call(cls._redis.publish(channel, message))
+
+    @classmethod
+    def pubsub(cls) -> aioredis.client.PubSub:
+        """
+        Метод для получения объекта подписки на каналы Redis.
+
+        Returns:
+            PubSub: Объект подписки.
+        """
+        return cls._pubsub_redis.pubsub()
+
+    # MARK: Health
+    @classmethod
+    async def ping(cls) -> float | None:
+        """
+        Метод для проверки доступности Redis.
+
+        Returns:
+            float | None: Время ответа в секундах или `None`, если Redis недоступен.
+        """
+        started_at = time.perf_counter()
+        try:
+            await cls._call(cls._redis.ping())
+        except RedisError:
+            return None
+
+        return time.perf_counter() - started_at
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """
+        Метод для получения состояния пула соединений и счетчиков команд.
+
+        Returns:
+            dict[str, Any]: Состояние пула и счетчики.
+        """
+        return {
+            "max_connections": cls._pool.max_connections,
+            "in_use_connections": cls._pool.in_use_connections,
+            "commands": RedisMetrics.commands,
+            "errors": RedisMetrics.errors,
+            "latency_seconds_total": RedisMetrics.latency_seconds_total,
+            "latency_seconds_max": RedisMetrics.latency_seconds_max,
+        }
+
+    @classmethod
+    async def close(cls) -> None:
+        """Метод для закрытия соединений с Redis."""
+        await cls._redis.aclose(close_connection_pool=True)
+        await cls._pubsub_redis.aclose()
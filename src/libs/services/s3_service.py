@@ -1,14 +1,29 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import PurePosixPath
+from typing import Any, Callable
+
 import boto3
 import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from fastapi import UploadFile
+from loguru import logger
 
 from src.core import constants, exceptions
 from src.core.settings import settings
 
 
 class S3Service:
-    """Сервис для работы с S3."""
+    """
+    Сервис для работы с S3.
+
+    Клиент boto3 синхронный и потокобезопасный, поэтому обращения к S3
+    выполняются в пуле из `S3_MAX_CONCURRENCY` потоков и не блокируют event loop.
+    Существование бакета проверяется один раз при старте приложения.
+    """
 
     _client = boto3.client(
         "s3",
@@ -16,8 +31,50 @@ class S3Service:
         aws_access_key_id=settings.S3_ACCESS_KEY,
         aws_secret_access_key=settings.S3_SECRET_KEY,
         region_name="ru-msk-1",
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.S3_MAX_CONCURRENCY,
+        ),
+    )
+    _transfer_config = TransferConfig(
+        multipart_threshold=constants.S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=constants.S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=constants.S3_MULTIPART_CONCURRENCY,
     )
+    _executor: ThreadPoolExecutor | None = None
+    _is_bucket_ready: bool = False
+
+    # MARK: Utils
+    @classmethod
+    async def _run(cls, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Выполнить синхронный вызов клиента S3 в пуле потоков.
+
+        Args:
+            func: Метод клиента.
+            *args: Позиционные аргументы.
+            **kwargs: Именованные аргументы.
+
+        Returns:
+            Результат вызова.
+        """
+
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.S3_MAX_CONCURRENCY,
+                thread_name_prefix="s3",
+            )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            cls._executor, partial(func, *args, **kwargs)
+        )
+
+    @classmethod
+    def _get_file_url(cls, key: str) -> str:
+        return (
+            f"{settings.S3_ENDPOINT.replace('s3', 'localhost')}/"
+            f"{settings.S3_BUCKET_NAME}/{key}"
+        )
 
     @classmethod
     def _ensure_bucket_exists(cls) -> None:
@@ -42,81 +99,211 @@ class S3Service:
 
             except Exception as e:
                 raise exceptions.InternalServerErrorException(
-                    f"Ошибка при создании бакета: {str(e)}"
+                    message=f"Ошибка при создании бакета: {str(e)}"
                 )
 
+        cls._is_bucket_ready = True
+
     @classmethod
-    async def upload_bulk(cls, files: list[UploadFile]) -> list[str]:
+    async def _ensure_bucket_ready(cls) -> None:
         """
-        Загружает файлы в S3 и возвращает их URL
+        Проверить бакет, если при старте приложения это не удалось.
+
+        Raises:
+            InternalServerErrorException: Ошибка при создании бакета
+        """
+
+        if not cls._is_bucket_ready:
+            await cls._run(cls._ensure_bucket_exists)
+
+    # MARK: Lifecycle
+    @classmethod
+    async def start(cls) -> None:
+        """
+        Проверить или создать бакет при старте приложения.
+        Недоступность S3 не мешает старту: проверка повторится
+        при первом обращении к S3.
+        """
+
+        try:
+            await cls._run(cls._ensure_bucket_exists)
+
+        except exceptions.InternalServerErrorException as e:
+            logger.warning("S3 бакет недоступен при старте: {}", e.detail["message"])
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Остановить пул потоков S3.
+        Завершения загрузок пул ждет в отдельном потоке, не блокируя event loop.
+        """
+
+        executor, cls._executor = cls._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, True)
+
+    # MARK: Upload
+    @classmethod
+    async def _upload(cls, file: UploadFile, prefix: str) -> str:
+        """
+        Загружает файл в S3 потоком, не читая его целиком в память.
+        Файлы больше `S3_MULTIPART_THRESHOLD` загружаются по частям.
+
+        Args:
+            file: Файл для загрузки
+            prefix: Префикс ключа файла
+
+        Returns:
+            URL файла
+        """
+
+        key = f"{prefix}/{PurePosixPath(file.filename or '').name}"
+
+        await cls._run(
+            cls._client.upload_fileobj,
+            file.file,
+            settings.S3_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": file.content_type},
+            Config=cls._transfer_config,
+        )
+
+        return cls._get_file_url(key)
+
+    @classmethod
+    async def upload_bulk(
+        cls,
+        files: list[UploadFile],
+        user_id: int,
+        prefix: str | None = None,
+    ) -> list[str]:
+        """
+        Загружает файлы в S3 параллельно и возвращает их URL.
+        Ключи файлов начинаются с `S3_USER_FILES_PREFIX` пользователя,
+        поэтому пользователь не может перезаписать чужие файлы.
 
         Args:
             files: Файлы для загрузки
+            user_id: ID пользователя, загружающего файлы
+            prefix: Префикс ключей файлов внутри файлов пользователя,
+                например `disputes/1`
 
         Returns:
-            Список URL файлов
+            Список URL файлов в порядке файлов
 
         Raises:
             InternalServerErrorException: Ошибка при загрузке файлов
         """
 
-        cls._ensure_bucket_exists()
-
-        file_urls: list[str] = []
+        await cls._ensure_bucket_ready()
 
-        for file in files:
-            try:
-                file_content = await file.read()
-                cls._client.put_object(
-                    Bucket=settings.S3_BUCKET_NAME,
-                    Key=file.filename,
-                    Body=file_content,
-                    ContentType=file.content_type,
-                )
-
-                file_urls.append(
-                    f"{settings.S3_ENDPOINT.replace('s3', 'localhost')}/"
-                    f"{settings.S3_BUCKET_NAME}/{file.filename}"
-                )
+        user_prefix = constants.S3_USER_FILES_PREFIX.format(user_id=user_id)
+        if prefix:
+            user_prefix = f"{user_prefix}/{prefix}"
 
-            except Exception as e:
-                raise exceptions.InternalServerErrorException(
-                    f"Ошибка при загрузке файла: {str(e)}"
+        try:
+            return list(
+                await asyncio.gather(
+                    *(cls._upload(file, user_prefix) for file in files)
                 )
+            )
 
-        return file_urls
+        except Exception as e:
+            raise exceptions.InternalServerErrorException(
+                message=f"Ошибка при загрузке файла: {str(e)}"
+            )
 
+    # MARK: Get
     @classmethod
-    async def get_all(cls) -> list[str]:
+    async def _list_page(
+        cls,
+        prefix: str | None,
+        limit: int,
+        continuation_token: str | None,
+    ) -> tuple[list[str], str | None]:
         """
-        Получает список всех файлов в бакете
+        Получает одну страницу ключей бакета
+
+        Args:
+            prefix: Префикс ключей
+            limit: Размер страницы
+            continuation_token: Токен страницы
 
         Returns:
-            Список URL файлов
+            Ключи страницы и токен следующей страницы
 
         Raises:
+            BadRequestException: Некорректный токен страницы
             InternalServerErrorException: Ошибка при получении списка файлов
-            NotFoundException: Файлы не найдены
         """
 
-        cls._ensure_bucket_exists()
+        params: dict[str, Any] = {
+            "Bucket": settings.S3_BUCKET_NAME,
+            "MaxKeys": min(limit, constants.S3_LIST_MAX_KEYS),
+        }
+        if prefix:
+            params["Prefix"] = prefix
+        if continuation_token:
+            params["ContinuationToken"] = continuation_token
 
         try:
-            response = cls._client.list_objects_v2(Bucket=settings.S3_BUCKET_NAME)
-            files: list[str] = []
-            if "Contents" in response:
-                for obj in response.get("Contents", []):
-                    files.append(
-                        f"{settings.S3_ENDPOINT.replace('s3', 'localhost')}/"
-                        f"{settings.S3_BUCKET_NAME}/{obj.get('Key', '')}"
-                    )
+            response = await cls._run(cls._client.list_objects_v2, **params)
 
-            if not files:
-                raise exceptions.NotFoundException("Файлы не найдены")
-
-            return files
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "InvalidArgument":
+                raise exceptions.BadRequestException(
+                    message="Некорректный токен страницы"
+                )
+            raise exceptions.InternalServerErrorException(
+                message=f"Ошибка при получении списка файлов: {str(e)}"
+            )
 
         except Exception as e:
             raise exceptions.InternalServerErrorException(
-                f"Ошибка при получении списка файлов: {str(e)}"
+                message=f"Ошибка при получении списка файлов: {str(e)}"
             )
+
+        keys = [obj["Key"] for obj in response.get("Contents", [])]
+        next_token = (
+            response.get("NextContinuationToken")
+            if response.get("IsTruncated")
+            else None
+        )
+
+        return keys, next_token
+
+    @classmethod
+    async def get_page(
+        cls,
+        prefix: str | None = None,
+        limit: int = constants.DEFAULT_QUERY_LIMIT,
+        continuation_token: str | None = None,
+    ) -> tuple[list[str], str | None]:
+        """
+        Получает страницу файлов бакета
+
+        Args:
+            prefix: Префикс ключей файлов
+            limit: Размер страницы, не больше `S3_LIST_MAX_KEYS`
+            continuation_token: Токен страницы из предыдущего ответа
+
+        Returns:
+            URL файлов страницы и токен следующей страницы
+
+        Raises:
+            BadRequestException: Некорректный токен страницы
+            InternalServerErrorException: Ошибка при получении списка файлов
+            NotFoundException: Файлы не найдены
+        """
+
+        await cls._ensure_bucket_ready()
+
+        keys, next_token = await cls._list_page(
+            prefix=prefix,
+            limit=limit,
+            continuation_token=continuation_token,
+        )
+        if not keys and not continuation_token:
+            raise exceptions.NotFoundException(message="Файлы не найдены")
+
+        return [cls._get_file_url(key) for key in keys], next_token
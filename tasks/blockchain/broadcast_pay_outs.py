@@ -0,0 +1,27 @@
+from loguru import logger
+
+from src.apps.blockchain.services.pay_out_broadcast_service import (
+    PayOutBroadcastService,
+)
+from src.core.dependencies import get_session
+from tasks.celery_worker import run_async, worker
+
+
+@worker.task
+def broadcast_pay_outs() -> None:
+    run_async(_broadcast_pay_outs())
+
+
+async def _broadcast_pay_outs() -> None:
+    """
+    Подписание и отправка в сеть одобренных выводов средств.
+
+    Обрабатывает очередь пачками, коммитя каждую пачку, пока она не опустеет.
+    Выводы средств, которые не удалось отправить, остаются в очереди
+    до следующего запуска.
+    """
+
+    async for session in get_session():
+        processed_count = await PayOutBroadcastService.process(session=session)
+        if processed_count:
+            logger.info(f"Обработано выводов средств: {processed_count}")
@@ -1,20 +1,20 @@
-import asyncio
-from datetime import datetime
-
 from loguru import logger
+from sqlalchemy import func
 
+from src.apps.blockchain.model import BlockchainTransactionModel
 from src.apps.blockchain.repository import BlockchainTransactionRepository
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
 from src.apps.transactions.model import TransactionStatusEnum
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
 from src.core import constants
 from src.core.dependencies import get_session
-from tasks.celery_worker import worker
+from tasks.celery_worker import run_async, worker
 
 
 @worker.task
 def check_pending_transactions() -> None:
-    asyncio.run(_check_pending_transactions())
+    run_async(_check_pending_transactions())
 
 
 async def _check_pending_transactions() -> None:
@@ -23,41 +23,39 @@ async def _check_pending_transactions() -> None:
     а именно если транзакция не подтверждена и время ожидания истекло,
     то транзакция отменяется.
 
-    Проходимся по всем транзакциям с пагинацией.
+    Проходимся только по истекшим транзакциям пачками
+    с keyset пагинацией, коммитя каждую пачку.
+    Оптимистичные изменения балансов кошельков в кэше отменяются.
     """
     async for session in get_session():
-        logger.info("Получение ожидающих транзакций блокчейна...")
-
-        i, batch_size = 0, 100
-        while True:
-            transactions_db = await BlockchainTransactionRepository.get_all(
-                session=session,
-                limit=batch_size * (i + 1),
-                offset=batch_size * i,
-                status=TransactionStatusEnum.PENDING,
-            )
-            if not transactions_db:
-                logger.info("Транзакций блокчейна в ожидании больше нет.")
-                break
-            i += 1
-
+        logger.info("Получение истекших транзакций блокчейна...")
+
+        processed_count = 0
+        async for transactions_db in BlockchainTransactionRepository.iterate_batches(
+            session,
+            BlockchainTransactionModel.expires_at < func.now(),
+            # Одобренные выводы средств уже в очереди на отправку
+            BlockchainTransactionModel.approved_at.is_(None),
+            batch_size=constants.CELERY_SWEEP_BATCH_SIZE,
+            status=TransactionStatusEnum.PENDING,
+        ):
             for transaction in transactions_db:
-                if transaction.expires_at < datetime.now():
-                    transaction.status = TransactionStatusEnum.FAILED
-                    # Отправление уведомления
-                    await NotificationService.create(
-                        session=session,
-                        data=notification_schemas.NotificationCreateSchema(
-                            user_id=transaction.user_id,
-                            message=constants.NOTIFICATION_MESSAGE_BLOCKCHAIN_TRANSACTION_EXPIRED.format(
-                                transaction_id=transaction.id,
-                            ),
+                transaction.status = TransactionStatusEnum.FAILED
+                # Отправление уведомления
+                NotificationService.enqueue(
+                    session=session,
+                    data=notification_schemas.NotificationCreateSchema(
+                        user_id=transaction.user_id,
+                        message=constants.NOTIFICATION_MESSAGE_BLOCKCHAIN_TRANSACTION_EXPIRED.format(
+                            transaction_id=transaction.id,
                         ),
-                    )
+                    ),
+                )
 
             await session.commit()
-            logger.info(
-                f"Обработано транзакций: {i * batch_size + len(transactions_db)}"
-            )
+            await WalletBalanceCacheService.revert(transactions_db)
+
+            processed_count += len(transactions_db)
+            logger.info(f"Обработано транзакций: {processed_count}")
 
         logger.info("Ожидающие транзакции блокчейна проверены.")
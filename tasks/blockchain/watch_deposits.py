@@ -0,0 +1,23 @@
+from src.apps.blockchain.services.deposit_watcher_service import (
+    DepositWatcherService,
+)
+from src.core.dependencies import get_session
+from tasks.celery_worker import run_async, worker
+
+
+@worker.task
+def watch_deposits() -> None:
+    run_async(_watch_deposits())
+
+
+async def _watch_deposits() -> None:
+    """
+    Обработка новых блоков блокчейна и подтверждение пополнений.
+
+    Обрабатывает блоки пачками, коммитя каждую пачку,
+    пока не догонит последний необратимый блок.
+    """
+
+    async for session in get_session():
+        while await DepositWatcherService.process_next_blocks(session=session):
+            pass
@@ -1,7 +1,16 @@
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
+from src.apps.blockchain.services.tron_service import TronService
 from src.core import constants
 from src.core.settings import settings
+from src.libs.services.http_client_service import HTTPClientService
+from src.libs.services.redis_service import RedisService
+
+T = TypeVar("T")
 
 worker = Celery(
     "tasks",
@@ -15,6 +24,10 @@ worker.conf.imports = [
     "tasks.transactions.check_pending_transactions",
     "tasks.blockchain.check_pending_transactions",
     "tasks.disputes.check_pending_disputes",
+    "tasks.ledger.fold_ledger_entries",
+    "tasks.wallets.refresh_wallet_balances",
+    "tasks.blockchain.watch_deposits",
+    "tasks.blockchain.broadcast_pay_outs",
 ]
 
 
@@ -35,4 +48,63 @@ worker.conf.beat_schedule = {
         "task": ("tasks.disputes.check_pending_disputes.check_pending_disputes"),
         "schedule": constants.CELERY_BEAT_CHECK_DISPUTES_PERIOD,
     },
+    "fold_ledger_entries": {
+        "task": "tasks.ledger.fold_ledger_entries.fold_ledger_entries",
+        "schedule": constants.CELERY_BEAT_FOLD_LEDGER_PERIOD,
+    },
+    "refresh_wallet_balances": {
+        "task": "tasks.wallets.refresh_wallet_balances.refresh_wallet_balances",
+        "schedule": constants.CELERY_BEAT_REFRESH_WALLET_BALANCES_PERIOD,
+    },
+    "watch_deposits": {
+        "task": "tasks.blockchain.watch_deposits.watch_deposits",
+        "schedule": constants.CELERY_BEAT_WATCH_DEPOSITS_PERIOD,
+    },
+    "broadcast_pay_outs": {
+        "task": "tasks.blockchain.broadcast_pay_outs.broadcast_pay_outs",
+        "schedule": constants.CELERY_BEAT_BROADCAST_PAY_OUTS_PERIOD,
+    },
 }
+
+
+# MARK: Event loop
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Получить event loop процесса воркера, создав его при необходимости.
+
+    Loop живет все время жизни процесса, а не одной задачи, поэтому
+    долгоживущие клиенты (общий HTTP клиент) переиспользуются между задачами.
+    """
+
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Выполнить корутину задачи в event loop процесса воркера."""
+
+    return get_event_loop().run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _start_worker_process(**kwargs) -> None:
+    run_async(HTTPClientService.start())
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_worker_process(**kwargs) -> None:
+    TronService.shutdown_sign_executor()
+    if _loop is None or _loop.is_closed():
+        return
+
+    _loop.run_until_complete(HTTPClientService.close())
+    _loop.run_until_complete(RedisService.close())
+    _loop.close()
@@ -1,22 +1,20 @@
-import asyncio
-from datetime import datetime
-
 from loguru import logger
+from sqlalchemy import func
 
-from src.apps.disputes.model import DisputeStatusEnum
+from src.apps.disputes.model import DisputeModel, DisputeStatusEnum
 from src.apps.disputes.repository import DisputeRepository
+from src.apps.disputes.service import DisputeService
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
 from src.apps.transactions.repository import TransactionRepository
-from src.apps.users.repository import UserRepository
 from src.core import constants
 from src.core.dependencies import get_session
-from tasks.celery_worker import worker
+from tasks.celery_worker import run_async, worker
 
 
 @worker.task
 def check_pending_disputes() -> None:
-    asyncio.run(_check_pending_disputes())
+    run_async(_check_pending_disputes())
 
 
 async def _check_pending_disputes() -> None:
@@ -25,83 +23,57 @@ async def _check_pending_disputes() -> None:
     а именно если диспут не подтвержден и время ожидания истекло,
     то транзакция отменяется, и баланс трейдера возвращаются на место.
 
-    Проходимся по всем диспутам с пагинацией.
+    Проходимся только по истекшим диспутам пачками
+    с keyset пагинацией, коммитя каждую пачку.
     """
     async for session in get_session():
-        logger.info("Получение ожидающих диспутов платформы...")
-
-        i, batch_size = 0, 100
-        while True:
-            disputes_db = await DisputeRepository.get_all(
-                session=session,
-                limit=batch_size * (i + 1),
-                offset=batch_size * i,
-                status=DisputeStatusEnum.PENDING,
-            )
-            if not disputes_db:
-                logger.info("Диспутов платформы в ожидании больше нет.")
-                break
-            i += 1
+        logger.info("Получение истекших диспутов платформы...")
 
+        processed_count = 0
+        async for disputes_db in DisputeRepository.iterate_batches(
+            session,
+            DisputeModel.expires_at < func.now(),
+            batch_size=constants.CELERY_SWEEP_BATCH_SIZE,
+            status=DisputeStatusEnum.PENDING,
+        ):
             for dispute_db in disputes_db:
-                if dispute_db.expires_at < datetime.now():
-                    dispute_db.status = DisputeStatusEnum.CLOSED
-                    transaction_db = await TransactionRepository.get_one_or_none(
-                        session=session,
-                        id=dispute_db.transaction_id,
-                    )
-                    if transaction_db is None:
-                        continue
+                dispute_db.status = DisputeStatusEnum.CLOSED
+                transaction_db = await TransactionRepository.get_one_or_none(
+                    session=session,
+                    id=dispute_db.transaction_id,
+                )
+                if transaction_db is None:
+                    continue
 
-                    trader_db = await UserRepository.get_one_or_none(
-                        session=session,
-                        id=transaction_db.trader_id,
-                    )
-                    if trader_db is None:
-                        continue
+                # Разморозка средств трейдера, а если победил мерчант,
+                # то пополнение его баланса и списание средств с трейдера
+                DisputeService.enqueue_resolution(
+                    session=session,
+                    transaction_db=transaction_db,
+                    is_merchant_winner=(
+                        dispute_db.winner_id is not None
+                        and dispute_db.winner_id != transaction_db.trader_id
+                    ),
+                )
 
-                    # Разморозка средств трейдера
-                    if (
-                        dispute_db.winner_id is None
-                        or dispute_db.winner_id == trader_db.id
-                    ):
-                        trader_db.amount_frozen -= transaction_db.amount
-                    # Пополнение баланса мерчанта, списание средств с трейдера
-                    else:
-                        merchant_db = await UserRepository.get_one_or_none(
-                            session=session,
-                            id=transaction_db.merchant_id,
-                        )
-                        if merchant_db is None:
-                            continue
-
-                        merchant_db.balance += int(
-                            transaction_db.amount
-                            - transaction_db.amount
-                            * constants.MERCHANT_TRANSACTION_COMMISSION
-                        )
-                        trader_db.amount_frozen -= transaction_db.amount
-                        trader_db.balance -= int(
-                            transaction_db.amount
-                            + transaction_db.amount * constants.TRADER_DISPUTE_PENALTY
-                        )
-
-                    # Отправление уведомления
-                    for user_id in [
-                        transaction_db.merchant_id,
-                        transaction_db.trader_id,
-                    ]:
-                        await NotificationService.create(
-                            session=session,
-                            data=notification_schemas.NotificationCreateSchema(
-                                user_id=user_id,
-                                message=constants.NOTIFICATION_MESSAGE_DISPUTE_EXPIRED.format(
-                                    dispute_id=dispute_db.id,
-                                ),
+                # Отправление уведомления
+                for user_id in [
+                    transaction_db.merchant_id,
+                    transaction_db.trader_id,
+                ]:
+                    NotificationService.enqueue(
+                        session=session,
+                        data=notification_schemas.NotificationCreateSchema(
+                            user_id=user_id,
+                            message=constants.NOTIFICATION_MESSAGE_DISPUTE_EXPIRED.format(
+                                dispute_id=dispute_db.id,
                             ),
-                        )
+                        ),
+                    )
 
             await session.commit()
-            logger.info(f"Обработано диспутов: {i * batch_size + len(disputes_db)}")
+
+            processed_count += len(disputes_db)
+            logger.info(f"Обработано диспутов: {processed_count}")
 
         logger.info("Ожидающие диспуты платформы проверены.")
@@ -0,0 +1,37 @@
+from loguru import logger
+
+from src.apps.ledger.service import LedgerService
+from src.core import constants
+from src.core.dependencies import get_session
+from tasks.celery_worker import run_async, worker
+
+
+@worker.task
+def fold_ledger_entries() -> None:
+    run_async(_fold_ledger_entries())
+
+
+async def _fold_ledger_entries() -> None:
+    """
+    Свертка записей журнала изменений балансов в балансы пользователей.
+
+    При коммите записи сворачиваются сразу, но пользователи,
+    строки которых в этот момент заблокированы, пропускаются.
+    Задача догоняет их пачками, коммитя каждую пачку.
+    """
+
+    async for session in get_session():
+        processed_count = 0
+        while True:
+            users_count = await LedgerService.fold(
+                session=session,
+                limit=constants.CELERY_LEDGER_FOLD_BATCH_SIZE,
+            )
+            await session.commit()
+            if not users_count:
+                break
+
+            processed_count += users_count
+
+        if processed_count:
+            logger.info(f"Свернуто балансов пользователей: {processed_count}")
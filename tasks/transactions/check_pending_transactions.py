@@ -1,21 +1,18 @@
-import asyncio
-from datetime import datetime
-
 from loguru import logger
 
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.service import NotificationService
-from src.apps.transactions.model import TransactionStatusEnum
-from src.apps.transactions.repository import TransactionRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions.service import TransactionService
 from src.core import constants
+from src.core.constants import RequisiteIndexEventEnum
 from src.core.dependencies import get_session
-from tasks.celery_worker import worker
+from tasks.celery_worker import run_async, worker
 
 
 @worker.task
 def check_pending_transactions() -> None:
-    asyncio.run(_check_pending_transactions())
+    run_async(_check_pending_transactions())
 
 
 async def _check_pending_transactions() -> None:
@@ -29,52 +26,50 @@ async def _check_pending_transactions() -> None:
     Если транзакция типа "списание средств",
         то сумма размораживается на балансе мерчанта.
 
-    Проходимся по всем транзакциям с пагинацией.
+    Истекшие транзакции отменяются пачками: статусы и балансы
+    обновляются несколькими запросами на пачку, каждая пачка коммитится.
     """
 
     async for session in get_session():
-        logger.info("Получение ожидающих транзакций платформы...")
+        logger.info("Отмена истекших транзакций платформы...")
 
-        i, batch_size = 0, 100
+        processed_count = 0
         while True:
-            transactions_db = await TransactionRepository.get_all(
+            transactions_db = await TransactionService.expire_pending_bulk(
                 session=session,
-                limit=batch_size * (i + 1),
-                offset=batch_size * i,
-                status=TransactionStatusEnum.PENDING,
+                limit=constants.CELERY_SWEEP_BATCH_SIZE,
             )
             if not transactions_db:
-                logger.info("Транзакций платформы в ожидании больше нет.")
                 break
-            i += 1
 
+            # Отправление уведомления
             for transaction_db in transactions_db:
-                if transaction_db.expires_at < datetime.now():
-                    transaction_db.status = TransactionStatusEnum.FAILED
-                    await TransactionService.update_users_balances(
+                for user_id in [
+                    transaction_db.trader_id,
+                    transaction_db.merchant_id,
+                ]:
+                    NotificationService.enqueue(
                         session=session,
-                        transaction_db=transaction_db,
-                    )
-
-                    # Отправление уведомления
-                    for user_id in [
-                        transaction_db.trader_id,
-                        transaction_db.merchant_id,
-                    ]:
-                        await NotificationService.create(
-                            session=session,
-                            data=notification_schemas.NotificationCreateSchema(
-                                user_id=user_id,
-                                message=constants.NOTIFICATION_MESSAGE_TRANSACTION_EXPIRED.format(
-                                    transaction_id=transaction_db.id,
-                                ),
+                        data=notification_schemas.NotificationCreateSchema(
+                            user_id=user_id,
+                            message=constants.NOTIFICATION_MESSAGE_TRANSACTION_EXPIRED.format(
+                                transaction_id=transaction_db.id,
                             ),
-                        )
+                        ),
+                    )
 
             await session.commit()
 
-            logger.info(
-                f"Обработано транзакций: {i * batch_size + len(transactions_db)}"
+            await RequisiteIndexService.publish(
+                event=RequisiteIndexEventEnum.FREE,
+                requisite_ids=[
+                    transaction_db.requisite_id
+                    for transaction_db in transactions_db
+                    if transaction_db.requisite_id is not None
+                ],
             )
 
+            processed_count += len(transactions_db)
+            logger.info(f"Обработано транзакций: {processed_count}")
+
         logger.info("Ожидающие транзакции платформы проверены.")
@@ -0,0 +1,20 @@
+from loguru import logger
+
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
+from src.core.dependencies import get_session
+from tasks.celery_worker import run_async, worker
+
+
+@worker.task
+def refresh_wallet_balances() -> None:
+    run_async(_refresh_wallet_balances())
+
+
+async def _refresh_wallet_balances() -> None:
+    """
+    Обновление кэша балансов кошельков платформы с блокчейна.
+    """
+
+    async for session in get_session():
+        balances = await WalletBalanceCacheService.refresh(session=session)
+        logger.info(f"Обновлены балансы кошельков: {len(balances)}")
@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import (
 from src.apps.auth import schemas as auth_schemas
 from src.apps.auth.services.jwt_service import JWTService
 from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain.services.tron_service import TronService
 from src.apps.disputes import schemas as dispute_schemas
 from src.apps.disputes.model import DisputeModel
 from src.apps.disputes.repository import DisputeRepository
@@ -42,12 +43,15 @@ from src.apps.transactions.model import (
 )
 from src.apps.users.model import UserModel
 from src.apps.users.schemas import user_schemas
+from src.apps.users_permissions.permissions_cache import UserPermissionsCacheService
 from src.apps.users_permissions.repository import UsersPermissionsRepository
 from src.apps.wallets import schemas as wallet_schemas
+from src.apps.wallets.balance_cache import WalletBalanceCacheService
 from src.apps.wallets.model import WalletModel
 from src.core import constants
 from src.core.settings import settings
 from src.libs.services.hash_service import HashService
+from tests.fake_tron_rpc import FakeTronRPCServer
 
 faker = Faker()
 
@@ -163,6 +167,33 @@ async def mock_redis(mocker):
     mocker.patch(
         "src.libs.services.redis_service.RedisService.delete", return_value=None
     )
+    mocker.patch(
+        "src.libs.services.redis_service.RedisService.get_sorted_set", return_value=[]
+    )
+    mocker.patch(
+        "src.libs.services.redis_service.RedisService.get_many", return_value=[]
+    )
+    mocker.patch(
+        "src.libs.services.redis_service.RedisService.set_hash", return_value=True
+    )
+    mocker.patch(
+        "src.libs.services.redis_service.RedisService.get_and_incr_hash",
+        return_value={},
+    )
+    for method in (
+        "get_and_expire",
+        "incr_many",
+        "set_many",
+        "replace_sorted_set",
+        "incr_sorted_set",
+        "add_to_sorted_set",
+        "remove_from_sorted_set",
+    ):
+        mocker.patch(
+            f"src.libs.services.redis_service.RedisService.{method}", return_value=None
+        )
+    WalletBalanceCacheService.invalidate()
+    UserPermissionsCacheService.clear()
 
 
 # MARK: Permissions
@@ -446,6 +477,20 @@ def wallet_create_data() -> wallet_schemas.WalletCreateSchema:
     )
 
 
+@pytest_asyncio.fixture
+async def fake_tron_rpc(mocker) -> AsyncGenerator[FakeTronRPCServer, None]:
+    """Локальный JSON-RPC сервер вместо Tron API."""
+
+    TronService._block_timestamps.clear()
+    TronService._transactions.clear()
+    async with FakeTronRPCServer() as server:
+        mocker.patch.object(constants, "TRON_JRPC_API_URL", server.url)
+        mocker.patch.object(
+            constants, "TRON_BROADCAST_TRANSACTION_URL", server.broadcast_url
+        )
+        yield server
+
+
 # MARK: Blockchain transactions
 @pytest_asyncio.fixture
 async def blockchain_transaction_db(
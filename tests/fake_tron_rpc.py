@@ -0,0 +1,163 @@
+import asyncio
+import random
+
+import orjson
+from aiohttp import web
+
+from src.core import constants
+
+
+class FakeTronRPCServer:
+    """
+    Локальный JSON-RPC сервер, имитирующий Tron API, для тестов и бенчмарков.
+
+    Поддерживает одиночные и пакетные запросы `eth_getBalance`,
+    `eth_getTransactionByHash`, `eth_getBlockByHash`, `eth_blockNumber`
+    и `eth_getBlockByNumber`.
+    Ответы пакета возвращаются в перемешанном порядке, как допускает
+    спецификация JSON-RPC. Для неизвестных транзакций, как и в Tron,
+    возвращается `result: null`, для неизвестных кошельков и блоков - ошибка.
+    Отправленные на `broadcast_url` транзакции сохраняются в `broadcasts`,
+    в ответ возвращается `broadcast_response`.
+
+    Args:
+        balances: Балансы кошельков по адресам.
+        latency: Задержка ответа на каждый HTTP запрос в секундах.
+        transactions: Транзакции по хэшам (from, to, value, blockHash).
+        blocks: Timestamp блоков по хэшам.
+        block_hashes: Хэши блоков по номерам, по ним же определяются
+            номер блока транзакции и номер последнего блока.
+    """
+
+    def __init__(
+        self,
+        balances: dict[str, int] | None = None,
+        latency: float = 0.0,
+        transactions: dict[str, dict] | None = None,
+        blocks: dict[str, int] | None = None,
+        block_hashes: dict[int, str] | None = None,
+    ) -> None:
+        self.balances = balances or {}
+        self.latency = latency
+        self.transactions = transactions or {}
+        self.blocks = blocks or {}
+        self.block_hashes = block_hashes or {}
+        self.requests_count = 0
+        self.calls_count = 0
+        self.broadcast_response: dict = {"result": True}
+        self.broadcasts: list[dict] = []
+        self.url = ""
+        self.broadcast_url = ""
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> "FakeTronRPCServer":
+        app = web.Application()
+        app.router.add_post("/jsonrpc", self._handle)
+        app.router.add_post("/wallet/broadcasttransaction", self._handle_broadcast)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}/jsonrpc"
+        self.broadcast_url = f"http://{host}:{port}/wallet/broadcasttransaction"
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _get_transaction(self, hash: str) -> dict:
+        transaction = self.transactions[hash]
+        block_number = next(
+            (
+                number
+                for number, block_hash in self.block_hashes.items()
+                if block_hash == transaction["blockHash"]
+            ),
+            None,
+        )
+        return {
+            "hash": hash,
+            "from": transaction["from"],
+            "to": transaction["to"],
+            "value": hex(transaction["value"]),
+            "blockHash": transaction["blockHash"],
+            "blockNumber": hex(block_number) if block_number is not None else None,
+        }
+
+    def _get_block(self, hash: str, full: bool) -> dict:
+        transactions = [
+            self._get_transaction(transaction_hash) if full else transaction_hash
+            for transaction_hash, transaction in self.transactions.items()
+            if transaction["blockHash"] == hash
+        ]
+        return {
+            "hash": hash,
+            "timestamp": hex(self.blocks[hash]),
+            "transactions": transactions,
+        }
+
+    def _get_result(self, method: str | None, params: list) -> str | dict | None:
+        key = params[0] if params else None
+        full = len(params) > 1 and params[1]
+        if method == constants.TRON_GET_BALANCE_METHOD and key in self.balances:
+            return hex(self.balances[key])
+        if (
+            method == constants.TRON_GET_TRANSACTION_BY_HASH_METHOD
+            and key in self.transactions
+        ):
+            return self._get_transaction(key)
+        if method == constants.TRON_GET_BLOCK_BY_HASH_METHOD and key in self.blocks:
+            return self._get_block(key, full)
+        if method == constants.TRON_GET_BLOCK_NUMBER_METHOD and self.block_hashes:
+            return hex(max(self.block_hashes))
+        if method == constants.TRON_GET_BLOCK_BY_NUMBER_METHOD:
+            hash = self.block_hashes.get(int(key, 16))
+            if hash in self.blocks:
+                return self._get_block(hash, full)
+
+        return None
+
+    def _call(self, request: dict) -> dict:
+        self.calls_count += 1
+        response = {"jsonrpc": constants.TRON_JRPC_VERSION, "id": request.get("id")}
+
+        method = request.get("method")
+        result = self._get_result(method, request.get("params") or [])
+        if result is None and method == constants.TRON_GET_TRANSACTION_BY_HASH_METHOD:
+            response["result"] = None
+            return response
+
+        if result is None:
+            response["error"] = {"code": -32000, "message": "not found"}
+            return response
+
+        response["result"] = result
+
+        return response
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        data = orjson.loads(await request.read())
+        if isinstance(data, list):
+            result = [self._call(item) for item in data]
+            random.shuffle(result)
+        else:
+            result = self._call(data)
+
+        return web.Response(body=orjson.dumps(result), content_type="application/json")
+
+    async def _handle_broadcast(self, request: web.Request) -> web.Response:
+        self.broadcasts.append(orjson.loads(await request.read()))
+
+        return web.Response(
+            body=orjson.dumps(self.broadcast_response),
+            content_type="application/json",
+        )
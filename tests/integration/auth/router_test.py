@@ -1,12 +1,17 @@
 import httpx
+import pytest
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.common.routers.auth_router import router as auth_router
+from src.apps.auth import exceptions as auth_exceptions
 from src.apps.auth import schemas as auth_schemas
+from src.apps.auth.services.jwt_service import JWTService
 from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
 from src.apps.users.schemas import user_schemas
+from src.core import constants
+from src.core.settings import settings
 from src.libs.services.hash_service import HashService
 from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
@@ -184,3 +189,40 @@ class TestAuthRouter(BaseTestRouter):
         assert jwt_data.refresh_token is not None
         assert jwt_data.expires_at is not None
         assert jwt_data.token_type == "Bearer"
+
+    async def test_refresh_tokens_with_claims(
+        self,
+        router_client: httpx.AsyncClient,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        user_db: UserModel,
+        mocker,
+    ):
+        mocker.patch.object(settings, "JWT_CLAIMS_ENABLED", True)
+
+        response = await router_client.patch(
+            url="/auth/refresh",
+            json=auth_schemas.JWTRefreshSchema(
+                refresh_token=user_jwt_tokens.refresh_token
+            ).model_dump(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        jwt_data = auth_schemas.JWTGetSchema.model_validate(response.json())
+        claims = JWTService.decode_access_token(
+            jwt_data.access_token.removeprefix("Bearer ")
+        )
+
+        assert claims.id == user_db.id
+        assert claims.is_active == user_db.is_active
+        assert claims.version == 0
+        assert constants.PermissionEnum.GET_MY_USER.value in claims.permissions
+
+        # Разрешения берутся из токена, пока версия пользователя не изменилась
+        permissions = await JWTService.get_permissions_from_claims(claims)
+        assert permissions == set(claims.permissions)
+
+        mocker.patch(
+            "src.libs.services.redis_service.RedisService.get", return_value="1"
+        )
+        with pytest.raises(auth_exceptions.TokenRevokedException):
+            await JWTService.get_permissions_from_claims(claims)
@@ -1,3 +1,7 @@
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
 import httpx
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,15 +10,67 @@ from src.api.admin.routers.blockchain_router import (
     router as blockchain_transactions_router,
 )
 from src.apps.auth import schemas as auth_schemas
+from src.apps.blockchain import exceptions as blockchain_exceptions
 from src.apps.blockchain import schemas as blockchain_schemas
 from src.apps.blockchain.model import BlockchainTransactionModel, TransactionStatusEnum
 from src.apps.blockchain.repository import BlockchainTransactionRepository
+from src.apps.blockchain.services.pay_out_broadcast_service import (
+    PayOutBroadcastService,
+)
 from src.apps.users.model import UserModel
 from src.apps.wallets.model import WalletModel
 from src.core import constants
+from tests.fake_tron_rpc import FakeTronRPCServer
 from tests.integration.conftest import BaseTestRouter
 
 
+async def approve_pay_out(
+    session: AsyncSession,
+    transaction_db: BlockchainTransactionModel,
+) -> None:
+    transaction_db.approved_at = datetime.now()
+    await session.commit()
+
+
+def mock_sign_transaction(
+    mocker,
+    hashes: list[str],
+    expires_in: list[float] | None = None,
+) -> MagicMock:
+    """
+    Подменить создание и подпись транзакций вывода средств.
+
+    Args:
+        mocker: Фикстура pytest-mock.
+        hashes: Хэши создаваемых по очереди транзакций.
+        expires_in: Через сколько секунд истекает каждая транзакция.
+
+    Returns:
+        MagicMock: Мок создания транзакции.
+    """
+
+    transactions = [
+        {
+            "txID": hash,
+            "raw_data_hex": "00",
+            "raw_data": {"expiration": int((time.time() + seconds) * 1000)},
+        }
+        for hash, seconds in zip(hashes, expires_in or [60] * len(hashes))
+    ]
+    mocker.patch(
+        "src.apps.blockchain.services.tron_service.TronService.sign_transaction",
+        side_effect=lambda transaction, private_key: {
+            **transaction,
+            "signature": ["0" * 130],
+        },
+    )
+
+    return mocker.patch(
+        "src.apps.blockchain.services.tron_service.TronService.create_transaction",
+        side_effect=transactions,
+    )
+
+
 class TestBlockchainTransactionsRouter(BaseTestRouter):
     router = blockchain_transactions_router
 
@@ -106,11 +162,6 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
         hash = "0x123"
         trader_balance_before = user_trader_db_with_sbp.balance
 
-        mocker.patch(
-            "src.apps.blockchain.services.tron_service.TronService.create_and_sign_transaction",
-            return_value=hash,
-        )
-
         response = await router_client.patch(
             f"/blockchain-transactions/{blockchain_transaction_pay_out_db.id}",
             headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
@@ -118,6 +169,31 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_202_ACCEPTED
 
+        # Транзакция поставлена в очередь на отправку
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.PENDING
+        assert blockchain_transaction_pay_out_db.approved_at is not None
+
+        transaction = {
+            "txID": hash,
+            "raw_data_hex": "00",
+            "raw_data": {"expiration": int((time.time() + 60) * 1000)},
+        }
+        mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.create_transaction",
+            return_value=transaction,
+        )
+        mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.sign_transaction",
+            return_value={**transaction, "signature": ["0" * 130]},
+        )
+        broadcast_transaction = mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.broadcast_transaction",
+        )
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+        broadcast_transaction.assert_called_once()
+
         transaction_db = await BlockchainTransactionRepository.get_one_or_none(
             session=session,
             id=blockchain_transaction_pay_out_db.id,
@@ -125,6 +201,7 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
 
         assert transaction_db is not None
         assert transaction_db.status == TransactionStatusEnum.SUCCESS
+        assert transaction_db.hash == hash
 
         await session.refresh(user_trader_db_with_sbp)
         assert (
@@ -132,6 +209,151 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
             == trader_balance_before - transaction_db.amount
         )
 
+    # MARK: Broadcast queue
+    async def test_pay_out_broadcast_retried_and_deferred(
+        self,
+        blockchain_transaction_pay_out_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+        session: AsyncSession,
+        mocker,
+    ):
+        await approve_pay_out(session, blockchain_transaction_pay_out_db)
+        mock_sign_transaction(mocker, hashes=["0x123"])
+        mocker.patch.object(constants, "TRON_BROADCAST_RETRY_DELAY", 0)
+        fake_tron_rpc.broadcast_response = {"code": "SERVER_BUSY"}
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        # Отправка повторена и отложена до следующего запуска с той же подписью
+        assert len(fake_tron_rpc.broadcasts) == constants.TRON_BROADCAST_MAX_RETRIES
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.PENDING
+        assert blockchain_transaction_pay_out_db.broadcast_attempts == 1
+        assert blockchain_transaction_pay_out_db.hash == "0x123"
+        assert blockchain_transaction_pay_out_db.signed_transaction is not None
+
+    async def test_pay_out_broadcast_duplicate_is_success(
+        self,
+        blockchain_transaction_pay_out_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+        session: AsyncSession,
+        mocker,
+    ):
+        await approve_pay_out(session, blockchain_transaction_pay_out_db)
+        mock_sign_transaction(mocker, hashes=["0x123"])
+        fake_tron_rpc.broadcast_response = {
+            "result": False,
+            "code": constants.TRON_DUPLICATE_TRANSACTION_CODE,
+        }
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        assert len(fake_tron_rpc.broadcasts) == 1
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.SUCCESS
+        assert blockchain_transaction_pay_out_db.hash == "0x123"
+
+    async def test_pay_out_expired_transaction_signed_again(
+        self,
+        blockchain_transaction_pay_out_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+        session: AsyncSession,
+        mocker,
+    ):
+        await approve_pay_out(session, blockchain_transaction_pay_out_db)
+        create_transaction = mock_sign_transaction(
+            mocker, hashes=["0x123", "0x456"], expires_in=[-60, 60]
+        )
+        mocker.patch.object(constants, "TRON_BROADCAST_RETRY_DELAY", 0)
+        fake_tron_rpc.broadcast_response = {"code": "SERVER_BUSY"}
+
+        # Истекшей транзакции нет в сети, поэтому подпись сбрасывается
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.PENDING
+        assert blockchain_transaction_pay_out_db.hash is None
+        assert blockchain_transaction_pay_out_db.signed_transaction is None
+
+        fake_tron_rpc.broadcast_response = {"result": True}
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        assert create_transaction.call_count == 2
+        assert fake_tron_rpc.broadcasts[-1]["txID"] == "0x456"
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.SUCCESS
+        assert blockchain_transaction_pay_out_db.hash == "0x456"
+
+    async def test_pay_out_failed_after_max_attempts(
+        self,
+        blockchain_transaction_pay_out_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        session: AsyncSession,
+        mocker,
+    ):
+        await approve_pay_out(session, blockchain_transaction_pay_out_db)
+        mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.create_transaction",
+            side_effect=blockchain_exceptions.CreateTronTransactionException(
+                error_status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                error_text="",
+            ),
+        )
+
+        # Каждый запуск расходует одну попытку
+        for attempt in range(1, constants.TRON_PAY_OUT_MAX_ATTEMPTS):
+            assert await PayOutBroadcastService.process(session=session) == 1
+
+            await session.refresh(blockchain_transaction_pay_out_db)
+            assert (
+                blockchain_transaction_pay_out_db.status
+                == TransactionStatusEnum.PENDING
+            )
+            assert blockchain_transaction_pay_out_db.broadcast_attempts == attempt
+
+        incr_sorted_set = mocker.patch(
+            "src.libs.services.redis_service.RedisService.incr_sorted_set",
+            return_value=None,
+        )
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.FAILED
+        assert await PayOutBroadcastService.process(session=session) == 0
+
+        # Сумма отмененного вывода возвращается на баланс кошелька в кэше
+        incr_sorted_set.assert_called_once_with(
+            key=constants.WALLET_BALANCES_KEY,
+            member=blockchain_transaction_pay_out_db.from_address,
+            amount=blockchain_transaction_pay_out_db.amount,
+        )
+
+    async def test_pay_out_wallet_not_found(
+        self,
+        blockchain_transaction_pay_out_db: BlockchainTransactionModel,
+        user_trader_db_with_sbp: UserModel,
+        session: AsyncSession,
+        mocker,
+    ):
+        trader_balance_before = user_trader_db_with_sbp.balance
+        await approve_pay_out(session, blockchain_transaction_pay_out_db)
+        create_transaction = mock_sign_transaction(mocker, hashes=["0x123"])
+
+        assert await PayOutBroadcastService.process(session=session) == 1
+
+        create_transaction.assert_not_called()
+        await session.refresh(blockchain_transaction_pay_out_db)
+        assert blockchain_transaction_pay_out_db.status == TransactionStatusEnum.FAILED
+        assert blockchain_transaction_pay_out_db.hash is None
+
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.balance == trader_balance_before
+
     async def test_confirm_blockchain_transaction_with_wrong_status(
         self,
         router_client: httpx.AsyncClient,
@@ -139,16 +361,9 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
         admin_jwt_tokens: auth_schemas.JWTGetSchema,
         user_trader_db_with_sbp: UserModel,
         session: AsyncSession,
-        mocker,
     ):
-        hash = "0x123"
         trader_balance_before = user_trader_db_with_sbp.balance
 
-        mocker.patch(
-            "src.apps.blockchain.services.tron_service.TronService.create_and_sign_transaction",
-            return_value=hash,
-        )
-
         response = await router_client.patch(
             f"/blockchain-transactions/{blockchain_transaction_db.id}",
             headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
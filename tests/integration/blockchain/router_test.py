@@ -1,3 +1,7 @@
+import asyncio
+import hashlib
+
+import aiohttp
 import httpx
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,7 +13,10 @@ from src.apps.auth import schemas as auth_schemas
 from src.apps.blockchain import schemas as blockchain_schemas
 from src.apps.blockchain.model import BlockchainTransactionModel
 from src.apps.blockchain.repository import BlockchainTransactionRepository
+from src.apps.blockchain.services.tron_service import TronService
 from src.core import constants
+from src.core.settings import settings
+from src.libs.services.http_client_service import HTTPClientService
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -100,3 +107,72 @@ class TestBlockchainTransactionsRouter(BaseTestRouter):
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    # MARK: Sign
+    async def test_sign_transactions_in_order(self, mocker):
+        mocker.patch.object(settings, "TRON_SIGN_WORKERS", 3)
+        TronService.shutdown_sign_executor()
+
+        private_keys = [
+            hashlib.sha256(str(index).encode()).hexdigest() for index in range(3)
+        ]
+        transactions = [
+            (
+                {
+                    "txID": str(index),
+                    "raw_data_hex": hashlib.sha256(str(index).encode()).hexdigest(),
+                },
+                private_keys[index % len(private_keys)],
+            )
+            for index in range(10)
+        ]
+
+        try:
+            # Пачка делится на неравные части, которые подписываются в разных потоках
+            signed_transactions = await TronService.sign_transactions(
+                [
+                    (dict(transaction), private_key)
+                    for transaction, private_key in transactions
+                ]
+            )
+        finally:
+            TronService.shutdown_sign_executor()
+
+        assert [transaction["txID"] for transaction in signed_transactions] == [
+            transaction["txID"] for transaction, _ in transactions
+        ]
+        assert signed_transactions == [
+            TronService.sign_transaction(dict(transaction), private_key)
+            for transaction, private_key in transactions
+        ]
+
+    # MARK: HTTP client
+    async def test_http_client_session_per_loop(self):
+        await HTTPClientService.close()
+
+        # В пределах одного event loop возвращается одна и та же сессия
+        session = HTTPClientService.get_session()
+        assert HTTPClientService.get_session() is session
+
+        async def get_session_in_new_loop() -> aiohttp.ClientSession:
+            new_loop_session = HTTPClientService.get_session()
+            await HTTPClientService.close()
+            return new_loop_session
+
+        # В другом event loop создается новая сессия, `close` ее закрывает
+        new_loop_session = await asyncio.to_thread(
+            asyncio.run, get_session_in_new_loop()
+        )
+        assert new_loop_session is not session
+        assert new_loop_session.closed
+        assert not session.closed
+
+        # После возврата в исходный loop создается новая сессия
+        current_session = HTTPClientService.get_session()
+        assert current_session is not session
+
+        await HTTPClientService.close()
+        await session.close()
+
+        assert current_session.closed
+        assert HTTPClientService._session is None
@@ -7,6 +7,7 @@ from src.apps.auth import schemas as auth_schemas
 from src.apps.disputes import schemas as dispute_schemas
 from src.apps.disputes.model import DisputeModel, DisputeStatusEnum
 from src.apps.disputes.repository import DisputeRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions.repository import TransactionRepository
 from src.apps.users.repository import UserRepository
 from src.core import constants
@@ -114,12 +115,15 @@ class TestDisputesRouter(BaseTestRouter):
     # MARK: Update
     async def test_update_dispute_by_trader(
         self,
+        mocker,
         router_client: httpx.AsyncClient,
         dispute_db: DisputeModel,
         dispute_update_data: dispute_schemas.DisputeUpdateSchema,
         trader_jwt_tokens: auth_schemas.JWTGetSchema,
         session: AsyncSession,
     ):
+        publish_mock = mocker.patch.object(RequisiteIndexService, "publish")
+
         response = await router_client.put(
             url=f"/disputes/{dispute_db.id}",
             json=dispute_update_data.model_dump(),
@@ -135,3 +139,6 @@ class TestDisputesRouter(BaseTestRouter):
         assert dispute_update_data.description is not None
         assert dispute_update_data.description in updated_dispute_db.description
         assert updated_dispute_db.status == DisputeStatusEnum.PENDING
+
+        # Диспут остается открытым, индекс реквизитов не меняется
+        publish_mock.assert_not_called()
@@ -7,8 +7,13 @@ from src.apps.auth import schemas as auth_schemas
 from src.apps.disputes import schemas as dispute_schemas
 from src.apps.disputes.model import DisputeModel, DisputeStatusEnum
 from src.apps.disputes.repository import DisputeRepository
+from src.apps.ledger.repository import LedgerRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
+from src.apps.transactions.model import TransactionModel
+from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
 from src.core import constants
+from src.core.constants import RequisiteIndexEventEnum
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -17,12 +22,22 @@ class TestSupportDisputesRouter(BaseTestRouter):
 
     async def test_update_dispute_by_support(
         self,
+        mocker,
         router_client: httpx.AsyncClient,
         dispute_db: DisputeModel,
         dispute_support_update_data: dispute_schemas.DisputeSupportUpdateSchema,
         admin_jwt_tokens: auth_schemas.JWTGetSchema,
         session: AsyncSession,
+        transaction_merchant_pay_in_db: TransactionModel,
     ):
+        publish_mock = mocker.patch.object(RequisiteIndexService, "publish")
+
+        trader_db, merchant_db = await self._freeze_dispute_amount(
+            session=session,
+            dispute_db=dispute_db,
+        )
+        trader_balance_before = trader_db.balance
+
         response = await router_client.put(
             url=f"/support/disputes/{dispute_db.id}",
             json=dispute_support_update_data.model_dump(),
@@ -38,8 +53,116 @@ class TestSupportDisputesRouter(BaseTestRouter):
         assert updated_dispute_db.status == DisputeStatusEnum.CLOSED
 
         assert dispute_db.winner_id == dispute_support_update_data.winner_id
+
+        # Трейдер победил: сумма разморожена, балансы не меняются
+        await session.refresh(trader_db)
+        await session.refresh(merchant_db)
+        assert trader_db.amount_frozen == 0
+        assert trader_db.balance == trader_balance_before
+        assert merchant_db.balance == 0
+
+        # Реквизит закрытого диспута снова свободен в индексе
+        publish_mock.assert_awaited_once_with(
+            event=RequisiteIndexEventEnum.FREE,
+            requisite_ids=[transaction_merchant_pay_in_db.requisite_id],
+        )
+
+    async def test_update_dispute_by_support_merchant_winner(
+        self,
+        router_client: httpx.AsyncClient,
+        dispute_db: DisputeModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+    ):
+        trader_db, merchant_db = await self._freeze_dispute_amount(
+            session=session,
+            dispute_db=dispute_db,
+        )
+        trader_balance_before = trader_db.balance
+
+        response = await router_client.put(
+            url=f"/support/disputes/{dispute_db.id}",
+            json=dispute_schemas.DisputeSupportUpdateSchema(
+                winner_id=merchant_db.id,
+            ).model_dump(),
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        # Мерчант победил: с трейдера списывается сумма со штрафом,
+        #   мерчанту зачисляется сумма за вычетом комиссии
+        amount = dispute_db.transaction.amount
+        await session.refresh(trader_db)
+        await session.refresh(merchant_db)
+        assert trader_db.amount_frozen == 0
+        assert trader_db.balance == trader_balance_before - int(
+            amount + amount * constants.TRADER_DISPUTE_PENALTY
+        )
+        assert merchant_db.balance == int(
+            amount - amount * constants.MERCHANT_TRANSACTION_COMMISSION
+        )
+
+    async def test_update_dispute_by_support_unknown_winner(
+        self,
+        router_client: httpx.AsyncClient,
+        dispute_db: DisputeModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        user_admin_db: UserModel,
+        session: AsyncSession,
+    ):
+        trader_db, merchant_db = await self._freeze_dispute_amount(
+            session=session,
+            dispute_db=dispute_db,
+        )
+        trader_balance_before = trader_db.balance
+
+        response = await router_client.put(
+            url=f"/support/disputes/{dispute_db.id}",
+            json=dispute_schemas.DisputeSupportUpdateSchema(
+                winner_id=user_admin_db.id,
+            ).model_dump(),
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        # Победитель не участник диспута: решение не выносится
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        await session.refresh(dispute_db, attribute_names=["status"])
+        assert dispute_db.status == DisputeStatusEnum.PENDING
+
+        await session.refresh(trader_db)
+        await session.refresh(merchant_db)
+        assert trader_db.amount_frozen == dispute_db.transaction.amount
+        assert trader_db.balance == trader_balance_before
+        assert merchant_db.balance == 0
+        assert (
+            await LedgerRepository.count(
+                session=session,
+                transaction_id=dispute_db.transaction_id,
+            )
+            == 0
+        )
+
+    @staticmethod
+    async def _freeze_dispute_amount(
+        session: AsyncSession,
+        dispute_db: DisputeModel,
+    ) -> tuple[UserModel, UserModel]:
+        """Заморозить у трейдера сумму транзакции диспута, как при его создании."""
+
         trader_db = await UserRepository.get_one_or_none(
-            session=session, id=dispute_db.winner_id
+            session=session,
+            id=dispute_db.transaction.trader_id,
+        )
+        merchant_db = await UserRepository.get_one_or_none(
+            session=session,
+            id=dispute_db.transaction.merchant_id,
         )
         assert trader_db is not None
-        assert trader_db.amount_frozen < dispute_db.transaction.amount
+        assert merchant_db is not None
+
+        trader_db.amount_frozen = dispute_db.transaction.amount
+        await session.commit()
+
+        return trader_db, merchant_db
@@ -0,0 +1,180 @@
+import threading
+
+import httpx
+from botocore.exceptions import ClientError
+from fastapi import status
+
+from src.api.common.routers.s3_router import router as s3_router
+from src.apps.auth import schemas as auth_schemas
+from src.apps.files import schemas as file_schemas
+from src.apps.users.model import UserModel
+from src.core import constants
+from src.libs.services.s3_service import S3Service
+from tests.integration.conftest import BaseTestRouter
+
+
+class FakeS3Bucket:
+    """
+    Бакет S3 в памяти для `list_objects_v2`.
+    Токеном страницы служит индекс первого ключа страницы.
+    """
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = sorted(keys)
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        MaxKeys: int,
+        Prefix: str = "",
+        ContinuationToken: str | None = None,
+    ) -> dict:
+        if ContinuationToken is not None and not ContinuationToken.isdigit():
+            raise ClientError(
+                {"Error": {"Code": "InvalidArgument", "Message": "invalid token"}},
+                "ListObjectsV2",
+            )
+
+        keys = [key for key in self.keys if key.startswith(Prefix)]
+        start = int(ContinuationToken or 0)
+        end = start + MaxKeys
+        response = {
+            "Contents": [{"Key": key} for key in keys[start:end]],
+            "IsTruncated": end < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(end)
+
+        return response
+
+
+class TestS3Router(BaseTestRouter):
+    router = s3_router
+
+    # MARK: Upload
+    async def test_upload_files_concurrently(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        user_admin_db: UserModel,
+        mocker,
+    ):
+        file_names = ["a.png", "b.png", "c.png"]
+
+        # Каждая загрузка ждет остальные: последовательная загрузка
+        #   не дождется барьера и завершится ошибкой
+        barrier = threading.Barrier(len(file_names), timeout=5)
+        uploaded: dict[str, bytes] = {}
+
+        def upload_fileobj(fileobj, bucket, key, ExtraArgs, Config):
+            assert Config is S3Service._transfer_config
+            barrier.wait()
+            uploaded[key] = fileobj.read()
+
+        mocker.patch.object(S3Service, "_is_bucket_ready", True)
+        mocker.patch.object(
+            S3Service._client, "upload_fileobj", side_effect=upload_fileobj
+        )
+
+        response = await router_client.post(
+            "/s3",
+            data={"prefix": "disputes/1"},
+            files=[
+                ("files", (file_name, file_name.encode(), "image/png"))
+                for file_name in file_names
+            ],
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        keys = [
+            f"users/{user_admin_db.id}/disputes/1/{file_name}"
+            for file_name in file_names
+        ]
+        assert response.json()["file_urls"] == [
+            S3Service._get_file_url(key) for key in keys
+        ]
+        assert uploaded == {
+            key: file_name.encode() for key, file_name in zip(keys, file_names)
+        }
+
+    async def test_upload_files_invalid_prefix(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        mocker,
+    ):
+        upload_fileobj = mocker.patch.object(S3Service._client, "upload_fileobj")
+
+        response = await router_client.post(
+            "/s3",
+            data={"prefix": "../users/1"},
+            files=[("files", ("a.png", b"a", "image/png"))],
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        upload_fileobj.assert_not_called()
+
+    # MARK: Get
+    async def test_get_files_pages(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        mocker,
+    ):
+        bucket = FakeS3Bucket(
+            ["disputes/1/a.png", "disputes/1/b.png", "disputes/1/c.png", "other.png"]
+        )
+        mocker.patch.object(S3Service, "_is_bucket_ready", True)
+        mocker.patch.object(
+            S3Service._client, "list_objects_v2", side_effect=bucket.list_objects_v2
+        )
+
+        file_urls = []
+        query_params = file_schemas.FileListQuerySchema(prefix="disputes/1/", limit=2)
+        pages_count = 0
+        while True:
+            response = await router_client.get(
+                "/s3",
+                params=query_params.model_dump(exclude_none=True),
+                headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+            schema = file_schemas.FileListSchema(**response.json())
+            assert len(schema.file_urls) <= query_params.limit
+            file_urls.extend(schema.file_urls)
+            pages_count += 1
+            if schema.next_continuation_token is None:
+                break
+
+            query_params.continuation_token = schema.next_continuation_token
+
+        assert pages_count == 2
+        assert [file_url.rsplit("/", 3)[-3:] for file_url in file_urls] == [
+            ["disputes", "1", "a.png"],
+            ["disputes", "1", "b.png"],
+            ["disputes", "1", "c.png"],
+        ]
+
+    async def test_get_files_invalid_continuation_token(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        mocker,
+    ):
+        bucket = FakeS3Bucket(["disputes/1/a.png"])
+        mocker.patch.object(S3Service, "_is_bucket_ready", True)
+        mocker.patch.object(
+            S3Service._client, "list_objects_v2", side_effect=bucket.list_objects_v2
+        )
+
+        response = await router_client.get(
+            "/s3",
+            params={"continuation_token": "invalid"},
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -2,7 +2,11 @@ import httpx
 from fastapi import status
 
 from src.api.common.routers.health_check_router import router as health_check_router
-from src.apps.healthcheck.schemas import HealthCheckSchema
+from src.apps.healthcheck.schemas import (
+    DatabasePoolStatsSchema,
+    HealthCheckSchema,
+    RedisStatsSchema,
+)
 from src.core.settings import settings
 from tests.integration.conftest import BaseTestRouter
 
@@ -22,3 +26,32 @@ class TestHealtcheckRouter(BaseTestRouter):
         assert health_check_data.mode == settings.MODE
         assert health_check_data.version == settings.APP_VERSION
         assert health_check_data.status == "OK"
+
+    async def test_db_pool_stats(
+        self,
+        router_client: httpx.AsyncClient,
+    ):
+        response = await router_client.get(url="/health_check/db-pool")
+
+        assert response.status_code == status.HTTP_200_OK
+
+        pool_stats = DatabasePoolStatsSchema(**response.json())
+
+        assert pool_stats.mode == settings.DB_POOL_MODE
+        assert pool_stats.checked_out >= 0
+        assert pool_stats.wait_seconds_max >= 0
+
+    async def test_redis_stats(
+        self,
+        router_client: httpx.AsyncClient,
+    ):
+        response = await router_client.get(url="/health_check/redis")
+
+        assert response.status_code == status.HTTP_200_OK
+
+        redis_stats = RedisStatsSchema(**response.json())
+
+        assert redis_stats.max_connections == settings.REDIS_MAX_CONNECTIONS
+        assert redis_stats.in_use_connections == 0
+        assert redis_stats.is_available == (redis_stats.ping_seconds is not None)
+        assert redis_stats.commands >= redis_stats.errors
@@ -1,12 +1,18 @@
 import httpx
 from fastapi import status
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.user.routers.merchants.router import router as merchants_router
 from src.apps.auth import schemas as auth_schemas
+from src.apps.ledger.model import LedgerEntryModel, LedgerEntryReasonEnum
 from src.apps.merchants import schemas as merchant_schemas
+from src.apps.requisites.model import RequisiteModel
 from src.apps.requisites.repository import RequisiteRepository
+from src.apps.traders.repository import TraderRepository
+from src.apps.traders.requisite_index import RequisiteIndexService
 from src.apps.transactions.model import (
+    TransactionModel,
     TransactionPaymentMethodEnum,
     TransactionStatusEnum,
     TransactionTypeEnum,
@@ -15,6 +21,7 @@ from src.apps.transactions.repository import TransactionRepository
 from src.apps.users.model import UserModel
 from src.apps.users.repository import UserRepository
 from src.core import constants
+from src.core.settings import settings
 from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
 
@@ -52,6 +59,45 @@ class TestMerchantsRouter(BaseTestRouter):
             )
         ) is not None
 
+    async def test_request_pay_in_with_requisite_index(
+        self,
+        mocker,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_sbp: UserModel,
+    ):
+        mocker.patch.object(settings, "REQUISITE_INDEX_ENABLED", True)
+        publish_mock = mocker.patch(
+            "src.libs.services.redis_service.RedisService.publish",
+            return_value=None,
+        )
+        RequisiteIndexService.invalidate()
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-in",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_schemas.MerchantPayInRequestSchema(
+                amount=100,
+                payment_method=TransactionPaymentMethodEnum.SBP,
+            ).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        transaction_db = await TransactionRepository.get_one_or_none(
+            session=session,
+            merchant_id=user_merchant_db.id,
+        )
+        assert transaction_db is not None
+        assert transaction_db.trader_id == user_trader_db_with_sbp.id
+
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.amount_frozen == 100
+
+        publish_mock.assert_called_once()
+
     async def test_request_pay_in_with_card(
         self,
         router_client: httpx.AsyncClient,
@@ -154,9 +200,240 @@ class TestMerchantsRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_409_CONFLICT
 
+    async def test_request_pay_in_busy_requisite_next_candidate(
+        self,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_sbp: UserModel,
+        mocker,
+    ):
+        busy_requisite_db = await self._occupy_requisite(
+            session=session,
+            user_trader_db=user_trader_db_with_sbp,
+        )
+        free_requisite_db = RequisiteModel(
+            user_id=user_trader_db_with_sbp.id,
+            full_name=faker.word(),
+            phone_number=faker.phone_number(),
+            bank_name=faker.word(),
+            priority=0,
+        )
+        session.add(free_requisite_db)
+        await session.commit()
+
+        # Первый подбор выполнен до того, как реквизит был занят
+        get_by_filters = TraderRepository.get_by_filters
+
+        async def stale_get_by_filters(**kwargs):
+            if get_by_filters_mock.call_count == 1:
+                return user_trader_db_with_sbp, busy_requisite_db
+            return await get_by_filters(**kwargs)
+
+        get_by_filters_mock = mocker.patch.object(
+            TraderRepository,
+            "get_by_filters",
+            side_effect=stale_get_by_filters,
+        )
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-in",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_schemas.MerchantPayInRequestSchema(
+                amount=100,
+                payment_method=TransactionPaymentMethodEnum.SBP,
+            ).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert get_by_filters_mock.call_count == 2
+
+        transaction_db = await TransactionRepository.get_one_or_none(
+            session=session,
+            merchant_id=user_merchant_db.id,
+        )
+        assert transaction_db is not None
+        assert transaction_db.requisite_id == free_requisite_db.id
+
+        # Заморожена только сумма нового пополнения
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.amount_frozen == 100
+
+    async def test_request_pay_in_busy_requisite_conflict(
+        self,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_sbp: UserModel,
+        mocker,
+    ):
+        requisite_db = await RequisiteRepository.get_one_or_none(
+            session=session,
+            user_id=user_trader_db_with_sbp.id,
+        )
+        assert requisite_db is not None
+
+        # Параллельный запрос занимает реквизит после заморозки средств
+        reserve_amount = TraderRepository.reserve_amount
+
+        async def racing_reserve_amount(**kwargs):
+            trader_db = await reserve_amount(**kwargs)
+            await self._occupy_requisite(
+                session=kwargs["session"],
+                user_trader_db=user_trader_db_with_sbp,
+                commit=False,
+            )
+            return trader_db
+
+        mocker.patch.object(
+            TraderRepository,
+            "reserve_amount",
+            side_effect=racing_reserve_amount,
+        )
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-in",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_schemas.MerchantPayInRequestSchema(
+                amount=100,
+                payment_method=TransactionPaymentMethodEnum.SBP,
+            ).model_dump(),
+        )
+
+        # Второе пополнение по реквизиту отклоняет уникальный индекс
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    async def test_request_pay_in_skips_trader_with_unfolded_debits(
+        self,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_sbp: UserModel,
+    ):
+        await self._add_unfolded_debit(
+            session=session,
+            user_trader_db=user_trader_db_with_sbp,
+        )
+        free_trader_db, free_requisite_db = await self._create_trader(session=session)
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-in",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_schemas.MerchantPayInRequestSchema(
+                amount=100,
+                payment_method=TransactionPaymentMethodEnum.SBP,
+            ).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        transaction_db = await TransactionRepository.get_one_or_none(
+            session=session,
+            merchant_id=user_merchant_db.id,
+        )
+        assert transaction_db is not None
+        assert transaction_db.trader_id == free_trader_db.id
+        assert transaction_db.requisite_id == free_requisite_db.id
+
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.amount_frozen == 0
+
+    @staticmethod
+    async def _add_unfolded_debit(
+        session: AsyncSession,
+        user_trader_db: UserModel,
+    ) -> None:
+        """Списать весь баланс трейдера несвернутой записью журнала."""
+
+        session.add(
+            LedgerEntryModel(
+                user_id=user_trader_db.id,
+                balance_delta=-user_trader_db.balance,
+                reason=LedgerEntryReasonEnum.WITHDRAWAL,
+            )
+        )
+        await session.commit()
+
+    @staticmethod
+    async def _create_trader(
+        session: AsyncSession,
+        card: bool = False,
+    ) -> tuple[UserModel, RequisiteModel]:
+        """Создать активного трейдера со свободными средствами и реквизитом."""
+
+        trader_db = UserModel(
+            email=faker.email(),
+            hashed_password=faker.password(),
+            is_active=True,
+            balance=1000000,
+            priority=0,
+        )
+        session.add(trader_db)
+        await session.flush()
+
+        requisite_db = RequisiteModel(
+            user_id=trader_db.id,
+            full_name=faker.word(),
+            bank_name=faker.word(),
+            priority=0,
+            **(
+                {"card_number": faker.word()}
+                if card
+                else {"phone_number": faker.phone_number()}
+            ),
+        )
+        session.add(requisite_db)
+        await session.commit()
+
+        return trader_db, requisite_db
+
+    @staticmethod
+    async def _occupy_requisite(
+        session: AsyncSession,
+        user_trader_db: UserModel,
+        commit: bool = True,
+    ) -> RequisiteModel:
+        """Создать пополнение другого мерчанта по реквизиту трейдера."""
+
+        requisite_db = await RequisiteRepository.get_one_or_none(
+            session=session,
+            user_id=user_trader_db.id,
+        )
+        assert requisite_db is not None
+
+        other_merchant_db = UserModel(
+            email=faker.email(),
+            hashed_password=faker.password(),
+            priority=0,
+        )
+        session.add(other_merchant_db)
+        await session.flush()
+
+        session.add(
+            TransactionModel(
+                merchant_id=other_merchant_db.id,
+                trader_id=user_trader_db.id,
+                requisite_id=requisite_db.id,
+                amount=100,
+                type=TransactionTypeEnum.PAY_IN,
+                payment_method=TransactionPaymentMethodEnum.SBP,
+                status=TransactionStatusEnum.PENDING,
+            )
+        )
+        if commit:
+            await session.commit()
+        else:
+            await session.flush()
+
+        return requisite_db
+
     # MARK: Pay out
     async def test_request_pay_out(
         self,
+        mocker,
         router_client: httpx.AsyncClient,
         merchant_jwt_tokens: auth_schemas.JWTGetSchema,
         session: AsyncSession,
@@ -164,6 +441,7 @@ class TestMerchantsRouter(BaseTestRouter):
         user_trader_db_with_card: UserModel,
         merchant_pay_out_create_data: merchant_schemas.MerchantPayOutRequestSchema,
     ):
+        publish_mock = mocker.patch.object(RequisiteIndexService, "publish")
         user_merchant_db.balance = 200
         await session.commit()
 
@@ -187,7 +465,85 @@ class TestMerchantsRouter(BaseTestRouter):
         )
         assert merchant_db is not None
 
+        # Сумма заморожена, баланс до проведения списания не меняется
         assert merchant_db.amount_frozen == merchant_pay_out_create_data.amount
+        assert merchant_db.balance == 200
+
+        # Реквизит мерчанта не входит в индекс реквизитов трейдеров
+        publish_mock.assert_not_called()
+
+    async def test_request_pay_out_skips_trader_with_unfolded_debits(
+        self,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_card: UserModel,
+        merchant_pay_out_create_data: merchant_schemas.MerchantPayOutRequestSchema,
+    ):
+        user_merchant_db.balance = 200
+        await session.commit()
+
+        await self._add_unfolded_debit(
+            session=session,
+            user_trader_db=user_trader_db_with_card,
+        )
+        free_trader_db, _ = await self._create_trader(session=session, card=True)
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-out",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_pay_out_create_data.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        transaction_db = await TransactionRepository.get_one_or_none(
+            session=session,
+            merchant_id=user_merchant_db.id,
+            type=TransactionTypeEnum.PAY_OUT,
+        )
+        assert transaction_db is not None
+        assert transaction_db.trader_id == free_trader_db.id
+
+    async def test_request_pay_out_concurrent_reserve(
+        self,
+        router_client: httpx.AsyncClient,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_card: UserModel,
+        merchant_pay_out_create_data: merchant_schemas.MerchantPayOutRequestSchema,
+        mocker,
+    ):
+        user_merchant_db.balance = 200
+        await session.commit()
+
+        # Параллельный вывод замораживает средства после проверки баланса
+        get_by_filters = TraderRepository.get_by_filters
+
+        async def racing_get_by_filters(**kwargs):
+            await kwargs["session"].execute(
+                update(UserModel)
+                .where(UserModel.id == user_merchant_db.id)
+                .values(amount_frozen=UserModel.balance)
+            )
+            return await get_by_filters(**kwargs)
+
+        mocker.patch.object(
+            TraderRepository,
+            "get_by_filters",
+            side_effect=racing_get_by_filters,
+        )
+
+        response = await router_client.post(
+            "/merchant-clients/request-pay-out",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+            json=merchant_pay_out_create_data.model_dump(),
+        )
+
+        # Условная заморозка не позволяет уйти в минус
+        assert response.status_code == status.HTTP_409_CONFLICT
 
     async def test_request_pay_out_trader_not_found(
         self,
@@ -7,7 +7,9 @@ from src.apps.auth import schemas as auth_schemas
 from src.apps.notifications import schemas as notification_schemas
 from src.apps.notifications.model import NotificationModel
 from src.apps.notifications.repository import NotificationRepository
+from src.apps.users.model import UserModel
 from src.core import constants
+from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -91,6 +93,91 @@ class TestNotificationsRouter(BaseTestRouter):
         assert schema.data[0].message == notification_db.message
         assert schema.data[0].id == notification_db.id
 
+    async def test_get_notifications_offset_count(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_db: UserModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        notifications_db = await NotificationRepository.create_bulk(
+            session=session,
+            data=[{"user_id": user_db.id, "message": faker.word()} for _ in range(3)],
+        )
+        await session.commit()
+
+        for offset, page_size in [(0, 2), (2, 1)]:
+            params = notification_schemas.NotificationPaginationSchema(
+                user_id=user_db.id,
+                limit=2,
+                offset=offset,
+            )
+            response = await router_client.get(
+                url="/notifications",
+                params=params.model_dump(exclude_unset=True),
+                headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+            # Оконная функция считает все записи, а не только страницу
+            schema = notification_schemas.NotificationListSchema(**response.json())
+            assert len(schema.data) == page_size
+            assert schema.count == len(notifications_db)
+            assert schema.has_more is None
+
+    async def test_get_notifications_keyset(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_db: UserModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        notifications_db = await NotificationRepository.create_bulk(
+            session=session,
+            data=[{"user_id": user_db.id, "message": faker.word()} for _ in range(3)],
+        )
+        await session.commit()
+
+        params = notification_schemas.NotificationPaginationSchema(
+            user_id=user_db.id,
+            keyset=True,
+            limit=2,
+        )
+        response = await router_client.get(
+            url="/notifications",
+            params=params.model_dump(exclude_unset=True),
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        first_page = notification_schemas.NotificationListSchema(**response.json())
+        assert len(first_page.data) == 2
+        assert first_page.next_cursor is not None
+        assert first_page.has_more is True
+        # Количество считается без учета курсора
+        assert first_page.count == len(notifications_db)
+
+        params = notification_schemas.NotificationPaginationSchema(
+            user_id=user_db.id,
+            cursor=first_page.next_cursor,
+            limit=2,
+        )
+        response = await router_client.get(
+            url="/notifications",
+            params=params.model_dump(exclude_unset=True),
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        second_page = notification_schemas.NotificationListSchema(**response.json())
+        assert len(second_page.data) == 1
+        assert second_page.next_cursor is None
+        assert second_page.has_more is False
+        assert second_page.count == len(notifications_db)
+        assert {
+            notification.id for notification in first_page.data + second_page.data
+        } == {notification.id for notification in notifications_db}
+
     # MARK: Delete
     async def test_delete_notification_by_id(
         self,
@@ -1,5 +1,6 @@
 import httpx
 from fastapi import status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.admin.routers.permissions_router import router as permissions_router
@@ -7,6 +8,8 @@ from src.apps.auth import schemas as auth_schemas
 from src.apps.permissions import schemas
 from src.apps.permissions.model import PermissionModel
 from src.apps.permissions.repository import PermissionRepository
+from src.apps.users.model import UserModel
+from src.apps.users_permissions.repository import UsersPermissionsRepository
 from src.core import constants
 from tests.integration.conftest import BaseTestRouter
 
@@ -137,6 +140,40 @@ class TestPermissionsRouter(BaseTestRouter):
         assert schema.id == permission_db.id
         assert schema.name == update_data.name
 
+    async def test_update_permission_invalidates_permissions_cache(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        permission_db: PermissionModel,
+        session: AsyncSession,
+    ):
+        headers = {constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token}
+
+        # Разрешения администратора попадают в кэш
+        response = await router_client.get(
+            f"/permissions/{permission_db.id}",
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        get_permission_db = await PermissionRepository.get_one_or_none(
+            session=session,
+            name=constants.PermissionEnum.GET_PERMISSION.value,
+        )
+        response = await router_client.put(
+            f"/permissions/{get_permission_db.id}",
+            json=schemas.PermissionCreateSchema(name="new_name").model_dump(),
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        # После переименования разрешения кэш администратора сброшен
+        response = await router_client.get(
+            f"/permissions/{permission_db.id}",
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
     # MARK: Delete
     async def test_delete_permission(
         self,
@@ -157,3 +194,89 @@ class TestPermissionsRouter(BaseTestRouter):
             name=permission_db.name,
         )
         assert deleted_permission_db is None
+
+    async def test_delete_permission_revokes_access(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        mocker,
+    ):
+        # Кэш разрешений в Redis
+        redis_store: dict[str, str] = {}
+
+        async def redis_set(key, value, expire=None):
+            redis_store[key] = value
+
+        async def redis_delete(*keys):
+            for key in keys:
+                redis_store.pop(key, None)
+
+        mocker.patch(
+            "src.libs.services.redis_service.RedisService.get",
+            side_effect=redis_store.get,
+        )
+        mocker.patch(
+            "src.libs.services.redis_service.RedisService.set",
+            side_effect=redis_set,
+        )
+        mocker.patch(
+            "src.libs.services.redis_service.RedisService.delete",
+            side_effect=redis_delete,
+        )
+
+        permission_db = await PermissionRepository.get_one_or_none(
+            session=session,
+            name=constants.PermissionEnum.GET_PERMISSION.value,
+        )
+        assert permission_db is not None
+
+        response = await router_client.get(
+            f"/permissions/{permission_db.id}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert redis_store
+
+        response = await router_client.delete(
+            f"/permissions/{permission_db.id}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        # Отозванное разрешение не действует уже в следующем запросе
+        response = await router_client.get(
+            "/permissions",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_delete_permission_cache_invalidation_failed(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        permission_db: PermissionModel,
+        user_admin_db: UserModel,
+        session: AsyncSession,
+        mocker,
+    ):
+        await UsersPermissionsRepository.create_bulk(
+            session=session,
+            data=[{"user_id": user_admin_db.id, "permission_id": permission_db.id}],
+        )
+        await session.commit()
+
+        mocker.patch.object(constants, "USER_TOKEN_REVOKE_RETRY_DELAY", 0)
+        redis_delete = mocker.patch(
+            "src.libs.services.redis_service.RedisService.delete",
+            side_effect=RedisError(),
+        )
+
+        response = await router_client.delete(
+            f"/permissions/{permission_db.id}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        # Запрос не завершается успешно, пока разрешения остаются в кэше
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert redis_delete.call_count == constants.USER_TOKEN_REVOKE_MAX_RETRIES
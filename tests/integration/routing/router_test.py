@@ -0,0 +1,78 @@
+import httpx
+from fastapi import APIRouter, status
+from pydantic import BaseModel
+
+from src.core import constants, routing
+from src.core.routing import ORJSONRoute
+from tests.integration.conftest import BaseTestRouter
+
+
+class ItemsSchema(BaseModel):
+    items: list[str]
+
+
+orjson_router = APIRouter(prefix="/orjson", route_class=ORJSONRoute)
+
+
+@orjson_router.post("/items")
+async def orjson_items_route(data: ItemsSchema) -> dict[str, int]:
+    return {"count": len(data.items)}
+
+
+class TestORJSONRoute(BaseTestRouter):
+    router = orjson_router
+
+    async def test_small_body_parsed_inline(
+        self,
+        mocker,
+        router_client: httpx.AsyncClient,
+    ):
+        run_in_threadpool = mocker.spy(routing, "run_in_threadpool")
+        data = ItemsSchema(items=["item"] * 10)
+
+        response = await router_client.post(
+            "/orjson/items",
+            content=data.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"count": 10}
+
+        # Тело меньше порога разбирается в цикле событий
+        assert len(data.model_dump_json()) <= constants.JSON_INLINE_MAX_BODY_SIZE
+        run_in_threadpool.assert_not_called()
+
+    async def test_large_body_parsed_in_threadpool(
+        self,
+        mocker,
+        router_client: httpx.AsyncClient,
+    ):
+        run_in_threadpool = mocker.spy(routing, "run_in_threadpool")
+        data = ItemsSchema(items=["x" * 1024] * 100)
+
+        response = await router_client.post(
+            "/orjson/items",
+            content=data.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"count": 100}
+
+        # Тело больше порога разбирается в пуле потоков
+        assert len(data.model_dump_json()) > constants.JSON_INLINE_MAX_BODY_SIZE
+        run_in_threadpool.assert_called_once()
+
+    async def test_invalid_json(
+        self,
+        router_client: httpx.AsyncClient,
+    ):
+        response = await router_client.post(
+            "/orjson/items",
+            content=b'{"items": [',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["type"] == "json_invalid"
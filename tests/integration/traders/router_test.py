@@ -1,9 +1,13 @@
 import httpx
 from fastapi import status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.user.routers.traders.router import router as traders_router
 from src.apps.auth import schemas as auth_schemas
+from src.apps.ledger.model import LedgerEntryModel, LedgerEntryReasonEnum
+from src.apps.ledger.repository import LedgerRepository
+from src.apps.notifications.repository import NotificationRepository
 from src.apps.transactions.model import (
     TransactionModel,
     TransactionStatusEnum,
@@ -11,6 +15,7 @@ from src.apps.transactions.model import (
 from src.apps.transactions.repository import TransactionRepository
 from src.apps.users.model import UserModel
 from src.core import constants
+from tasks.ledger.fold_ledger_entries import _fold_ledger_entries
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -55,6 +60,32 @@ class TestTradersRouter(BaseTestRouter):
         await session.refresh(user_trader_db_with_sbp)
         assert user_trader_db_with_sbp.is_active is True
 
+    async def test_start_working_token_revoke_failed(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        trader_jwt_tokens: auth_schemas.JWTGetSchema,
+        user_trader_db_with_sbp: UserModel,
+        mocker,
+    ):
+        user_trader_db_with_sbp.is_active = False
+        await session.commit()
+
+        mocker.patch.object(constants, "USER_TOKEN_REVOKE_RETRY_DELAY", 0)
+        incr_many = mocker.patch(
+            "src.libs.services.redis_service.RedisService.incr_many",
+            side_effect=RedisError(),
+        )
+
+        response = await router_client.patch(
+            "/traders/start",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+        )
+
+        # Запрос не завершается успешно, пока токены не отозваны
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert incr_many.call_count == constants.USER_TOKEN_REVOKE_MAX_RETRIES
+
     # MARK: Confirm merchant pay in
     async def test_confirm_merchant_pay_in(
         self,
@@ -105,11 +136,22 @@ class TestTradersRouter(BaseTestRouter):
             * constants.MERCHANT_TRANSACTION_COMMISSION
         )
 
+        # Сумма пополнения разморожена целиком
+        assert user_trader_db_with_sbp.amount_frozen == 0
+        assert user_merchant_db.amount_frozen == 0
+
         assert (
             transaction_merchant_pending_pay_in_db.status
             == TransactionStatusEnum.SUCCESS
         )
 
+        ledger_entries_db = await LedgerRepository.get_all(
+            session=session,
+            transaction_id=transaction_merchant_pending_pay_in_db.id,
+        )
+        assert len(ledger_entries_db) == 2
+        assert all(entry.folded_at is not None for entry in ledger_entries_db)
+
     # MARK: Confirm merchant pay out
     async def test_confirm_merchant_pay_out(
         self,
@@ -143,11 +185,31 @@ class TestTradersRouter(BaseTestRouter):
         await session.refresh(user_merchant_db)
         await session.refresh(user_trader_db_with_card)
 
-        assert user_merchant_db.balance < user_merchant_balance_before
-        assert user_trader_db_with_card.balance > user_trader_balance_before
+        amount = transaction_merchant_pay_out_db.amount
+        assert user_merchant_db.balance == user_merchant_balance_before - int(
+            amount + amount * constants.MERCHANT_TRANSACTION_COMMISSION
+        )
+        assert user_merchant_db.amount_frozen == 0
+        assert user_trader_db_with_card.balance == user_trader_balance_before + int(
+            amount
+            + amount
+            * (
+                constants.TRADER_TRANSACTION_COMMISSION
+                - constants.PLATFORM_TRANSACTION_COMMISSION
+            )
+        )
+        assert user_trader_db_with_card.amount_frozen == 0
 
         assert transaction_merchant_pay_out_db.status == TransactionStatusEnum.SUCCESS
 
+        assert (
+            await NotificationRepository.count(
+                session=session,
+                user_id=user_merchant_db.id,
+            )
+            == 1
+        )
+
     async def test_confirm_merchant_pay_out_trx_not_found(
         self,
         router_client: httpx.AsyncClient,
@@ -182,3 +244,63 @@ class TestTradersRouter(BaseTestRouter):
 
         assert user_merchant_db.balance == user_merchant_balance_before
         assert user_trader_db_with_card.balance == user_trader_balance_before
+
+    # MARK: Ledger
+    async def test_fold_ledger_entries_skipped_users(
+        self,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        user_merchant_db: UserModel,
+        mocker,
+    ):
+        async def mock_get_session():
+            yield session
+
+        mocker.patch(
+            "tasks.ledger.fold_ledger_entries.get_session",
+            return_value=mock_get_session(),
+        )
+
+        user_trader_balance_before = user_trader_db_with_sbp.balance
+
+        # Записи, свертку которых при коммите пропустил `SKIP LOCKED`
+        session.add_all(
+            [
+                LedgerEntryModel(
+                    user_id=user_trader_db_with_sbp.id,
+                    reason=LedgerEntryReasonEnum.RESERVE,
+                    amount_frozen_delta=100,
+                ),
+                LedgerEntryModel(
+                    user_id=user_trader_db_with_sbp.id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=-90,
+                    amount_frozen_delta=-100,
+                ),
+                LedgerEntryModel(
+                    user_id=user_merchant_db.id,
+                    reason=LedgerEntryReasonEnum.SETTLEMENT,
+                    balance_delta=90,
+                ),
+            ]
+        )
+        await session.commit()
+
+        await _fold_ledger_entries()
+
+        await session.refresh(user_trader_db_with_sbp)
+        await session.refresh(user_merchant_db)
+        assert user_trader_db_with_sbp.balance == user_trader_balance_before - 90
+        assert user_trader_db_with_sbp.amount_frozen == 0
+        assert user_merchant_db.balance == 90
+        assert user_merchant_db.amount_frozen == 0
+
+        for user_db in [user_trader_db_with_sbp, user_merchant_db]:
+            assert (
+                await LedgerRepository.count(
+                    session=session,
+                    user_id=user_db.id,
+                    folded_at=None,
+                )
+                == 0
+            )
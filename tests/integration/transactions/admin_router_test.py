@@ -109,6 +109,8 @@ class TestAdminTransactionsRouter(BaseTestRouter):
         assert len(schema.data) == 1
         assert schema.data[0].id == transaction_db.id
         assert schema.data[0].merchant_id == transaction_db.merchant_id
+        # Оценка планировщика не точна, проверяется только ее наличие
+        assert isinstance(schema.count, int)
 
     async def test_get_transactions_query(
         self,
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 import httpx
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,8 +9,15 @@ from src.api.user.routers.transactions_router import (
 )
 from src.apps.auth import schemas as auth_schemas
 from src.apps.transactions import schemas as transaction_schemas
-from src.apps.transactions.model import TransactionModel
+from src.apps.transactions.model import (
+    TransactionModel,
+    TransactionPaymentMethodEnum,
+    TransactionStatusEnum,
+    TransactionTypeEnum,
+)
 from src.apps.transactions.repository import TransactionRepository
+from src.apps.transactions.service import TransactionService
+from src.apps.users.model import UserModel
 from src.core import constants
 from tests.integration.conftest import BaseTestRouter
 
@@ -75,6 +84,8 @@ class TestTransactionsRouter(BaseTestRouter):
         assert len(schema.data) == 1
         assert schema.data[0].id == transaction_db.id
         assert schema.data[0].merchant_id == transaction_db.merchant_id
+        assert schema.count is None
+        assert schema.has_more is False
 
     async def test_get_transactions_query(
         self,
@@ -99,3 +110,112 @@ class TestTransactionsRouter(BaseTestRouter):
         assert len(schema.data) == 1
         assert schema.data[0].id == transaction_db.id
         assert schema.data[0].merchant_id == transaction_db.merchant_id
+
+    # MARK: Expire
+    async def test_expire_pending_transactions(
+        self,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        user_trader_db_with_sbp: UserModel,
+    ):
+        expired_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        pay_ins_db = [
+            TransactionModel(
+                merchant_id=user_merchant_db.id,
+                trader_id=user_trader_db_with_sbp.id,
+                amount=amount,
+                type=TransactionTypeEnum.PAY_IN,
+                payment_method=TransactionPaymentMethodEnum.CARD,
+                status=TransactionStatusEnum.PENDING,
+                expires_at=expired_at,
+            )
+            for amount in [100, 200]
+        ]
+        pay_out_db = TransactionModel(
+            merchant_id=user_merchant_db.id,
+            trader_id=user_trader_db_with_sbp.id,
+            amount=300,
+            type=TransactionTypeEnum.PAY_OUT,
+            payment_method=TransactionPaymentMethodEnum.CARD,
+            status=TransactionStatusEnum.PENDING,
+            expires_at=expired_at,
+        )
+        active_db = TransactionModel(
+            merchant_id=user_merchant_db.id,
+            trader_id=user_trader_db_with_sbp.id,
+            amount=400,
+            type=TransactionTypeEnum.PAY_IN,
+            payment_method=TransactionPaymentMethodEnum.CARD,
+            status=TransactionStatusEnum.PENDING,
+        )
+        user_trader_balance_before = user_trader_db_with_sbp.balance
+        session.add_all([*pay_ins_db, pay_out_db, active_db])
+        user_trader_db_with_sbp.amount_frozen = 100 + 200 + 400
+        user_merchant_db.amount_frozen = 300
+        await session.commit()
+
+        # Истекшие транзакции отменяются пачками, пока они есть
+        expired_ids = []
+        while transactions_db := await TransactionService.expire_pending_bulk(
+            session=session,
+            limit=2,
+        ):
+            assert len(transactions_db) <= 2
+            expired_ids.extend(transaction_db.id for transaction_db in transactions_db)
+            await session.commit()
+
+        assert sorted(expired_ids) == sorted(
+            transaction_db.id for transaction_db in [*pay_ins_db, pay_out_db]
+        )
+        for transaction_db in [*pay_ins_db, pay_out_db]:
+            await session.refresh(transaction_db)
+            assert transaction_db.status == TransactionStatusEnum.FAILED
+
+        await session.refresh(active_db)
+        assert active_db.status == TransactionStatusEnum.PENDING
+
+        # Суммы пополнений разморожены у трейдера, списания - у мерчанта
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.amount_frozen == 400
+        assert user_trader_db_with_sbp.balance == user_trader_balance_before
+        await session.refresh(user_merchant_db)
+        assert user_merchant_db.amount_frozen == 0
+        assert user_merchant_db.balance == 0
+
+    # MARK: Iterate
+    async def test_iterate_transactions_batches(
+        self,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+    ):
+        transactions_db = [
+            TransactionModel(
+                merchant_id=user_merchant_db.id,
+                amount=100,
+                type=TransactionTypeEnum.PAY_IN,
+                payment_method=TransactionPaymentMethodEnum.CARD,
+                status=TransactionStatusEnum.PENDING,
+            )
+            for _ in range(5)
+        ]
+        session.add_all(transactions_db)
+        await session.commit()
+        ids = [transaction_db.id for transaction_db in transactions_db]
+
+        batches = []
+        async for batch_db in TransactionRepository.iterate_batches(
+            session,
+            TransactionModel.id.in_(ids),
+            batch_size=2,
+            status=TransactionStatusEnum.PENDING,
+        ):
+            batches.append([transaction_db.id for transaction_db in batch_db])
+            if len(batches) == 1:
+                # Прочитанная строка перестает подходить под фильтр,
+                #   а еще не прочитанная - отменяется
+                transactions_db[0].status = TransactionStatusEnum.FAILED
+                transactions_db[3].status = TransactionStatusEnum.FAILED
+                await session.commit()
+
+        # Изменение прочитанной строки не сдвигает следующие пачки
+        assert batches == [[ids[0], ids[1]], [ids[2], ids[4]]]
@@ -1,26 +1,142 @@
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Any, Iterator
 
 import httpx
-from fastapi import status
+import pytest
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.common.routers.users_router import router as common_users_router
 from src.api.user.routers.router import router as users_router
 from src.apps.auth import schemas as auth_schemas
-from src.apps.blockchain.model import BlockchainTransactionModel
+from src.apps.blockchain import constants as blockchain_constants
+from src.apps.blockchain import exceptions as blockchain_exceptions
+from src.apps.blockchain.model import BlockchainCursorModel, BlockchainTransactionModel
 from src.apps.blockchain.repository import BlockchainTransactionRepository
 from src.apps.blockchain.schemas import TransactionStatusEnum, TransactionTypeEnum
+from src.apps.blockchain.services.deposit_watcher_service import (
+    DepositWatcherService,
+)
 from src.apps.blockchain.services.transaction_service import (
     BlockchainTransactionService,
 )
+from src.apps.blockchain.services.tron_service import TronService
+from src.apps.transactions.model import TransactionModel
+from src.apps.transactions.repository import TransactionRepository
 from src.apps.users.model import UserModel
+from src.apps.users.repository import UserRepository
 from src.apps.users.schemas import pay_schemas, user_schemas
+from src.apps.users_permissions.permissions_cache import UserPermissionsCacheService
 from src.apps.wallets.model import WalletModel
-from src.core import constants
+from src.core import constants, dependencies
+from src.core.unit_of_work import UnitOfWork
 from tests.conftest import faker
+from tests.fake_tron_rpc import FakeTronRPCServer
 from tests.integration.conftest import BaseTestRouter
 
 
+@contextmanager
+def record_statements(session: AsyncSession) -> Iterator[list[str]]:
+    """Записать SQL запросы, выполненные через соединение сессии."""
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+unit_of_work_router = APIRouter()
+
+
+@unit_of_work_router.get(
+    "/unit-of-work/{transaction_id}",
+    dependencies=[
+        Depends(
+            dependencies.check_user_permissions(
+                [constants.PermissionEnum.GET_MY_TRANSACTION]
+            )
+        ),
+        Depends(
+            dependencies.check_user_permissions(
+                [constants.PermissionEnum.REQUEST_PAY_IN_CLIENT]
+            )
+        ),
+    ],
+)
+async def unit_of_work_route(
+    transaction_id: int,
+    user: UserModel = Depends(dependencies.get_current_user),
+    permissions: frozenset[str] = Depends(dependencies.get_current_permissions),
+    unit_of_work: UnitOfWork = Depends(dependencies.get_unit_of_work),
+) -> dict[str, Any]:
+    transaction_db = await TransactionRepository.get_by_id(
+        session=unit_of_work.session,
+        id=transaction_id,
+    )
+
+    # Повторные получения по первичному ключу в рамках запроса
+    with record_statements(unit_of_work.session) as statements:
+        user_db = await UserRepository.get_by_id(
+            session=unit_of_work.session,
+            id=user.id,
+        )
+        same_transaction_db = await unit_of_work.get(TransactionModel, transaction_id)
+
+    return {
+        "statements": statements,
+        "is_same_user": user_db is user and unit_of_work.user is user,
+        "is_same_transaction": same_transaction_db is transaction_db,
+        "permissions": sorted(permissions),
+    }
+
+
+class TestUnitOfWork(BaseTestRouter):
+    router = unit_of_work_router
+
+    async def test_request_unit_of_work(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_merchant_db: UserModel,
+        merchant_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_db: TransactionModel,
+        mocker,
+    ):
+        permissions_get = mocker.spy(UserPermissionsCacheService, "get")
+
+        # Запрос начинается с пустой identity map, как в приложении
+        session.expunge_all()
+
+        response = await router_client.get(
+            url=f"/unit-of-work/{transaction_db.id}",
+            headers={constants.AUTH_HEADER_NAME: merchant_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = response.json()
+        assert data["statements"] == []
+        assert data["is_same_user"] is True
+        assert data["is_same_transaction"] is True
+        assert {
+            constants.PermissionEnum.GET_MY_TRANSACTION.value,
+            constants.PermissionEnum.REQUEST_PAY_IN_CLIENT.value,
+        }.issubset(data["permissions"])
+
+        # Разрешения получены один раз на обе проверки и роут
+        assert permissions_get.call_count == 1
+
+
 class TestCommonUserRouter(BaseTestRouter):
     router = common_users_router
 
@@ -43,6 +159,31 @@ class TestCommonUserRouter(BaseTestRouter):
         assert data.id == user_db.id
         assert data.email == user_db.email
 
+    async def test_get_user_with_load_profiles(
+        self,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+    ):
+        session.expunge(user_trader_db_with_sbp)
+
+        # Профиль по умолчанию не загружает связи пользователя
+        user = await UserRepository.get_one_or_none(
+            session=session,
+            id=user_trader_db_with_sbp.id,
+        )
+        assert user is not None
+        with pytest.raises(InvalidRequestError):
+            user.requisites
+
+        user = await UserRepository.get_by_id(
+            session=session,
+            id=user.id,
+            profile=constants.UserLoadProfileEnum.FULL,
+        )
+        assert user is not None
+        assert len(user.requisites) == 1
+        assert user.users_permissions
+
 
 class TestUserRouter(BaseTestRouter):
     router = users_router
@@ -193,6 +334,257 @@ class TestUserRouter(BaseTestRouter):
             != trader_balance_before + blockchain_transaction_db.amount
         )
 
+    async def test_confirm_pay_in_hash_already_credited(
+        self,
+        router_client: httpx.AsyncClient,
+        trader_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        blockchain_transaction_db: BlockchainTransactionModel,
+        mocker,
+    ):
+        # Перевод засчитан другой транзакции после проверки хэша
+        session.add(
+            BlockchainTransactionModel(
+                user_id=user_trader_db_with_sbp.id,
+                to_address=blockchain_transaction_db.to_address,
+                amount=blockchain_transaction_db.amount,
+                type=TransactionTypeEnum.PAY_IN,
+                status=TransactionStatusEnum.SUCCESS,
+                hash="123",
+            )
+        )
+        await session.commit()
+        mocker.patch(
+            "src.apps.blockchain.repository.BlockchainTransactionRepository.get_existing_hashes",
+            return_value=set(),
+        )
+        mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.get_transaction_by_hash",
+            return_value={
+                "transaction_hash": "123",
+                "amount": blockchain_transaction_db.amount,
+                "from_address": "0" * 42,
+                "to_address": blockchain_transaction_db.to_address,
+                "created_at": faker.date_time(),
+            },
+        )
+
+        response = await router_client.patch(
+            "/users/confirm-pay-in",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+            json=pay_schemas.ConfirmPayInSchema(transaction_hash="123").model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    async def test_confirm_pay_in_with_tron_rpc_cache(
+        self,
+        router_client: httpx.AsyncClient,
+        trader_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        blockchain_transaction_db: BlockchainTransactionModel,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        block_hash = "b" * 64
+        fake_tron_rpc.blocks[block_hash] = int(faker.date_time().timestamp())
+        fake_tron_rpc.block_hashes = {
+            100: block_hash,
+            100 + constants.TRON_DEPOSIT_CONFIRMATIONS: "c" * 64,
+        }
+        for transaction_hash in ("1" * 64, "2" * 64):
+            fake_tron_rpc.transactions[transaction_hash] = {
+                "from": "0" * 42,
+                "to": blockchain_transaction_db.to_address,
+                "value": blockchain_transaction_db.amount,
+                "blockHash": block_hash,
+            }
+
+        response = await router_client.patch(
+            "/users/confirm-pay-in",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+            json=pay_schemas.ConfirmPayInSchema(transaction_hash="1" * 64).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert fake_tron_rpc.requests_count == 3
+
+        session.add(
+            BlockchainTransactionModel(
+                user_id=user_trader_db_with_sbp.id,
+                to_address=blockchain_transaction_db.to_address,
+                amount=blockchain_transaction_db.amount,
+                type=TransactionTypeEnum.PAY_IN,
+            )
+        )
+        await session.commit()
+
+        response = await router_client.patch(
+            "/users/confirm-pay-in",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+            json=pay_schemas.ConfirmPayInSchema(transaction_hash="2" * 64).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        # Timestamp блока второй транзакции взят из кэша
+        assert fake_tron_rpc.requests_count == 5
+
+    async def test_get_transaction_by_hash_cached_when_finalized(
+        self,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        block_hash = "b" * 64
+        transaction_hash = "1" * 64
+        fake_tron_rpc.blocks[block_hash] = int(faker.date_time().timestamp())
+        fake_tron_rpc.block_hashes = {
+            100: block_hash,
+            100 + constants.TRON_DEPOSIT_CONFIRMATIONS - 1: "c" * 64,
+        }
+        fake_tron_rpc.transactions[transaction_hash] = {
+            "from": "0" * 42,
+            "to": "1" * 42,
+            "value": 100,
+            "blockHash": block_hash,
+        }
+
+        # Блок еще может быть отменен: транзакция запрашивается каждый раз
+        for _ in range(2):
+            transaction = await TronService.get_transaction_by_hash(transaction_hash)
+            assert transaction["amount"] == 100
+        assert fake_tron_rpc.requests_count == 5
+
+        # Блок стал необратимым: транзакция кэшируется
+        fake_tron_rpc.block_hashes[100 + constants.TRON_DEPOSIT_CONFIRMATIONS] = (
+            "d" * 64
+        )
+        for _ in range(2):
+            transaction = await TronService.get_transaction_by_hash(transaction_hash)
+            assert transaction["amount"] == 100
+        assert fake_tron_rpc.requests_count == 7
+
+    async def test_get_transaction_by_hash_not_in_block(
+        self,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        transaction_hash = "1" * 64
+        fake_tron_rpc.transactions[transaction_hash] = {
+            "from": "0" * 42,
+            "to": "1" * 42,
+            "value": 100,
+            "blockHash": None,
+        }
+
+        for _ in range(2):
+            with pytest.raises(blockchain_exceptions.GetTronTransactionException):
+                await TronService.get_transaction_by_hash(transaction_hash)
+
+        # Транзакция вне блока не кэшируется
+        assert fake_tron_rpc.requests_count == 2
+
+    async def test_pay_in_confirmed_by_deposit_watcher(
+        self,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        blockchain_transaction_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        blockchain_transaction_db.to_address = wallet_db.address
+        session.add(
+            BlockchainCursorModel(
+                name=blockchain_constants.DEPOSIT_WATCHER_CURSOR_NAME,
+                block_number=0,
+            )
+        )
+        await session.commit()
+
+        block_hash = "b" * 64
+        fake_tron_rpc.blocks[block_hash] = int(faker.date_time().timestamp())
+        fake_tron_rpc.block_hashes = {
+            1: block_hash,
+            1 + constants.TRON_DEPOSIT_CONFIRMATIONS: "f" * 64,
+        }
+        fake_tron_rpc.transactions = {
+            "1" * 64: {
+                "from": "0" * 42,
+                "to": "1" * 42,  # не кошелек платформы
+                "value": blockchain_transaction_db.amount,
+                "blockHash": block_hash,
+            },
+            "2" * 64: {
+                "from": "0" * 42,
+                "to": wallet_db.address,
+                "value": blockchain_transaction_db.amount,
+                "blockHash": block_hash,
+            },
+        }
+        trader_balance_before = user_trader_db_with_sbp.balance
+
+        # Обработан только необратимый блок
+        assert await DepositWatcherService.process_next_blocks(session=session) == 1
+        assert await DepositWatcherService.process_next_blocks(session=session) == 0
+
+        await session.refresh(blockchain_transaction_db)
+        assert blockchain_transaction_db.status == TransactionStatusEnum.SUCCESS
+        assert blockchain_transaction_db.hash == "2" * 64
+
+        await session.refresh(user_trader_db_with_sbp)
+        assert user_trader_db_with_sbp.balance == trader_balance_before + int(
+            blockchain_transaction_db.amount
+            - blockchain_transaction_db.amount * constants.PLATFORM_PAY_IN_COMMISSION
+        )
+
+    async def test_ambiguous_pay_in_not_confirmed_by_deposit_watcher(
+        self,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        user_merchant_db: UserModel,
+        blockchain_transaction_db: BlockchainTransactionModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        # Два пользователя ожидают пополнение на один кошелек на одну сумму
+        blockchain_transaction_db.to_address = wallet_db.address
+        other_transaction_db = BlockchainTransactionModel(
+            user_id=user_merchant_db.id,
+            to_address=wallet_db.address,
+            amount=blockchain_transaction_db.amount,
+            type=TransactionTypeEnum.PAY_IN,
+        )
+        session.add(other_transaction_db)
+        session.add(
+            BlockchainCursorModel(
+                name=blockchain_constants.DEPOSIT_WATCHER_CURSOR_NAME,
+                block_number=0,
+            )
+        )
+        await session.commit()
+
+        block_hash = "b" * 64
+        fake_tron_rpc.blocks[block_hash] = int(faker.date_time().timestamp())
+        fake_tron_rpc.block_hashes = {
+            1: block_hash,
+            1 + constants.TRON_DEPOSIT_CONFIRMATIONS: "f" * 64,
+        }
+        fake_tron_rpc.transactions = {
+            "1" * 64: {
+                "from": "0" * 42,
+                "to": wallet_db.address,
+                "value": blockchain_transaction_db.amount,
+                "blockHash": block_hash,
+            },
+        }
+
+        assert await DepositWatcherService.process_next_blocks(session=session) == 1
+
+        # Перевод не зачислен, пополнения подтверждаются вручную по хэшу
+        for transaction_db in (blockchain_transaction_db, other_transaction_db):
+            await session.refresh(transaction_db)
+            assert transaction_db.status == TransactionStatusEnum.PENDING
+            assert transaction_db.hash is None
+
     async def test_confirm_pay_in_expired(
         self,
         router_client: httpx.AsyncClient,
@@ -286,6 +678,99 @@ class TestUserRouter(BaseTestRouter):
         assert transaction_db.to_address == to_address
         assert transaction_db.from_address == wallet_db.address
 
+    async def test_request_pay_out_with_tron_rpc_batch(
+        self,
+        router_client: httpx.AsyncClient,
+        trader_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        wallet_db: WalletModel,
+        fake_tron_rpc: FakeTronRPCServer,
+    ):
+        user_trader_db_with_sbp.balance = 200
+        amount = 100
+        fake_tron_rpc.balances[wallet_db.address] = amount * 2
+        for i in range(2):
+            wallet = WalletModel(address=str(i) * 42, private_key="*" * 66)
+            session.add(wallet)
+            fake_tron_rpc.balances[wallet.address] = amount
+        await session.commit()
+
+        response = await router_client.patch(
+            "/users/request-pay-out",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+            json=pay_schemas.RequestPayOutSchema(
+                amount=amount,
+                to_address="0" * 42,
+            ).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        schema = pay_schemas.ResponsePayOutSchema.model_validate(response.json())
+        transaction_db = await BlockchainTransactionRepository.get_one_or_none(
+            session=session,
+            id=schema.transaction_id,
+        )
+        assert transaction_db is not None
+        assert transaction_db.from_address == wallet_db.address
+
+        # Балансы всех кошельков получены одним пакетным запросом
+        assert fake_tron_rpc.requests_count == 1
+        assert fake_tron_rpc.calls_count == 3
+
+    async def test_request_pay_out_from_wallet_balance_cache(
+        self,
+        router_client: httpx.AsyncClient,
+        trader_jwt_tokens: auth_schemas.JWTGetSchema,
+        session: AsyncSession,
+        user_trader_db_with_sbp: UserModel,
+        wallet_db: WalletModel,
+        mocker,
+    ):
+        user_trader_db_with_sbp.balance = 200
+        await session.commit()
+        amount = 100
+
+        mocker.patch(
+            "src.libs.services.redis_service.RedisService.get_sorted_set",
+            return_value=[("1" * 42, float(amount)), (wallet_db.address, 300.0)],
+        )
+        incr_sorted_set = mocker.patch(
+            "src.libs.services.redis_service.RedisService.incr_sorted_set",
+            return_value=None,
+        )
+        get_wallets_balances = mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.get_wallets_balances",
+        )
+
+        response = await router_client.patch(
+            "/users/request-pay-out",
+            headers={constants.AUTH_HEADER_NAME: trader_jwt_tokens.access_token},
+            json=pay_schemas.RequestPayOutSchema(
+                amount=amount,
+                to_address="0" * 42,
+            ).model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        schema = pay_schemas.ResponsePayOutSchema.model_validate(response.json())
+        transaction_db = await BlockchainTransactionRepository.get_one_or_none(
+            session=session,
+            id=schema.transaction_id,
+        )
+        assert transaction_db is not None
+        assert transaction_db.from_address == wallet_db.address
+
+        # Кошелек выбран по кэшу без запросов к блокчейну
+        get_wallets_balances.assert_not_called()
+        incr_sorted_set.assert_called_once_with(
+            key=constants.WALLET_BALANCES_KEY,
+            member=wallet_db.address,
+            amount=-amount,
+        )
+
     async def test_request_pay_out_not_enough_balance(
         self,
         router_client: httpx.AsyncClient,
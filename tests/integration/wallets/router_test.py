@@ -26,6 +26,14 @@ class TestWalletsRouter(BaseTestRouter):
             "src.apps.blockchain.services.tron_service.TronService.does_wallet_exist",
             return_value=True,
         )
+        mocker.patch(
+            "src.apps.blockchain.services.tron_service.TronService.get_wallets_balances",
+            return_value={wallet_create_data.address: 500},
+        )
+        add_to_sorted_set = mocker.patch(
+            "src.libs.services.redis_service.RedisService.add_to_sorted_set",
+            return_value=None,
+        )
 
         response = await router_client.post(
             "/wallets",
@@ -39,6 +47,13 @@ class TestWalletsRouter(BaseTestRouter):
 
         assert schema.address == wallet_create_data.address
 
+        # Новый кошелек сразу доступен для выбора из кэша балансов
+        add_to_sorted_set.assert_called_once_with(
+            key=constants.WALLET_BALANCES_KEY,
+            member=wallet_create_data.address,
+            score=500,
+        )
+
     # MARK: Get
     async def test_get_wallet_by_address(
         self,